@@ -11,6 +11,7 @@ from colorama import init, Fore, Style
 sys.path.insert(0, str(Path(__file__).parent))
 
 from src.application.services.publishing_service import PublishingService
+from src.infrastructure.config.config import config
 
 # Initialize colorama
 init(autoreset=True)
@@ -59,6 +60,9 @@ def main():
     """Main CLI function"""
     print_banner()
 
+    # --resume: continue the last unfinished Confluence publish of the API (checkpoint journal)
+    resume = '--resume' in sys.argv[1:]
+
     # Get OpenAPI specification URL
     print(f"{Fore.CYAN}>>> Step 1: OpenAPI Specification{Style.RESET_ALL}")
     print(f"{Fore.YELLOW}ℹ️  Examples:{Style.RESET_ALL}")
@@ -100,15 +104,18 @@ def main():
         print("Available modes:")
         print("  1. Preview - Generate Confluence-like HTML locally")
         print("  2. Publish - Send to real Confluence server (requires config)")
+        print("  3. Dry run - Plan a Confluence publish without writing (requires config)")
         print()
-        mode_choice = get_user_input("Select mode (1-2)", default="1")
+        mode_choice = get_user_input("Select mode (1-3)", default="1")
 
         # Map choice to mode
         mode_map = {
             "1": "preview",
             "2": "publish",
+            "3": "dry-run",
             "preview": "preview",
-            "publish": "publish"
+            "publish": "publish",
+            "dry-run": "dry-run"
         }
         publish_mode = mode_map.get(mode_choice.lower(), "preview")
         print()
@@ -119,6 +126,8 @@ def main():
     print_info(f"Publisher: {publisher}")
     if publisher.lower() == "confluence":
         print_info(f"Mode: {publish_mode.upper()}")
+        if resume and publish_mode == "publish":
+            print_info("Resuming the last unfinished publish run")
     print(f"{Fore.CYAN}{'=' * 60}{Style.RESET_ALL}\n")
 
     # Process
@@ -143,9 +152,27 @@ def main():
             print(f"   Tags: {', '.join(api_info['tags'])}")
         print()
 
+        # Progressive preview: open the browser as soon as the shell is written,
+        # endpoint pages show up while they are still being generated
+        opened_early = False
+        on_preview_ready = None
+        if publish_mode == "preview" and config.preview_progressive:
+            open_browser = get_user_input("Open preview in browser as soon as it is ready? (y/n)", default="y")
+            if open_browser.lower() in ['y', 'yes', '']:
+                def on_preview_ready(html_path):
+                    nonlocal opened_early
+                    opened_early = True
+                    print_info(f"Opening {html_path} (pages keep loading while they are generated)...")
+                    webbrowser.open(f'file://{html_path}')
+            print()
+
         # Publish
         print_info("Generating documentation...")
-        result = service.publish_documentation(spec_url, publisher, mode=publish_mode)
+        dry_run = publish_mode == "dry-run"
+        result = service.publish_documentation(
+            spec_url, publisher, mode="publish" if dry_run else publish_mode,
+            on_preview_ready=on_preview_ready, dry_run=dry_run, resume=resume
+        )
 
         if not result.success:
             print_error("Publishing failed!")
@@ -159,6 +186,12 @@ def main():
         if publisher.lower() == "confluence" and publish_mode == "preview":
             print_success("Confluence Preview generated successfully!")
             print(f"{Fore.CYAN}   This preview simulates multi-page Confluence structure{Style.RESET_ALL}")
+        elif dry_run:
+            plan = result.metadata['plan']
+            print_success("Publish plan computed - nothing was written to Confluence")
+            print(f"{Fore.CYAN}   {plan['create']} create, {plan['update']} update, {plan['move']} move, "
+                  f"{plan['skip']} skip, {plan['delete']} delete "
+                  f"(~{result.metadata['estimated_seconds']:.1f}s){Style.RESET_ALL}")
         else:
             print_success("Documentation generated successfully!")
         print(f"{Fore.GREEN}{'=' * 60}{Style.RESET_ALL}\n")
@@ -169,6 +202,8 @@ def main():
 
         print()
         print(f"{Fore.CYAN}[Processing time: {result.duration_seconds:.2f}s]{Style.RESET_ALL}")
+        if opened_early:
+            print(f"{Fore.CYAN}[Preview opened after: {result.metadata['shell_seconds']:.2f}s]{Style.RESET_ALL}")
 
         if result.warnings:
             print()
@@ -176,7 +211,7 @@ def main():
                 print_warning(warning)
 
         # Open in browser
-        if 'html' in result.output_paths:
+        if 'html' in result.output_paths and not opened_early:
             print()
             open_browser = get_user_input("Open preview in browser? (y/n)", default="y")
             if open_browser.lower() in ['y', 'yes', '']:
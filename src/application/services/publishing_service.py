@@ -2,6 +2,7 @@
 PublishingService - Main orchestration service
 """
 from pathlib import Path
+from typing import Callable, Optional
 from src.domain.core.rendering.dtos.render_options_dto import RenderOptionsDTO
 from src.domain.core.publishing import PublishTargetDTO
 from src.domain.core.publishing import PublishResultDTO
@@ -9,20 +10,25 @@ from src.domain.core.parsing.parsers import ParserFactory
 from src.domain.utils.domain_mapper_utils import DomainMapperUtils
 from src.domain.core.rendering.renderers.html_renderer import HtmlRenderer
 from src.domain.core.publishing.publishers.publisher_factory import PublisherFactory
+from src.domain.utils.fragment_cache_utils import FragmentCacheUtils
+from src.infrastructure.config.config import config
 
 
 class PublishingService:
     """Main service to orchestrate the publishing process"""
 
     def __init__(self):
-        self.html_renderer = HtmlRenderer()
+        self.html_renderer = HtmlRenderer(fragment_cache=FragmentCacheUtils.from_config(config))
 
     def publish_documentation(
         self,
         source_url: str,
         publisher_type: str = 'confluence',
         output_dir: str = None,
-        mode: str = 'preview'
+        mode: str = 'preview',
+        on_preview_ready: Optional[Callable[[str], None]] = None,
+        dry_run: bool = False,
+        resume: bool = False
     ) -> PublishResultDTO:
         """
         Main method to publish API documentation
@@ -32,6 +38,12 @@ class PublishingService:
             publisher_type: Type of publisher (default: confluence)
             output_dir: Output directory (default: output/publisher/{publisher_type})
             mode: 'preview' for local preview or 'publish' for real publication
+            on_preview_ready: Called with the index.html path as soon as the preview
+                shell is written (progressive preview: pages keep streaming in)
+            dry_run: Publish mode only - compute the publish plan (creates, updates,
+                moves, skips, deletes) without writing to Confluence
+            resume: Publish mode only - replay the checkpoint journal of the last
+                unfinished run and continue from its first incomplete page
 
         Returns:
             PublishResultDTO: Result of publishing
@@ -45,10 +57,16 @@ class PublishingService:
             api_spec = DomainMapperUtils.to_domain(parsed_spec)
 
             # 3. Render HTML
-            render_options = RenderOptionsDTO(
+            render_options = RenderOptionsDTO.from_preset(
+                config.render_preset,  # Full or skeleton (CI smoke runs)
                 theme='light',
                 responsive=True,
-                include_examples=True
+                schema_mode=config.schema_mode,  # Shared: schemas rendered once, endpoints link
+                layout=config.preview_layout,  # Large APIs get the multi-page preview
+                asset_mode=config.preview_assets,  # External: minified, content-hashed CSS/JS
+                progressive=(mode == 'preview' and config.preview_progressive),  # Shell first, pages stream in
+                streaming=(mode == 'preview'),  # Preview HTML is streamed straight to disk
+                emit_html=(mode == 'preview')  # Publish mode emits storage format from the document view only
             )
             rendered_doc = self.html_renderer.render(api_spec, render_options)
 
@@ -75,7 +93,9 @@ class PublishingService:
             )
 
             # 5. Publish
-            publisher = PublisherFactory.get_publisher(publisher_type, mode)
+            publisher = PublisherFactory.get_publisher(
+                publisher_type, mode, on_preview_ready=on_preview_ready, dry_run=dry_run, resume=resume
+            )
             result = publisher.publish(rendered_doc, target)
 
             return result
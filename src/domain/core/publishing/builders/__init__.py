@@ -0,0 +1,5 @@
+"""Publishing builders"""
+from src.domain.core.publishing.builders.page_split_builder import PageSplitBuilder
+from src.domain.core.publishing.builders.publish_plan_builder import PublishPlanBuilder
+
+__all__ = ['PageSplitBuilder', 'PublishPlanBuilder']
@@ -0,0 +1,166 @@
+"""
+PageSplitBuilder - Size-aware planning of endpoint pages under a byte budget
+"""
+from typing import Callable, List, Sequence
+from jinja2 import Environment
+from src.domain.core.publishing.dtos.page_plan_dto import EndpointPagePlanDTO, PagePartDTO
+from src.domain.core.rendering.dtos.endpoint_view_dto import EndpointViewDTO
+
+SCHEMA_PANEL_TEMPLATE = 'schema_panel.html.j2'
+EXAMPLE_BLOCK_TEMPLATE = 'example_block.html.j2'
+PART_TEMPLATE = 'endpoint_part.html.j2'
+
+
+class PageSplitBuilder:
+    """
+    Keeps endpoint page bodies under a byte budget
+
+    Large storage-format bodies are slow to send, store and render in
+    Confluence, and the REST API rejects them past its request size limit.
+    When an endpoint page exceeds the budget its heaviest sections move to
+    child pages, in this order, stopping as soon as the page fits:
+
+    1. Complete Schema Reference - schema panels packed into "Schemas" pages
+    2. Request/response examples and cURL - packed into "Examples" pages
+
+    The endpoint page keeps links to its parts. A single block larger than
+    the budget gets a page of its own (it cannot be split further).
+    """
+
+    def __init__(self, env: Environment, max_bytes: int, schema_table=None):
+        """Initialize with the server template environment, the budget (0 disables) and the run's schema table memo"""
+        self.env = env
+        self.max_bytes = max_bytes
+        self.schema_table = schema_table
+        self.pages_split = 0
+        self.parts_created = 0
+
+    @staticmethod
+    def size_of(content: str) -> int:
+        """Body size in bytes (UTF-8, as sent in the request)"""
+        return len(content.encode('utf-8'))
+
+    def build(
+        self,
+        endpoint: EndpointViewDTO,
+        title: str,
+        content: str,
+        render_page: Callable[..., str]
+    ) -> EndpointPagePlanDTO:
+        """
+        Plan the pages of one endpoint
+
+        Args:
+            endpoint: Endpoint view
+            title: Endpoint page title (child titles derive from it)
+            content: Full endpoint page body
+            render_page: Re-renders the endpoint page with extra template
+                variables (schema_pages / example_pages)
+
+        Returns:
+            EndpointPagePlanDTO: Page body and its child pages
+        """
+        if not self.max_bytes or self.size_of(content) <= self.max_bytes:
+            return EndpointPagePlanDTO(title=title, content=content)
+
+        parts: List[PagePartDTO] = []
+        page_vars = {}
+
+        # 1. Schema reference (inline schema mode only - shared mode already links out)
+        if endpoint.schemas and not endpoint.shared_schemas:
+            blocks = [self._render_schema_panel(schema) for schema in endpoint.schemas]
+            schema_parts = self._pack(title, 'Schemas', 'schemas', blocks)
+            parts.extend(schema_parts)
+            page_vars['schema_pages'] = [part.title for part in schema_parts]
+            content = render_page(**page_vars)
+
+        # 2. Examples and cURL
+        if self.size_of(content) > self.max_bytes:
+            blocks = self._render_example_blocks(endpoint)
+            if blocks:
+                example_parts = self._pack(title, 'Examples', 'examples', blocks)
+                parts.extend(example_parts)
+                page_vars['example_pages'] = [part.title for part in example_parts]
+                content = render_page(**page_vars)
+
+        if parts:
+            self.pages_split += 1
+            self.parts_created += len(parts)
+        return EndpointPagePlanDTO(title=title, content=content, parts=parts)
+
+    def stats(self) -> dict:
+        """Split counters for reporting"""
+        return {
+            'pages_split': self.pages_split,
+            'parts_created': self.parts_created,
+            'max_bytes': self.max_bytes
+        }
+
+    def _pack(self, parent_title: str, heading: str, kind: str, blocks: Sequence[str]) -> List[PagePartDTO]:
+        """Greedily pack blocks, in order, into as few child pages as the budget allows"""
+        # Room left for the part page header (heading, link back to the parent)
+        overhead = self.size_of(self._render_part(parent_title, heading, 99, 99, []))
+        budget = max(self.max_bytes - overhead, 1)
+
+        chunks: List[List[str]] = []
+        current: List[str] = []
+        current_size = 0
+        for block in blocks:
+            size = self.size_of(block)
+            if current and current_size + size > budget:
+                chunks.append(current)
+                current, current_size = [], 0
+            current.append(block)
+            current_size += size
+        if current:
+            chunks.append(current)
+
+        parts = []
+        for number, chunk in enumerate(chunks, 1):
+            part_title = f"{parent_title} - {heading}"
+            if len(chunks) > 1:
+                part_title = f"{part_title} ({number}/{len(chunks)})"
+            parts.append(PagePartDTO(
+                title=part_title,
+                content=self._render_part(parent_title, heading, number, len(chunks), chunk),
+                kind=kind
+            ))
+        return parts
+
+    def _render_part(self, parent_title: str, heading: str, number: int, count: int, blocks: Sequence[str]) -> str:
+        """Render a child page body"""
+        return self.env.get_template(PART_TEMPLATE).render(
+            heading=heading,
+            parent_title=parent_title,
+            part_number=number,
+            part_count=count,
+            blocks=blocks
+        )
+
+    def _render_schema_panel(self, schema) -> str:
+        """Render one panel of the Complete Schema Reference"""
+        return self.env.get_template(SCHEMA_PANEL_TEMPLATE).render(schema=schema, schema_table=self.schema_table)
+
+    def _render_example_blocks(self, endpoint: EndpointViewDTO) -> List[str]:
+        """Render every request/response example and the cURL command as separate blocks"""
+        template = self.env.get_template(EXAMPLE_BLOCK_TEMPLATE)
+        blocks = []
+        if endpoint.request_body:
+            for example in endpoint.request_body.examples:
+                if not example.is_empty:
+                    blocks.append(template.render(
+                        heading=f"Request Example ({example.content_type})",
+                        language='json', body=example.json, endpoint=endpoint
+                    ))
+        for response in endpoint.responses:
+            for example in response.examples:
+                if not example.is_empty:
+                    blocks.append(template.render(
+                        heading=f"Response {response.status} Example ({example.content_type})",
+                        language='json', body=example.json, endpoint=endpoint
+                    ))
+        if endpoint.curl:
+            blocks.append(template.render(
+                heading='cURL Example', language='bash', body=endpoint.curl, endpoint=endpoint
+            ))
+        return blocks
@@ -0,0 +1,100 @@
+"""
+PublishPlanBuilder - Offline plan of a publish from the page tree and the known remote state
+"""
+from typing import Callable, Dict, Optional, Sequence, Set
+from src.domain.core.publishing.dtos.page_node_dto import PageNodeDTO
+from src.domain.core.publishing.dtos.publish_plan_dto import PlannedPageDTO, PublishPlanDTO
+
+
+class PublishPlanBuilder:
+    """
+    Decides, without any request, what a publish will do with each page
+
+    Input is the rendered page tree and the page index (bulk prefetch or
+    local manifest). Walking the tree parents first:
+
+    - same title under the expected parent: skip when the content hash
+      matches, update otherwise
+    - same title elsewhere (not claimed by another node): move
+    - unknown title: create
+    - known pages no node claims: delete (orphans of removed endpoints/tags)
+
+    The executor runs the plan as computed, so the numbers are the bill.
+    """
+
+    # Write requests per action (page body + content hash property)
+    REQUESTS = {'create': 1, 'update': 2, 'move': 2, 'skip': 0, 'delete': 1}
+
+    def __init__(self, page_index, content_hash: Callable[[str], str]):
+        """Initialize with the page index and the content hash function of the publisher"""
+        self.page_index = page_index
+        self.content_hash = content_hash
+
+    def build(self, nodes: Sequence[PageNodeDTO], root_parent_id: Optional[str]) -> PublishPlanDTO:
+        """
+        Plan every node
+
+        Args:
+            nodes: Page tree in document order (parents first)
+            root_parent_id: Parent page id of the top-level nodes
+
+        Returns:
+            PublishPlanDTO: Actions with byte and request counts
+        """
+        plan = PublishPlanDTO()
+        page_ids: Dict[str, Optional[str]] = {}  # Node key -> existing page id (None: created by this run)
+        claimed: Set[str] = set()
+        # A partial index (local manifest) cannot rule out a page it does not know
+        create_requests = self.REQUESTS['create'] + (0 if self.page_index.complete else 1)
+
+        for node in nodes:
+            if node.parent_key is None:
+                parent_id = root_parent_id
+                parent_known = True
+            else:
+                parent_id = page_ids.get(node.parent_key)
+                parent_known = parent_id is not None
+
+            existing = self.page_index.peek(node.title, parent_id) if parent_known else None
+            if existing is not None and existing['id'] in claimed:
+                existing = None
+            action = 'update'
+            if existing is None:
+                elsewhere = self.page_index.peek_title(node.title)
+                if elsewhere is not None and elsewhere['id'] not in claimed:
+                    existing, action = elsewhere, 'move'
+
+            content_hash = self.content_hash(node.content)
+            if existing is None:
+                action = 'create'
+            elif action == 'update' and existing.get('content_hash') == content_hash:
+                action = 'skip'
+
+            if existing is not None:
+                claimed.add(existing['id'])
+            page_ids[node.key] = existing['id'] if existing is not None else None
+
+            plan.pages.append(PlannedPageDTO(
+                key=node.key,
+                title=node.title,
+                action=action,
+                bytes=0 if action == 'skip' else len(node.content.encode('utf-8')),
+                requests=create_requests if action == 'create' else self.REQUESTS[action],
+                page_id=existing['id'] if existing is not None else None,
+                content_hash=content_hash,
+                existing=existing
+            ))
+
+        # Known pages published by this tool (hash property or manifest record) no node claims any more
+        for entry in self.page_index.entries():
+            managed = entry.get('hash_version') or entry.get('page_key')
+            if managed and entry['id'] not in claimed and entry['id'] != root_parent_id:
+                plan.deletes.append(PlannedPageDTO(
+                    key=entry.get('page_key') or entry['id'],
+                    title=entry['title'],
+                    action='delete',
+                    requests=self.REQUESTS['delete'],
+                    page_id=entry['id'],
+                    existing=entry
+                ))
+        return plan
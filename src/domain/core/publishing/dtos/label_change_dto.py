@@ -0,0 +1,15 @@
+"""
+LabelChange - DTO for the label difference of one Confluence page
+"""
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class LabelChangeDTO:
+    """Labels to add to and remove from one page"""
+    page_id: str
+    title: str
+    add: List[str] = field(default_factory=list)
+    remove: List[str] = field(default_factory=list)
+    applied: bool = False  # Set by LabelSynchronizer.apply once every request succeeded
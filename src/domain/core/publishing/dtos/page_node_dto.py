@@ -0,0 +1,22 @@
+"""
+PageNode - DTO for one page of the Confluence page tree
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class PageNodeDTO:
+    """
+    Rendered page waiting to be published
+
+    Nodes reference their parent by key, so the whole tree can be rendered
+    first and published afterwards (parents before children).
+    """
+    key: str  # Unique key in the publish run (also the created_pages key)
+    title: str
+    content: str
+    kind: str  # root, endpoints folder, data models, tag folder, endpoint, endpoint part
+    labels: List[str] = field(default_factory=list)
+    parent_key: Optional[str] = None  # None: under the configured parent page
+    reparent_on_failure: bool = False  # Children go under this node's parent if it fails (instead of being skipped)
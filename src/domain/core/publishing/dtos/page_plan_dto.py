@@ -0,0 +1,36 @@
+"""
+PagePlan - DTOs for the size-aware page planning of endpoint pages
+"""
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class PagePartDTO:
+    """Child page holding a section moved out of an oversized endpoint page"""
+    title: str
+    content: str
+    kind: str  # schemas or examples
+
+    @property
+    def size_bytes(self) -> int:
+        """Storage-format body size as sent to Confluence"""
+        return len(self.content.encode('utf-8'))
+
+
+@dataclass
+class EndpointPagePlanDTO:
+    """Endpoint page body plus the child pages it was split into (none when it fits the budget)"""
+    title: str
+    content: str
+    parts: List[PagePartDTO] = field(default_factory=list)
+
+    @property
+    def size_bytes(self) -> int:
+        """Storage-format body size of the endpoint page itself"""
+        return len(self.content.encode('utf-8'))
+
+    @property
+    def is_split(self) -> bool:
+        """True when sections were moved to child pages"""
+        return bool(self.parts)
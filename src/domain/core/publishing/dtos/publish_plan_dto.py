@@ -0,0 +1,80 @@
+"""
+PublishPlan - DTOs for the offline plan of a Confluence publish
+"""
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class PlannedPageDTO:
+    """What the publish will do with one page"""
+    key: str  # Page node key (or manifest/page id for deletes)
+    title: str
+    action: str  # create, update, move, skip or delete
+    bytes: int = 0  # Request payload sent for the page (0 when skipped)
+    requests: int = 0  # Write requests the action costs
+    page_id: Optional[str] = None  # Existing page (update, move, skip, delete)
+    content_hash: Optional[str] = None
+    existing: Optional[Dict] = None  # Page index entry the action applies to
+
+
+@dataclass
+class PublishPlanDTO:
+    """Creates, updates, moves, skips and deletes of a publish, with byte and request counts"""
+    pages: List[PlannedPageDTO] = field(default_factory=list)  # Published page set, in node order
+    deletes: List[PlannedPageDTO] = field(default_factory=list)  # Existing pages no longer published (orphans)
+
+    ACTIONS = ('create', 'update', 'move', 'skip', 'delete')
+
+    @property
+    def by_key(self) -> Dict[str, PlannedPageDTO]:
+        """Planned pages by node key"""
+        return {page.key: page for page in self.pages}
+
+    def count(self, action: str) -> int:
+        """Number of pages with an action"""
+        if action == 'delete':
+            return len(self.deletes)
+        return sum(1 for page in self.pages if page.action == action)
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes sent by the page writes"""
+        return sum(page.bytes for page in self.pages)
+
+    @property
+    def total_requests(self) -> int:
+        """Write requests of the published page set (deletes are executed by the orphan cleanup)"""
+        return sum(page.requests for page in self.pages)
+
+    def estimate_seconds(self, workers: int, request_seconds: float, max_rate: float = 0) -> float:
+        """Rough duration of the writes with a number of concurrent workers (and a requests/second limit)"""
+        estimate = math.ceil(self.total_requests / max(workers, 1)) * request_seconds
+        if max_rate > 0:
+            estimate = max(estimate, self.total_requests / max_rate)
+        return estimate
+
+    def summary(self) -> Dict[str, int]:
+        """Counts per action plus totals"""
+        summary = {action: self.count(action) for action in self.ACTIONS}
+        summary['bytes'] = self.total_bytes
+        summary['requests'] = self.total_requests
+        return summary
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable plan (for review before publishing)"""
+        def page_dict(page: PlannedPageDTO) -> Dict:
+            return {
+                'key': page.key,
+                'title': page.title,
+                'action': page.action,
+                'bytes': page.bytes,
+                'requests': page.requests,
+                'page_id': page.page_id
+            }
+        return {
+            'summary': self.summary(),
+            'pages': [page_dict(page) for page in self.pages],
+            'deletes': [page_dict(page) for page in self.deletes]
+        }
@@ -1,17 +1,40 @@
 """
 ConfluencePreviewPublisher - Saves documentation locally as preview
 """
+import os
 from pathlib import Path
 from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Sequence
 from src.domain.core.publishing.contracts.publisher_contract import PublisherContract
 from src.domain.core.rendering.dtos.rendered_document_dto import RenderedDocumentDTO
 from src.domain.core.publishing.dtos.publish_target_dto import PublishTargetDTO
 from src.domain.core.publishing.dtos.publish_result_dto import PublishResultDTO
+from src.domain.utils.asset_utils import AssetUtils
+from src.infrastructure.config.config import config
 
 
 class ConfluencePreviewPublisher(PublisherContract):
     """Publisher for Confluence preview (local HTML generation)"""
 
+    # Write buffer for streamed HTML (Jinja yields many small chunks)
+    WRITE_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        precompress: Optional[Sequence[str]] = None,
+        on_shell_ready: Optional[Callable[[str], None]] = None
+    ):
+        """
+        Initialize publisher
+
+        Args:
+            precompress: Precompressed siblings to write (gz/br, default from config)
+            on_shell_ready: Called with the index.html path as soon as the shell
+                and its assets are written, before the endpoint pages
+        """
+        self.precompress = list(config.preview_precompress if precompress is None else precompress)
+        self.on_shell_ready = on_shell_ready
+
     def publish(self, document: RenderedDocumentDTO, target: PublishTargetDTO) -> PublishResultDTO:
         """
         Save documentation locally as HTML preview
@@ -28,15 +51,48 @@ class ConfluencePreviewPublisher(PublisherContract):
         warnings = []
 
         try:
+            if not document.has_html:
+                raise ValueError("Preview requires rendered HTML (render with emit_html=True)")
+
             # Create output directory
             output_dir = Path(target.output_path)
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Save HTML
+            written: List[Path] = []  # Text outputs (precompressed at the end)
+            for encoding in self.precompress:
+                if not AssetUtils.supports(encoding):
+                    warnings.append(f"Precompression '{encoding}' is not available - skipped")
+
+            # Save assets first (the shell references them)
+            if document.assets:
+                assets_dir = output_dir / "assets"
+                assets_dir.mkdir(exist_ok=True)
+                for asset_name, asset_content in document.assets.items():
+                    asset_path = assets_dir / asset_name
+                    with open(asset_path, 'w', encoding='utf-8') as f:
+                        f.write(asset_content)
+                    written.append(asset_path)
+
+            # Save HTML (streamed chunk by chunk, then atomically renamed)
             html_path = output_dir / "index.html"
-            with open(html_path, 'w', encoding='utf-8') as f:
-                f.write(document.html_content)
+            self._write_atomic(html_path, document.iter_html())
             output_paths['html'] = str(html_path.absolute())
+            written.append(html_path)
+
+            # The shell and its assets are complete: it can be opened while pages are still written
+            shell_seconds = (datetime.now() - start_time).total_seconds()
+            if self.on_shell_ready is not None:
+                self.on_shell_ready(output_paths['html'])
+
+            # Save on-demand pages (multipage layout) as they are rendered
+            # (progressive preview: the search index asset comes last, after the pages)
+            if document.pages is not None:
+                for relative_path, content in document.pages:
+                    page_path = output_dir / relative_path
+                    page_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._write_atomic(page_path, (content,))
+                    output_paths.setdefault('pages', str(page_path.parent.absolute()))
+                    written.append(page_path)
 
             # Save XML if available
             if document.xml_content:
@@ -51,27 +107,34 @@ class ConfluencePreviewPublisher(PublisherContract):
                 with open(css_path, 'w', encoding='utf-8') as f:
                     f.write(document.css_content)
                 output_paths['css'] = str(css_path.absolute())
+                written.append(css_path)
 
-            # Save assets
-            if document.assets:
-                assets_dir = output_dir / "assets"
-                assets_dir.mkdir(exist_ok=True)
-                for asset_name, asset_content in document.assets.items():
-                    asset_path = assets_dir / asset_name
-                    with open(asset_path, 'w', encoding='utf-8') as f:
-                        f.write(asset_content)
+            # Precompressed siblings (index.html.gz, ...) for static hosting
+            precompressed = 0
+            if self.precompress:
+                for path in written:
+                    precompressed += len(AssetUtils.precompress(path, self.precompress))
 
             duration = (datetime.now() - start_time).total_seconds()
 
+            metadata = {
+                'publisher': 'confluence',
+                'mode': 'local_preview',
+                'title': document.metadata.get('title', 'API Documentation')
+            }
+            # Schema table memoization counters (final once the document is written)
+            schema_tables = document.metadata.get('schema_tables')
+            if schema_tables is not None:
+                metadata['schema_tables'] = schema_tables.stats()
+            if precompressed:
+                metadata['precompressed_files'] = precompressed
+            metadata['shell_seconds'] = shell_seconds
+
             return PublishResultDTO(
                 success=True,
                 output_paths=output_paths,
                 warnings=warnings,
-                metadata={
-                    'publisher': 'confluence',
-                    'mode': 'local_preview',
-                    'title': document.metadata.get('title', 'API Documentation')
-                },
+                metadata=metadata,
                 duration_seconds=duration
             )
 
@@ -84,6 +147,24 @@ class ConfluencePreviewPublisher(PublisherContract):
                 duration_seconds=duration
             )
 
+    def _write_atomic(self, path: Path, chunks: Iterable[str]):
+        """
+        Write chunks to a temporary file and rename it over the target
+
+        Readers never see a half-written file, and a failed render leaves
+        the previous file untouched.
+        """
+        tmp_path = path.with_name(path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
     def get_publisher_type(self) -> str:
         """Get publisher type"""
         return "confluence-preview"
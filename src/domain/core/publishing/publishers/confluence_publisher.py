@@ -2,24 +2,61 @@
 ConfluencePublisher - Publishes to real Confluence server via REST API
 """
 import requests
+import hashlib
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
 from src.domain.core.publishing.contracts.publisher_contract import PublisherContract
 from src.domain.core.rendering.dtos.rendered_document_dto import RenderedDocumentDTO
 from src.domain.core.publishing.dtos.publish_target_dto import PublishTargetDTO
 from src.domain.core.publishing.dtos.publish_result_dto import PublishResultDTO
+from src.domain.core.publishing.dtos.page_plan_dto import EndpointPagePlanDTO
+from src.domain.core.publishing.dtos.page_node_dto import PageNodeDTO
+from src.domain.core.publishing.dtos.publish_plan_dto import PublishPlanDTO
+from src.domain.core.publishing.dtos.label_change_dto import LabelChangeDTO
+from src.domain.core.publishing.builders.publish_plan_builder import PublishPlanBuilder
+from src.domain.core.publishing.publishers.page_tree_scheduler import PageTreeScheduler
+from src.domain.core.publishing.publishers.orphan_cleaner import OrphanCleaner
+from src.domain.core.publishing.publishers.label_synchronizer import LabelSynchronizer
+from src.domain.core.publishing.publishers.page_tree_index import PageTreeIndex
+from src.domain.core.publishing.builders.page_split_builder import PageSplitBuilder
 from src.infrastructure.config.config import config
-from src.domain.utils.example_generator_utils import ExampleGeneratorUtils
+from src.domain.core.rendering.builders.endpoint_view_builder import EndpointViewBuilder
+from src.domain.core.rendering.dtos.endpoint_view_dto import EndpointViewDTO
+from src.domain.core.rendering.renderers.schema_table_renderer import SchemaTableRenderer
+from src.domain.utils.fragment_cache_utils import FragmentCacheUtils
+from src.domain.utils.http_session_utils import HttpSessionUtils
+from src.domain.utils.rate_limiter_utils import RateLimiterUtils
+from src.domain.utils.publish_manifest_utils import PublishManifestUtils
+from src.domain.utils.publish_journal_utils import PublishJournalUtils
 
 
 class ConfluencePublisher(PublisherContract):
     """Publisher that creates real pages in Confluence"""
 
-    def __init__(self):
-        """Initialize with Confluence configuration and Jinja2 templates"""
+    # Results per request of the bulk descendant query (CQL search)
+    DESCENDANTS_PAGE_SIZE = 200
+    # Page ids per version check of the local manifest (CQL id in (...))
+    VERIFY_BATCH_SIZE = 100
+
+    def __init__(self, dry_run: bool = False, resume: bool = False):
+        """
+        Initialize with Confluence configuration and Jinja2 templates
+
+        Args:
+            dry_run: Plan the publish (creates/updates/moves/skips/deletes with byte
+                counts) without writing anything to Confluence
+            resume: Replay the checkpoint journal of the last unfinished run of the
+                API and continue from its first incomplete page
+        """
+        self.dry_run = dry_run
+        self.resume = resume
         self.base_url = config.confluence_base_url
         self.username = config.confluence_username
         self.token = config.confluence_token
@@ -43,6 +80,51 @@ class ConfluencePublisher(PublisherContract):
             'Accept': 'application/json'
         }
 
+        # Shared keep-alive session: one pooled connection serves many page requests,
+        # paced by one rate limiter for all workers (429/503 aware, circuit breaker)
+        self.rate_limiter = RateLimiterUtils.from_config(config)
+        self.session = HttpSessionUtils.create_session(
+            pool_size=config.confluence_pool_size,
+            keep_alive=config.confluence_keep_alive,
+            retries=config.confluence_retries,
+            backoff=config.confluence_retry_backoff,
+            headers=self.headers,
+            rate_limiter=self.rate_limiter
+        )
+
+        # Siblings are published concurrently once their parent exists
+        self.scheduler = PageTreeScheduler(config.confluence_publish_workers)
+
+        # Labels are synchronized after the page writes (only the differences)
+        self.label_sync = LabelSynchronizer(self.session, self.api_url, config.confluence_publish_workers)
+
+        # Pages of endpoints/tags removed from the spec - reported, archived or deleted after publishing
+        self.orphan_cleaner = OrphanCleaner(
+            self.session,
+            self.api_url,
+            action=config.confluence_orphans,
+            max_pages=config.confluence_orphan_max,
+            max_workers=config.confluence_publish_workers
+        )
+
+        # Existing pages under the API root, prefetched once per publish run
+        self.page_index: Optional[PageTreeIndex] = None
+
+        # Local record of what was published (per space/API) - replaces the tree prefetch when present
+        self.manifest = PublishManifestUtils.from_config(config)
+        self.manifest_api_key: Optional[str] = None
+
+        # Checkpoint journal of each run (pages completed so far) - what --resume replays
+        self.journal = PublishJournalUtils.from_config(config)
+
+        # Plan of the current run - the executor applies it page by page
+        self.publish_plan: Optional[PublishPlanDTO] = None
+        self._planned_pages: Dict = {}
+
+        # Page writes of the current run (unchanged pages are skipped by content hash)
+        self.write_stats = {'created': 0, 'updated': 0, 'moved': 0, 'unchanged': 0}
+        self._stats_lock = threading.Lock()
+
         # Initialize Jinja2 template engine for server templates
         # __file__ = .../src/domain/core/publishing/publishers/confluence_publisher.py
         # Go up 5 levels to project root, then into src/infrastructure/...
@@ -51,6 +133,22 @@ class ConfluencePublisher(PublisherContract):
         self.jinja_env = Environment(loader=FileSystemLoader(str(templates_dir)))
         self.jinja_env.filters['tojson_pretty'] = lambda x: json.dumps(x, indent=2, ensure_ascii=False) if x else '{}'
 
+        # Persistent cache of endpoint page bodies (keyed by endpoint fingerprint)
+        self.fragment_cache = FragmentCacheUtils.from_config(config)
+        # Endpoint template and everything it includes - template edits invalidate cached bodies
+        self.endpoint_template_version = (
+            FragmentCacheUtils.template_version(self.jinja_env, 'endpoint.html.j2')
+            if self.fragment_cache is not None else ''
+        )
+
+        # Schema property tables rendered once per schema per publish run
+        self.schema_table = SchemaTableRenderer(self.jinja_env, 'schema_table.html.j2')
+
+        # Oversized endpoint pages are split into child pages under this budget
+        self.page_splitter = PageSplitBuilder(
+            self.jinja_env, config.confluence_page_max_kb * 1024, self.schema_table
+        )
+
     def publish(self, document: RenderedDocumentDTO, target: PublishTargetDTO) -> PublishResultDTO:
         """
         Publish documentation to real Confluence server with full structure
@@ -59,173 +157,138 @@ class ConfluencePublisher(PublisherContract):
         - Root page (API Overview) with rich content
         - Child pages for each tag (endpoints grouped)
         - Child page for Data Models
+
+        All page bodies are rendered first; the tree is then published
+        parents first, with the children of each created page sent
+        concurrently (CONFLUENCE_PUBLISH_WORKERS).
         """
         start_time = datetime.now()
         warnings = []
         errors = []
         created_pages = {}
+        self.schema_table.reset()
+        self.page_splitter.pages_split = self.page_splitter.parts_created = 0
+        connections_before = HttpSessionUtils.connection_stats(self.session)
+        limiter_before = self.rate_limiter.stats()
+        self.write_stats = dict.fromkeys(self.write_stats, 0)
 
         try:
-            # Extract API specification from metadata
-            api_spec = document.metadata.get('api_spec')
+            # Extract API specification from the document view (or metadata)
+            document_view = document.document_view
+            api_spec = document_view.api if document_view else document.metadata.get('api_spec')
             if not api_spec:
                 errors.append("API specification not found in document metadata")
                 return self._error_result(errors, start_time)
 
-            api_title = target.title or api_spec.info.title
-            api_version = api_spec.info.version
-
-            # Extract major.minor version (e.g., "1.0.7" -> "1.0")
-            version_parts = api_version.split('.')
-            major_minor = '.'.join(version_parts[:2]) if len(version_parts) >= 2 else api_version
-
             print(f"🚀 Publishing to Confluence: {self.space_key}")
             print(f"📍 Base URL: {self.base_url}")
 
-            # 1. Create or update root page with rich content
-            # Check if title already contains "API" or version
-            root_title = api_title
-            if " API" not in root_title.upper():
-                root_title = f"{root_title} API"
-            if major_minor not in root_title:
-                root_title = f"{root_title} {major_minor}"
-
-            print(f"\n📄 Creating root page: {root_title}...")
-            root_content = self._generate_overview_content(api_spec, root_title)
-            root_page = self._create_or_update_page(
-                title=root_title,
-                content=root_content,
-                parent_id=self.parent_page_id,
-                labels=target.labels or []
+            # 1. Render every page of the tree (root, folders, models, tags, endpoints)
+            nodes, generated_contents = self._build_page_tree(api_spec, document_view, target)
+            endpoint_total = sum(1 for node in nodes if node.kind == 'endpoint')
+            print(f"\n🧱 Rendered {len(nodes)} pages ({endpoint_total} endpoints)")
+
+            # 2. Existing pages: local manifest (verified in bulk) or one bulk query for the tree,
+            #    plus the pages a resumed run already completed (search may not list them yet)
+            self.manifest_api_key = nodes[0].title
+            replayed = self._start_journal(nodes)
+            lookup_start = time.perf_counter()
+            self.page_index = self._prefetch_page_tree(nodes[0].title)
+            request_seconds = (time.perf_counter() - lookup_start) / max(self.page_index.requests, 1)
+            self._replay_journal(replayed)
+
+            # 3. Plan offline: creates, updates, moves, skips and deletes with byte counts
+            self.publish_plan = PublishPlanBuilder(self.page_index, self._content_hash).build(
+                nodes, self.parent_page_id
             )
+            self._planned_pages = self.publish_plan.by_key
+            self._print_plan(self.publish_plan, request_seconds)
+
+            if self.dry_run:
+                return self._dry_run_result(api_spec, target, nodes, generated_contents, start_time, request_seconds)
 
+            # 4. Run the plan: parents first, then the children of each created page concurrently
+            print(f"\n🔌 Publishing page tree ({self.scheduler.max_workers} workers)...")
+            results, skipped = self.scheduler.run(nodes, self._publish_node, self.parent_page_id)
+
+            root_page = results.get('root')
             if not root_page:
                 errors.append("Failed to create root page")
                 return self._error_result(errors, start_time)
 
-            root_id = root_page['id']
-            page_url = f"{self.base_url}/spaces/{self.space_key}/pages/{root_id}"
-            created_pages['root'] = page_url
-            print(f"✅ Root page created: {page_url}")
-
-            # Create unique prefix for child pages to avoid title conflicts in same space
-            # Confluence doesn't allow duplicate titles in same space, even with different parents
-            # Use API name + version as prefix: [Swagger Petstore 1.0]
-            if major_minor not in api_title:
-                api_prefix = f"[{api_title} {major_minor}]"
-            else:
-                api_prefix = f"[{api_title}]"
-
-            api_identifier = api_title  # Used only for internal references
-
-            # 2. Create "Endpoints" folder page with unique prefix
-            print(f"\n📁 Creating Endpoints folder...")
-            endpoints_folder_title = f"{api_prefix} Endpoints"
-            endpoints_folder_content = self._generate_endpoints_folder_content(api_spec)
-            endpoints_folder = self._create_or_update_page(
-                title=endpoints_folder_title,
-                content=endpoints_folder_content,
-                parent_id=root_id,
-                labels=['endpoints']
+            # Read results back in document order (completion order varies between runs)
+            skipped_keys = {node.key for node in skipped}
+            for node in nodes:
+                page = results.get(node.key)
+                if page:
+                    created_pages[node.key] = f"{self.base_url}/spaces/{self.space_key}/pages/{page['id']}"
+                elif node.key not in skipped_keys:
+                    warnings.append(f"Failed to create {node.kind}: {node.title}")
+            if skipped:
+                warnings.append(f"Skipped {len(skipped)} pages whose parent page failed")
+            self._finish_journal(complete=len(created_pages) == len(nodes))
+
+            # 5. Labels: desired vs. actual (from the bulk fetch) - only the differences are sent
+            label_stats = self._sync_labels(nodes, results, warnings)
+
+            # 6. Reconcile: pages this publisher wrote that no page of the spec claims any more
+            orphans_removed = self._clean_orphans(self.publish_plan.deletes, warnings)
+
+            endpoints_created = sum(
+                1 for node in nodes if node.kind == 'endpoint' and results.get(node.key)
             )
-
-            if not endpoints_folder:
-                warnings.append("Failed to create Endpoints folder")
-                endpoints_folder_id = root_id  # Fallback to root
-            else:
-                endpoints_folder_id = endpoints_folder['id']
-                endpoints_url = f"{self.base_url}/spaces/{self.space_key}/pages/{endpoints_folder_id}"
-                created_pages['endpoints_folder'] = endpoints_url
-                print(f"✅ Endpoints folder created")
-
-            # Initialize dictionary to collect ALL generated contents
-            generated_contents = {
-                'root': (root_title, root_content),
-                'endpoints_folder': (endpoints_folder_title, endpoints_folder_content),
-            }
-
-            # 3. Create hierarchy: Endpoints → Tag folders → Individual endpoints
-            if api_spec.tags:
-                print(f"\n🔌 Creating endpoint structure...")
-                total_endpoints = 0
-                
-                for tag in api_spec.tags:
-                    # Count endpoints for this tag first
-                    endpoint_count = sum(
-                        1 for path, path_item in api_spec.paths.items()
-                        for method, operation in path_item.operations.items()
-                        if tag.name in operation.tags
-                    )
-
-                    # Create tag folder with unique prefix
-                    tag_folder_title = f"{api_prefix} {tag.name.capitalize()}"
-                    print(f"   📁 Creating tag folder: {tag_folder_title}...")
-                    
-                    tag_folder_content = self._generate_tag_folder_content(tag, endpoint_count)
-
-                    # Save tag folder content
-                    generated_contents[f'tag_{tag.name}'] = (tag_folder_title, tag_folder_content)
-
-                    tag_folder = self._create_or_update_page(
-                        title=tag_folder_title,
-                        content=tag_folder_content,
-                        parent_id=endpoints_folder_id,
-                        labels=[tag.name.lower(), 'tag']
-                    )
-                    
-                    if not tag_folder:
-                        warnings.append(f"Failed to create tag folder: {tag_folder_title}")
-                        continue
-                    
-                    tag_folder_id = tag_folder['id']
-                    tag_folder_url = f"{self.base_url}/spaces/{self.space_key}/pages/{tag_folder_id}"
-                    created_pages[f'tag_folder_{tag.name}'] = tag_folder_url
-                    print(f"   ✅ Tag folder created: {tag_folder_title}")
-                    
-                    # Create individual endpoint pages under this tag
-                    for path, path_item in api_spec.paths.items():
-                        for method, operation in path_item.operations.items():
-                            if tag.name in operation.tags:
-                                total_endpoints += 1
-                                
-                                # Generate endpoint title with unique prefix
-                                endpoint_title = f"{api_prefix} {method.upper()} {path}"
-                                print(f"      📄 Creating: {endpoint_title}...")
-                                
-                                endpoint_content = self._generate_single_endpoint_content(
-                                    api_spec, path, method, operation, api_prefix
-                                )
-                                
-                                # Save endpoint content
-                                safe_endpoint_key = f"{tag.name}_{method}_{path}".replace('/', '_').replace('{', '').replace('}', '')
-                                generated_contents[f'endpoint_{safe_endpoint_key}'] = (endpoint_title, endpoint_content)
-
-                                endpoint_page = self._create_or_update_page(
-                                    title=endpoint_title,
-                                    content=endpoint_content,
-                                    parent_id=tag_folder_id,
-                                    labels=[tag.name.lower(), method.lower(), 'endpoint']
-                                )
-                                
-                                if endpoint_page:
-                                    endpoint_url = f"{self.base_url}/spaces/{self.space_key}/pages/{endpoint_page['id']}"
-                                    created_pages[f'endpoint_{tag.name}_{method}_{path.replace("/", "_")}'] = endpoint_url
-                                    print(f"      ✅ Created: {endpoint_title}")
-                                else:
-                                    warnings.append(f"Failed to create endpoint: {endpoint_title}")
-                    
-                    print(f"   ✅ {endpoint_count} endpoints created for {tag.name}")
-                
-                print(f"\n✅ Total: {total_endpoints} endpoint pages created")
+            print(f"\n✅ Total: {endpoints_created} endpoint pages created")
 
             # Success - No separate Data Models or Security pages
             # Everything is inline in endpoints now
+            if self.page_index is not None:
+                index_stats = self.page_index.stats()
+                print(f"🗂️  Page index: {index_stats['pages']} pages, {index_stats['misses']} looked up one by one "
+                      f"({index_stats['requests']} lookup requests)")
+
+            print(f"✍️  Pages: {self.write_stats['created']} created, {self.write_stats['updated']} updated, "
+                  f"{self.write_stats['moved']} moved, {self.write_stats['unchanged']} unchanged (skipped)")
+
+            table_stats = self.schema_table.stats()
+            print(f"🧩 Schema tables: {table_stats['misses']} rendered, {table_stats['hits']} reused")
+
+            connection_stats = {
+                name: value - connections_before[name]
+                for name, value in HttpSessionUtils.connection_stats(self.session).items()
+            }
+            print(f"🔌 HTTP: {connection_stats['requests']} requests over {connection_stats['connections']} "
+                  f"connections ({connection_stats['reused']} reused)")
+
+            limiter_stats = self.rate_limiter.stats()
+            limiter_stats.update({
+                name: limiter_stats[name] - limiter_before[name]
+                for name in ('throttled', 'retries', 'circuit_opens', 'rejected', 'waited_seconds')
+            })
+            if limiter_stats['throttled'] or limiter_stats['retries'] or limiter_stats['rejected']:
+                rate = f"{limiter_stats['rate']:.1f} req/s" if limiter_stats['max_rate'] else 'unlimited'
+                print(f"🚦 Rate limit: {limiter_stats['throttled']} throttled, {limiter_stats['retries']} retried, "
+                      f"{limiter_stats['circuit_opens']} circuit opens ({limiter_stats['rejected']} rejected), "
+                      f"{limiter_stats['waited_seconds']:.1f}s waited across workers, rate now {rate}")
+
+            split_stats = self.page_splitter.stats()
+            if split_stats['pages_split']:
+                print(f"✂️  Oversized pages: {split_stats['pages_split']} split into "
+                      f"{split_stats['parts_created']} child pages (budget {split_stats['max_bytes'] // 1024} KB)")
+
+            if self.manifest is not None:
+                self.manifest.flush()
+
+            if self.fragment_cache is not None:
+                self.fragment_cache.flush()
+                cache_stats = self.fragment_cache.stats()
+                print(f"🗄️  Fragment cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+
             duration = (datetime.now() - start_time).total_seconds()
 
             print(f"\n✅ Published {len(created_pages)} pages in {duration:.2f}s")
 
             # Save ALL generated Confluence Storage Format to files
-            # generated_contents already has all pages collected during creation
+            # generated_contents already has all pages collected during rendering
             self._save_storage_format(api_spec, target, generated_contents)
 
             return PublishResultDTO(
@@ -236,7 +299,24 @@ class ConfluencePublisher(PublisherContract):
                     'publisher': 'confluence',
                     'space': self.space_key,
                     'base_url': self.base_url,
-                    'pages_created': len(created_pages)
+                    'pages_created': len(created_pages),
+                    'pages_written': self.write_stats['created'] + self.write_stats['updated'],
+                    'pages_unchanged': self.write_stats['unchanged'],
+                    'pages_moved': self.write_stats['moved'],
+                    'orphans': self.publish_plan.count('delete'),
+                    'orphans_removed': orphans_removed,
+                    'labels_added': label_stats['added'],
+                    'labels_removed': label_stats['removed'],
+                    'pages_split': split_stats['pages_split'],
+                    'page_parts': split_stats['parts_created'],
+                    'publish_workers': self.scheduler.max_workers,
+                    'http_requests': connection_stats['requests'],
+                    'http_connections': connection_stats['connections'],
+                    'http_reused': connection_stats['reused'],
+                    'http_throttled': limiter_stats['throttled'],
+                    'http_retries': limiter_stats['retries'],
+                    'circuit_opens': limiter_stats['circuit_opens'],
+                    'resumed_pages': len(replayed)
                 },
                 url=created_pages.get('root'),
                 duration_seconds=duration
@@ -250,36 +330,674 @@ class ConfluencePublisher(PublisherContract):
             import traceback
             traceback.print_exc()
             return self._error_result(errors, start_time)
+        finally:
+            # An unfinished run stays resumable (completed runs are closed already)
+            if self.journal is not None:
+                self.journal.close()
+
+    def _build_page_tree(self, api_spec, document_view, target: PublishTargetDTO) -> Tuple[List[PageNodeDTO], Dict]:
+        """
+        Render every page of the publication as a tree of nodes
+
+        Returns:
+            Tuple: (nodes in document order - parents before children,
+                    storage contents by file key for _save_storage_format)
+        """
+        nodes: List[PageNodeDTO] = []
+
+        api_title = target.title or api_spec.info.title
+        api_version = api_spec.info.version
+
+        # Extract major.minor version (e.g., "1.0.7" -> "1.0")
+        version_parts = api_version.split('.')
+        major_minor = '.'.join(version_parts[:2]) if len(version_parts) >= 2 else api_version
+
+        # Root page with rich content
+        # Check if title already contains "API" or version
+        root_title = api_title
+        if " API" not in root_title.upper():
+            root_title = f"{root_title} API"
+        if major_minor not in root_title:
+            root_title = f"{root_title} {major_minor}"
+
+        root_content = self._generate_overview_content(
+            api_spec, root_title,
+            include_toc=document_view.include_toc if document_view is not None else True
+        )
+        nodes.append(PageNodeDTO(
+            key='root', title=root_title, content=root_content, kind='root page',
+            labels=target.labels or []
+        ))
+
+        # Create unique prefix for child pages to avoid title conflicts in same space
+        # Confluence doesn't allow duplicate titles in same space, even with different parents
+        # Use API name + version as prefix: [Swagger Petstore 1.0]
+        if major_minor not in api_title:
+            api_prefix = f"[{api_title} {major_minor}]"
+        else:
+            api_prefix = f"[{api_title}]"
+
+        # "Endpoints" folder page with unique prefix (tags fall back to the root if it fails)
+        endpoints_folder_title = f"{api_prefix} Endpoints"
+        endpoints_folder_content = self._generate_endpoints_folder_content(api_spec)
+        nodes.append(PageNodeDTO(
+            key='endpoints_folder', title=endpoints_folder_title, content=endpoints_folder_content,
+            kind='Endpoints folder', labels=['endpoints'], parent_key='root', reparent_on_failure=True
+        ))
+
+        # Initialize dictionary to collect ALL generated contents
+        generated_contents = {
+            'root': (root_title, root_content),
+            'endpoints_folder': (endpoints_folder_title, endpoints_folder_content),
+        }
+
+        # Shared schema mode: every schema rendered once on a Data Models page
+        models_page_title = None
+        if document_view is not None and document_view.shared_schemas and document_view.models:
+            models_page_title = f"{api_prefix} Data Models"
+            models_content = self._generate_models_content(document_view.models)
+            generated_contents['models'] = (models_page_title, models_content)
+            nodes.append(PageNodeDTO(
+                key='models', title=models_page_title, content=models_content,
+                kind='Data Models page', labels=['models'], parent_key='root'
+            ))
+
+        # Hierarchy: Endpoints → Tag folders → Individual endpoints (→ split-off parts)
+        if api_spec.tags:
+            # Reuse the views built by the renderer (built here only as a fallback)
+            if document_view is not None:
+                tag_views = document_view.tag_views
+            else:
+                tag_views = EndpointViewBuilder(api_spec).build_all()
+
+            # Titles are unique per space: an endpoint listed under several tags gets one page,
+            # under the first of its tags in spec order (the same owner on every run)
+            endpoint_titles = set()
+
+            for tag, tag_view in zip(api_spec.tags, tag_views):
+                tag_folder_title = f"{api_prefix} {tag.name.capitalize()}"
+                tag_folder_content = self._generate_tag_folder_content(tag, len(tag_view.endpoints))
+                generated_contents[f'tag_{tag.name}'] = (tag_folder_title, tag_folder_content)
+
+                tag_folder_key = f'tag_folder_{tag.name}'
+                nodes.append(PageNodeDTO(
+                    key=tag_folder_key, title=tag_folder_title, content=tag_folder_content,
+                    kind='tag folder', labels=[tag.name.lower(), 'tag'], parent_key='endpoints_folder'
+                ))
+
+                for endpoint in tag_view.endpoints:
+                    method, path = endpoint.method, endpoint.path
+
+                    # Generate endpoint title with unique prefix
+                    endpoint_title = f"{api_prefix} {method.upper()} {path}"
+                    if endpoint_title in endpoint_titles:
+                        continue
+                    endpoint_titles.add(endpoint_title)
+
+                    # Oversized pages come back split (schemas/examples moved to child pages)
+                    page_plan = self._plan_endpoint_pages(endpoint, endpoint_title, models_page_title)
+                    if page_plan.is_split:
+                        print(f"   ✂️  {endpoint_title}: {page_plan.size_bytes // 1024} KB page "
+                              f"+ {len(page_plan.parts)} child pages")
+
+                    # Save endpoint content (and its child pages)
+                    safe_endpoint_key = f"{tag.name}_{method}_{path}".replace('/', '_').replace('{', '').replace('}', '')
+                    generated_contents[f'endpoint_{safe_endpoint_key}'] = (endpoint_title, page_plan.content)
+
+                    endpoint_key = f'endpoint_{tag.name}_{method}_{path.replace("/", "_")}'
+                    nodes.append(PageNodeDTO(
+                        key=endpoint_key, title=endpoint_title, content=page_plan.content,
+                        kind='endpoint', labels=[tag.name.lower(), method.lower(), 'endpoint'],
+                        parent_key=tag_folder_key
+                    ))
+
+                    for number, part in enumerate(page_plan.parts, 1):
+                        generated_contents[f'endpoint_{safe_endpoint_key}_part{number}'] = (part.title, part.content)
+                        nodes.append(PageNodeDTO(
+                            key=f'{endpoint_key}_part{number}', title=part.title, content=part.content,
+                            kind='endpoint part', labels=[tag.name.lower(), method.lower(), 'endpoint-part', part.kind],
+                            parent_key=endpoint_key
+                        ))
+
+        return nodes, generated_contents
+
+    def _publish_node(self, node: PageNodeDTO, parent_id: Optional[str]) -> Optional[Dict]:
+        """Apply the planned action to the page of one tree node (runs in a scheduler worker)"""
+        planned = self._planned_pages.get(node.key)
+        if planned is None or (planned.action == 'create' and not self.page_index.complete):
+            # Unplanned, or a create the partial (manifest) index cannot vouch for - look it up first
+            page = self._create_or_update_page(
+                title=node.title,
+                content=node.content,
+                parent_id=parent_id,
+                labels=node.labels,
+                page_key=node.key
+            )
+        else:
+            page = self._write_page(
+                planned.existing if planned.action != 'create' else None,
+                node.title, node.content, parent_id, node.labels, node.key, planned.content_hash
+            )
+        if page:
+            print(f"   ✅ {node.kind.capitalize()}: {node.title}")
+        return page
+
+    def _print_plan(self, plan: PublishPlanDTO, request_seconds: float):
+        """Print the plan summary (and, in dry-run mode, every page that would be written)"""
+        summary = plan.summary()
+        print(f"\n🧭 Publish plan: {summary['create']} create, {summary['update']} update, {summary['move']} move, "
+              f"{summary['skip']} skip, {summary['delete']} delete (orphans)")
+        estimate = plan.estimate_seconds(self.scheduler.max_workers, request_seconds, self.rate_limiter.max_rate)
+        print(f"   📦 {summary['bytes'] / 1024:.1f} KB in {summary['requests']} write requests "
+              f"(~{estimate:.1f}s with {self.scheduler.max_workers} workers at {request_seconds * 1000:.0f} ms/request)")
+
+        if self.dry_run:
+            symbols = {'create': '+', 'update': '~', 'move': '⇄', 'delete': '-'}
+            for page in [page for page in plan.pages if page.action != 'skip'] + plan.deletes:
+                size = f" ({page.bytes / 1024:.1f} KB)" if page.bytes else ''
+                print(f"   {symbols[page.action]} {page.action:<6} {page.title}{size}")
+            if plan.deletes:
+                cleaner = self.orphan_cleaner
+                if cleaner.action == 'report':
+                    print(f"   🧹 Orphans are reported only (CONFLUENCE_ORPHANS=report)")
+                elif cleaner.exceeds_cap(plan.deletes):
+                    print(f"   🧹 Orphans would be left in place: {len(plan.deletes)} exceed "
+                          f"CONFLUENCE_ORPHAN_MAX={cleaner.max_pages}")
+                else:
+                    print(f"   🧹 {len(plan.deletes)} orphans would be {cleaner.action}d "
+                          f"in {len(cleaner.levels(plan.deletes))} levels")
+
+    def _clean_orphans(self, orphans: List, warnings: List[str]) -> int:
+        """Archive or delete the orphan pages (per CONFLUENCE_ORPHANS) - returns how many were removed"""
+        if not orphans:
+            return 0
+        cleaner = self.orphan_cleaner
+        if cleaner.action == 'report':
+            print(f"🧹 Orphans: {len(orphans)} pages no longer in the spec, left in place (CONFLUENCE_ORPHANS=report)")
+            return 0
+        if cleaner.exceeds_cap(orphans):
+            warnings.append(f"Orphan cleanup skipped: {len(orphans)} orphan pages exceed "
+                            f"CONFLUENCE_ORPHAN_MAX={cleaner.max_pages}")
+            return 0
+
+        print(f"\n🧹 Removing {len(orphans)} orphan pages ({cleaner.action})...")
+        outcome = cleaner.clean(orphans)
+        for orphan in outcome['failed']:
+            warnings.append(f"Failed to {cleaner.action} orphan page: {orphan.title}")
+
+        removed_keys = [orphan.existing.get('page_key') for orphan in outcome['removed']
+                        if orphan.existing and orphan.existing.get('page_key')]
+        if self.manifest is not None and removed_keys:
+            self.manifest.remove(self.space_key, self.manifest_api_key, removed_keys)
+        print(f"🧹 Orphans: {len(outcome['removed'])} {cleaner.action}d, {len(outcome['failed'])} failed")
+        return len(outcome['removed'])
+
+    def _label_changes(self, nodes: List[PageNodeDTO], entries: Dict[str, Optional[Dict]]) -> List[LabelChangeDTO]:
+        """Label differences of the published pages (entries: page index entry per node key)"""
+        changes = []
+        for node in nodes:
+            entry = entries.get(node.key)
+            if entry is None:
+                continue
+            change = LabelSynchronizer.diff(
+                entry['id'], node.title, self._format_labels(node.labels),
+                entry.get('labels'), entry.get('managed_labels')
+            )
+            if change is not None:
+                changes.append(change)
+        return changes
+
+    def _sync_labels(self, nodes: List[PageNodeDTO], results: Dict[str, Optional[Dict]],
+                     warnings: List[str]) -> Dict[str, int]:
+        """Add missing and remove stale labels of the published pages"""
+        entries = {}
+        for node in nodes:
+            page = results.get(node.key)
+            if not page:
+                continue
+            entry = self.page_index.peek_title(node.title)
+            # Labels unknown (not in the index): missing ones are added, none removed
+            entries[node.key] = entry if entry is not None and entry['id'] == page['id'] else {'id': page['id']}
+
+        changes = self._label_changes(nodes, entries)
+        stats = self.label_sync.apply(changes)
+        if changes:
+            print(f"🏷️  Labels: {stats['pages']} pages relabeled (+{stats['added']} / -{stats['removed']}) "
+                  f"in {stats['requests']} requests, {len(entries) - len(changes)} already in sync")
+        if stats['failed']:
+            warnings.append(f"Labels of {stats['failed']} pages could not be synchronized")
+
+        failed_ids = {change.page_id for change in changes if not change.applied}
+        recorded = self._record_managed_labels(
+            [node for node in nodes if node.key in entries and entries[node.key]['id'] not in failed_ids], entries
+        )
+        if recorded:
+            print(f"🏷️  Applied labels recorded in the hash property of {recorded} pages")
+        return stats
+
+    def _record_managed_labels(self, nodes: List[PageNodeDTO], entries: Dict[str, Dict]) -> int:
+        """
+        Store the synced labels in the hash property of pages where it records other labels
+
+        The property is what a later run diffs against (no manifest needed):
+        labels it lists and the spec dropped are removed, all others stay.
+        Returns the number of properties written.
+        """
+        pending = []
+        for node in nodes:
+            entry = entries[node.key]
+            desired = self._format_labels(node.labels)
+            managed = entry.get('managed_labels')
+            if not entry.get('content_hash') or not entry.get('hash_version'):
+                continue  # No current hash property - the next body write records the labels
+            if managed is not None and set(managed) == set(desired):
+                continue
+            pending.append((node, entry, desired))
+        if not pending:
+            return 0
+
+        def record(item) -> bool:
+            node, entry, desired = item
+            if not self._write_hash_property(
+                entry['id'], entry['content_hash'], entry['hash_version'], entry['version']['number'], desired
+            ):
+                return False
+            entry['hash_version'] += 1
+            entry['managed_labels'] = desired
+            if self.manifest is not None and self.manifest_api_key is not None:
+                self.manifest.record(
+                    self.space_key, self.manifest_api_key, node.key, entry, entry.get('parent_id'), desired
+                )
+            return True
+
+        with ThreadPoolExecutor(max_workers=self.scheduler.max_workers, thread_name_prefix='labels') as pool:
+            return sum(pool.map(record, pending))
+
+    def _dry_run_result(self, api_spec, target, nodes: List[PageNodeDTO], generated_contents: dict,
+                        start_time: datetime, request_seconds: float) -> PublishResultDTO:
+        """Result of a dry run: the plan (saved next to the storage format files), nothing written"""
+        # Pages to create get their labels with the page - only existing pages can need a label sync
+        label_changes = self._label_changes(
+            nodes, {page.key: page.existing for page in self.publish_plan.pages if page.action != 'create'}
+        )
+        if label_changes:
+            print(f"\n🏷️  Labels: {len(label_changes)} pages would be relabeled "
+                  f"(+{sum(len(change.add) for change in label_changes)} / "
+                  f"-{sum(len(change.remove) for change in label_changes)})")
+
+        output_dir = self._save_storage_format(api_spec, target, generated_contents)
+        plan_data = self.publish_plan.to_dict()
+        plan_data['estimated_seconds'] = self.publish_plan.estimate_seconds(self.scheduler.max_workers, request_seconds, self.rate_limiter.max_rate)
+        plan_file = output_dir / "publish_plan.json"
+        with open(plan_file, 'w', encoding='utf-8') as f:
+            json.dump(plan_data, f, indent=2, ensure_ascii=False)
+        print(f"\n🧭 Dry run - nothing was written. Plan saved to: {plan_file.absolute()}")
+
+        duration = (datetime.now() - start_time).total_seconds()
+        return PublishResultDTO(
+            success=True,
+            output_paths={'plan': str(plan_file.absolute())},
+            metadata={
+                'publisher': 'confluence',
+                'space': self.space_key,
+                'base_url': self.base_url,
+                'dry_run': True,
+                'plan': plan_data['summary'],
+                'label_changes': len(label_changes),
+                'estimated_seconds': plan_data['estimated_seconds']
+            },
+            duration_seconds=duration
+        )
 
     def _create_or_update_page(
         self,
         title: str,
         content: str,
         parent_id: Optional[str] = None,
-        labels: List[str] = None
+        labels: List[str] = None,
+        page_key: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        Create a new page or update if exists with same title AND parent
+
+        Existing pages whose stored content hash (of the body) matches are
+        left untouched - no new version, no request. The outcome is recorded
+        in the local manifest under page_key.
+        """
+        existing_page = self._lookup_page(title, parent_id)
+        return self._write_page(existing_page, title, content, parent_id, labels, page_key)
+
+    def _lookup_page(self, title: str, parent_id: Optional[str]) -> Optional[Dict]:
+        """Index entry of the page with this title under this parent (None: it does not exist)"""
+        # Check if page already exists with this title AND parent (prefetched index when available)
+        if self.page_index is not None:
+            existing_page = self.page_index.find(title, parent_id)
+            if existing_page is None and not self.page_index.complete:
+                # Manifest index: pages not published from here may still exist remotely
+                existing_page = self._find_page_by_title(title, parent_id)
+                if existing_page:
+                    existing_page = PageTreeIndex.entry_of(existing_page)
+        else:
+            existing_page = self._find_page_by_title(title, parent_id)
+            if existing_page:
+                existing_page = PageTreeIndex.entry_of(existing_page)
+        return existing_page
+
+    def _write_page(
+        self,
+        existing_page: Optional[Dict],
+        title: str,
+        content: str,
+        parent_id: Optional[str],
+        labels: Optional[List[str]],
+        page_key: Optional[str] = None,
+        content_hash: Optional[str] = None
     ) -> Optional[Dict]:
-        """Create a new page or update if exists with same title AND parent"""
+        """
+        Skip, update, move or create a page given its existing index entry
+
+        A page found under another parent is moved (updated with the new
+        ancestor). Index and manifest are kept current.
+        """
+        content_hash = content_hash or self._content_hash(content)
+        formatted_labels = self._format_labels(labels or [])
+        moved = existing_page is not None and existing_page.get('parent_id', parent_id) != parent_id
 
-        # Check if page already exists with this title AND parent
-        existing_page = self._find_page_by_title(title, parent_id)
+        if existing_page and not moved and existing_page.get('content_hash') == content_hash:
+            # Unchanged since the last publish
+            print(f"   = Unchanged page (ID: {existing_page['id']}): {title}")
+            self._count_write('unchanged')
+            self._record_page(page_key, 'skip', existing_page, parent_id, labels)
+            return existing_page
 
         if existing_page:
-            # Update existing page
-            print(f"   ↻ Updating existing page (ID: {existing_page['id']}, Parent: {parent_id})...")
-            return self._update_page(existing_page['id'], title, content, existing_page['version']['number'])
+            # Update (or move) existing page, then its hash property
+            if moved:
+                print(f"   ⇄ Moving page (ID: {existing_page['id']}) to Parent: {parent_id}...")
+            else:
+                print(f"   ↻ Updating existing page (ID: {existing_page['id']}, Parent: {parent_id})...")
+            page = self._update_page(
+                existing_page['id'], title, content, existing_page['version']['number'],
+                parent_id=parent_id if moved else None
+            )
+            # Labels about to be synced join the ones applied before - stale ones are still removed this run
+            managed_labels = sorted(set(existing_page.get('managed_labels') or ()) | set(formatted_labels))
+            if page and not self._write_hash_property(
+                page['id'], content_hash, existing_page.get('hash_version', 0), page['version']['number'],
+                managed_labels
+            ):
+                content_hash = None  # Not stored - the next run updates the page again
+            if page:
+                self._count_write('moved' if moved else 'updated')
         else:
-            # Create new page
+            # Create new page (hash property sent along with it)
             print(f"   ➕ Creating NEW page (Title: '{title}', Parent: {parent_id})...")
-            return self._create_page(title, content, parent_id, labels)
+            page = self._create_page(title, content, parent_id, labels, content_hash)
+            if page:
+                self._count_write('created')
+
+        # Keep the index, the manifest and the journal current (new pages, new version numbers)
+        if page and self.page_index is not None:
+            entry = self.page_index.add(page, parent_id, content_hash)
+            if existing_page is None:
+                entry.setdefault('labels', formatted_labels)  # Created with its labels
+                entry['managed_labels'] = formatted_labels
+            else:
+                # Body updates leave labels alone - keep what the index knew
+                entry.setdefault('labels', existing_page.get('labels'))
+                if content_hash is None:
+                    # Hash property not written: it keeps its version (write responses do not expand it),
+                    # so the next run bumps that version instead of creating the property again
+                    entry['hash_version'] = max(entry['hash_version'], existing_page.get('hash_version', 0))
+                    entry['managed_labels'] = existing_page.get('managed_labels')
+                else:
+                    entry['managed_labels'] = managed_labels
+            action = 'create' if existing_page is None else ('move' if moved else 'update')
+            self._record_page(page_key, action, entry, parent_id, labels)
+        return page
+
+    def _record_page(self, page_key: Optional[str], action: str, entry: Dict, parent_id: Optional[str],
+                     labels: Optional[List[str]]):
+        """Record a completed page in the run journal and the local manifest (when enabled)"""
+        if page_key is None:
+            return
+        if self.journal is not None and not self.dry_run:
+            self.journal.record(page_key, action, entry, parent_id)
+        if self.manifest is None or self.manifest_api_key is None:
+            return
+        self.manifest.record(
+            self.space_key, self.manifest_api_key, page_key, entry, parent_id, self._format_labels(labels or [])
+        )
+
+    def _count_write(self, outcome: str):
+        """Count a page write outcome (thread safe)"""
+        with self._stats_lock:
+            self.write_stats[outcome] += 1
+
+    def _content_hash(self, content: str) -> str:
+        """Hash of a page body (stored as a content property)"""
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def _write_hash_property(self, page_id: str, content_hash: str, current_version: int, page_version: int,
+                             managed_labels: List[str]) -> bool:
+        """Store the content hash property of a page (create it, or bump its version) with the labels applied"""
+        key = PageTreeIndex.HASH_PROPERTY
+        data = {'key': key, 'value': {'hash': content_hash, 'page_version': page_version, 'labels': managed_labels}}
+        try:
+            if current_version:
+                response = self.session.put(
+                    f"{self.api_url}/{page_id}/property/{key}",
+                    json=dict(data, version={'number': current_version + 1}),
+                    timeout=30
+                )
+            else:
+                response = self.session.post(f"{self.api_url}/{page_id}/property", json=data, timeout=30)
+
+            if response.status_code == 200:
+                return True
+            print(f"   ⚠️  Could not store content hash of page {page_id}: {response.status_code}")
+            return False
+
+        except Exception as e:
+            print(f"   ⚠️  Could not store content hash of page {page_id}: {str(e)}")
+            return False
+
+    def _start_journal(self, nodes: List[PageNodeDTO]) -> Dict[str, Dict]:
+        """Open the checkpoint journal of this run (returns the pages a resumed run already completed)"""
+        if self.journal is None or self.dry_run:
+            if self.resume and self.journal is None:
+                print("   ⚠️  Resume needs the publish journal (PUBLISH_JOURNAL_DIR) - publishing everything")
+            return {}
+
+        replayed = self.journal.start(self.space_key, nodes[0].title, resume=self.resume)
+        if self.resume:
+            if replayed:
+                first = next((node for node in nodes if node.key not in replayed), None)
+                resume_at = f", continuing from '{first.title}'" if first else ''
+                print(f"\n♻️  Resuming run {self.journal.run_id}: {len(replayed)} pages already done{resume_at}")
+            else:
+                print("\n♻️  No unfinished run to resume - starting a new one")
+        return replayed
+
+    def _replay_journal(self, replayed: Dict[str, Dict]):
+        """Put the pages completed by the resumed run into the page index (ids, versions, hashes)"""
+        for page_key, line in replayed.items():
+            known = self.page_index.peek_title(line['title'])
+            if known is not None and known['version']['number'] > line['version']:
+                continue  # Changed since (by hand) - the index has the current state
+            self.page_index.put({
+                'id': line['id'],
+                'title': line['title'],
+                'version': {'number': line['version']},
+                'content_hash': line['content_hash'],
+                # The index may know a newer property version (labels recorded after the page write)
+                'hash_version': max(line['hash_version'], known['hash_version'] if known is not None and known['id'] == line['id'] else 0),
+                'page_key': page_key,
+                'labels': line.get('labels'),
+                'managed_labels': line.get('managed_labels')
+            }, line['parent_id'])
+
+    def _finish_journal(self, complete: bool):
+        """Close the run journal: complete runs are marked done, the rest stay resumable"""
+        if self.journal is None:
+            return
+        if complete:
+            self.journal.complete(self.space_key, self.manifest_api_key)
+        else:
+            self.journal.close()
+            print(f"♻️  Journal: {self.journal.recorded} pages recorded this run - "
+                  f"publish again with --resume to continue from the first incomplete page")
+
+    def _prefetch_page_tree(self, root_title: str) -> PageTreeIndex:
+        """
+        Index the existing pages of this API with one paginated descendant query
+
+        The root page is looked up by title; everything below it comes from a
+        CQL search (ancestor = root). When the search fails the index is
+        partial (complete=False) - pages are then looked up one by one.
+        """
+        if self.manifest is not None:
+            recorded = self.manifest.load(self.space_key, root_title)
+            if recorded:
+                index = self._index_from_manifest(root_title, recorded)
+                if index is not None:
+                    return index
+
+        index = PageTreeIndex()
+        root_page = self._find_page_by_title(root_title, self.parent_page_id)
+        index.requests += 1
+        if not root_page:
+            print(f"🗂️  Page index: no existing root page - every page will be created")
+            return index
+
+        index.add(root_page, self.parent_page_id)
+        try:
+            cql = f'ancestor={root_page["id"]} and type=page'
+            expand = f'version,ancestors,metadata.labels,metadata.properties.{PageTreeIndex.HASH_PROPERTY}'
+            for page in self._iter_search(cql, expand, self.DESCENDANTS_PAGE_SIZE, index):
+                index.load((page,))
+        except requests.exceptions.RequestException as e:
+            print(f"   ⚠️  Page tree prefetch failed ({str(e)}) - falling back to per-page lookups")
+            index.complete = False
+            return index
+
+        print(f"🗂️  Page index: {len(index)} existing pages loaded in {index.requests} requests")
+        return index
+
+    def _index_from_manifest(self, root_title: str, recorded: Dict[str, Dict]) -> Optional[PageTreeIndex]:
+        """
+        Build the page index from the local manifest, verifying versions in bulk
+
+        Pages whose remote version still matches are trusted as recorded.
+        A version mismatch (edited by hand) refetches only that page; pages
+        gone remotely are dropped. None when the verification fails.
+        """
+        index = PageTreeIndex(complete=False)
+        page_ids = [entry['page_id'] for entry in recorded.values()]
+        versions = {}
+        labels = {}
+        try:
+            for start in range(0, len(page_ids), self.VERIFY_BATCH_SIZE):
+                batch = page_ids[start:start + self.VERIFY_BATCH_SIZE]
+                cql = f"id in ({','.join(batch)})"
+                for page in self._iter_search(cql, 'version,metadata.labels', len(batch), index, total=len(batch)):
+                    versions[page['id']] = (page.get('version') or {}).get('number')
+                    labels[page['id']] = PageTreeIndex.entry_of(page).get('labels')
+        except requests.exceptions.RequestException as e:
+            print(f"   ⚠️  Manifest verification failed ({str(e)}) - prefetching the page tree instead")
+            return None
+
+        gone = []
+        edited = 0
+        for page_key, entry in recorded.items():
+            version = versions.get(entry['page_id'])
+            if version is None:
+                gone.append(page_key)
+            elif version == entry['version']:
+                index.put({
+                    'id': entry['page_id'],
+                    'title': entry['title'],
+                    'version': {'number': version},
+                    'content_hash': entry['content_hash'],
+                    'hash_version': entry['hash_version'],
+                    'page_key': page_key,
+                    'labels': labels.get(entry['page_id']),
+                    'managed_labels': entry['labels']  # Applied by earlier publishes
+                }, entry['parent_id'])
+            else:
+                edited += 1
+                page = self._fetch_page(entry['page_id'], index)
+                if page:
+                    refetched = index.add(page, PageTreeIndex.parent_of(page))
+                    refetched['page_key'] = page_key
+                    refetched.setdefault('managed_labels', entry['labels'])  # The hash property knows them too
+
+        if gone:
+            self.manifest.remove(self.space_key, root_title, gone)
+        print(f"🗂️  Page index: {len(index)} pages from the local manifest, verified in {index.requests} requests "
+              f"({edited} edited remotely, {len(gone)} gone)")
+        return index
+
+    def _fetch_page(self, page_id: str, index: PageTreeIndex) -> Optional[Dict]:
+        """Current version, ancestors and hash property of one page"""
+        try:
+            response = self.session.get(
+                f"{self.api_url}/{page_id}",
+                params={'expand': f'version,ancestors,metadata.labels,metadata.properties.{PageTreeIndex.HASH_PROPERTY}'},
+                timeout=30
+            )
+            index.requests += 1
+            return response.json() if response.status_code == 200 else None
+        except Exception:
+            return None
+
+    def _iter_search(
+        self,
+        cql: str,
+        expand: str,
+        limit: int,
+        index: PageTreeIndex,
+        total: Optional[int] = None
+    ) -> Iterator[Dict]:
+        """Pages matching a CQL query (following pagination; total: stop once that many were returned)"""
+        returned = 0
+        url = f"{self.api_url}/search"
+        params = {
+            'cql': cql,
+            'expand': expand,
+            'limit': limit,
+            'start': 0
+        }
+        while url:
+            response = self.session.get(url, params=params, timeout=30)
+            index.requests += 1
+            response.raise_for_status()
+            data = response.json()
+            results = data.get('results', [])
+            yield from results
+            returned += len(results)
+            if total is not None and returned >= total:
+                break
+
+            # Cloud returns a cursor link; Server/DC pages with start/limit
+            # (the server may cap the limit - compare with the one it applied)
+            next_link = (data.get('_links') or {}).get('next')
+            if next_link:
+                url, params = f"{self.base_url}{next_link}", None
+            elif params is not None and results and len(results) >= data.get('limit', len(results)):
+                params = dict(params, start=params['start'] + len(results))
+            else:
+                url = None
 
     def _create_page(
         self,
         title: str,
         content: str,
         parent_id: Optional[str] = None,
-        labels: List[str] = None
+        labels: List[str] = None,
+        content_hash: Optional[str] = None
     ) -> Optional[Dict]:
-        """Create a new Confluence page"""
+        """Create a new Confluence page (with its content hash property when given)"""
 
         data = {
             'type': 'page',
@@ -298,32 +1016,25 @@ class ConfluencePublisher(PublisherContract):
             data['ancestors'] = [{'id': parent_id}]
 
         # Add labels if specified - format them for Confluence
-        if labels:
-            # Confluence label rules:
-            # - Cannot start with a number
-            # - Cannot contain spaces or dots
-            # - Must be alphanumeric with hyphens/underscores
-            formatted_labels = []
-            for label in labels:
-                # Replace dots with hyphens, remove spaces
-                formatted = label.replace('.', '-').replace(' ', '-').lower()
-                # If starts with number, prefix with 'v'
-                if formatted and formatted[0].isdigit():
-                    formatted = 'v' + formatted
-                # Keep only alphanumeric, hyphens, underscores
-                formatted = ''.join(c for c in formatted if c.isalnum() or c in '-_')
-                if formatted:
-                    formatted_labels.append(formatted)
-
-            if formatted_labels:
-                data['metadata'] = {
-                    'labels': [{'name': label} for label in formatted_labels]
+        formatted_labels = self._format_labels(labels or [])
+        if formatted_labels:
+            data['metadata'] = {
+                'labels': [{'name': label} for label in formatted_labels]
+            }
+
+        # Content hash property, so the next publish can skip the page while unchanged
+        # (and knows which labels it applied)
+        if content_hash:
+            data.setdefault('metadata', {})['properties'] = {
+                PageTreeIndex.HASH_PROPERTY: {
+                    'key': PageTreeIndex.HASH_PROPERTY,
+                    'value': {'hash': content_hash, 'page_version': 1, 'labels': formatted_labels}
                 }
+            }
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
-                headers=self.headers,
                 json=data,
                 timeout=30
             )
@@ -344,8 +1055,44 @@ class ConfluencePublisher(PublisherContract):
             print(f"   ❌ Exception: {str(e)}")
             return None
 
-    def _update_page(self, page_id: str, title: str, content: str, version: int) -> Optional[Dict]:
-        """Update an existing Confluence page"""
+    @staticmethod
+    def _format_labels(labels: List[str]) -> List[str]:
+        """Format labels for Confluence (normalized once per distinct label list)"""
+        return list(ConfluencePublisher._normalize_labels(tuple(labels)))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _normalize_labels(labels: Tuple[str, ...]) -> Tuple[str, ...]:
+        """
+        Format labels for Confluence
+
+        Confluence label rules:
+        - Cannot start with a number
+        - Cannot contain spaces or dots
+        - Must be alphanumeric with hyphens/underscores
+        """
+        formatted_labels = []
+        for label in labels:
+            # Replace dots with hyphens, remove spaces
+            formatted = label.replace('.', '-').replace(' ', '-').lower()
+            # If starts with number, prefix with 'v'
+            if formatted and formatted[0].isdigit():
+                formatted = 'v' + formatted
+            # Keep only alphanumeric, hyphens, underscores
+            formatted = ''.join(c for c in formatted if c.isalnum() or c in '-_')
+            if formatted:
+                formatted_labels.append(formatted)
+        return tuple(formatted_labels)
+
+    def _update_page(
+        self,
+        page_id: str,
+        title: str,
+        content: str,
+        version: int,
+        parent_id: Optional[str] = None
+    ) -> Optional[Dict]:
+        """Update an existing Confluence page (moved under parent_id when given)"""
 
         data = {
             'type': 'page',
@@ -358,11 +1105,12 @@ class ConfluencePublisher(PublisherContract):
                 }
             }
         }
+        if parent_id:
+            data['ancestors'] = [{'id': parent_id}]
 
         try:
-            response = requests.put(
+            response = self.session.put(
                 f"{self.api_url}/{page_id}",
-                headers=self.headers,
                 json=data,
                 timeout=30
             )
@@ -385,12 +1133,11 @@ class ConfluencePublisher(PublisherContract):
             params = {
                 'spaceKey': self.space_key,
                 'title': title,
-                'expand': 'version,ancestors'
+                'expand': f'version,ancestors,metadata.labels,metadata.properties.{PageTreeIndex.HASH_PROPERTY}'
             }
 
-            response = requests.get(
+            response = self.session.get(
                 self.api_url,
-                headers=self.headers,
                 params=params,
                 timeout=30
             )
@@ -407,11 +1154,16 @@ class ConfluencePublisher(PublisherContract):
                     for page in results:
                         page_id = page.get('id')
 
+                        # Ancestors are expanded in the search results - no extra request needed
+                        if 'ancestors' in page:
+                            if PageTreeIndex.parent_of(page) == parent_id:
+                                return page
+                            continue
+
                         # Get full page details to verify parent
                         try:
-                            page_detail_response = requests.get(
+                            page_detail_response = self.session.get(
                                 f"{self.api_url}/{page_id}",
-                                headers=self.headers,
                                 params={'expand': 'ancestors'},
                                 timeout=30
                             )
@@ -439,49 +1191,10 @@ class ConfluencePublisher(PublisherContract):
         except Exception:
             return None
 
-    def _convert_html_to_storage_format(self, html: str) -> str:
-        """
-        Convert HTML to Confluence Storage Format
-
-        For MVP, we'll do basic conversions. Full implementation would use
-        a proper HTML to Confluence Storage Format converter.
-        """
-        # Basic conversions for common HTML tags
-        storage = html
-
-        # Extract content from <body> if present
-        if '<body>' in storage:
-            start = storage.find('<body>') + 6
-            end = storage.find('</body>')
-            if end > start:
-                storage = storage[start:end]
-
-        # Remove <html>, <head>, <style> tags
-        storage = storage.replace('<html>', '').replace('</html>', '')
-        storage = storage.replace('<head>', '').replace('</head>', '')
-
-        # Remove inline styles for cleaner Confluence pages
-        import re
-        storage = re.sub(r'<style[^>]*>.*?</style>', '', storage, flags=re.DOTALL)
-        storage = re.sub(r' style="[^"]*"', '', storage)
-        storage = re.sub(r' class="[^"]*"', '', storage)
-        storage = re.sub(r' onclick="[^"]*"', '', storage)
-
-        # Convert divs to paragraphs for better Confluence rendering
-        storage = storage.replace('<div>', '<p>').replace('</div>', '</p>')
-
-        # Remove script tags
-        storage = re.sub(r'<script[^>]*>.*?</script>', '', storage, flags=re.DOTALL)
-
-        # Clean up multiple empty paragraphs
-        storage = re.sub(r'(<p>\s*</p>)+', '', storage)
-
-        return storage.strip()
-
-    def _generate_overview_content(self, api_spec, title: str) -> str:
+    def _generate_overview_content(self, api_spec, title: str, include_toc: bool = True) -> str:
         """Generate rich overview content for root page using Jinja2 template"""
         template = self.jinja_env.get_template('root.html.j2')
-        return template.render(api=api_spec, title=title)
+        return template.render(api=api_spec, title=title, include_toc=include_toc)
 
 
     def _generate_tag_folder_content(self, tag, endpoint_count: int = 0) -> str:
@@ -489,21 +1202,35 @@ class ConfluencePublisher(PublisherContract):
         template = self.jinja_env.get_template('tag_folder.html.j2')
         return template.render(tag=tag, endpoint_count=endpoint_count)
 
+    def _generate_models_content(self, models) -> str:
+        """Generate content for the shared Data Models page using Jinja2 template"""
+        template = self.jinja_env.get_template('models.html.j2')
+        return template.render(models=models, schema_table=self.schema_table)
+
+    def _plan_endpoint_pages(
+        self,
+        endpoint: EndpointViewDTO,
+        title: str,
+        models_page_title: Optional[str] = None
+    ) -> EndpointPagePlanDTO:
+        """Endpoint page body, split into child pages when it exceeds the configured size budget"""
+        content = self._generate_single_endpoint_content(endpoint, models_page_title)
+        return self.page_splitter.build(
+            endpoint, title, content,
+            lambda **page_vars: self._generate_single_endpoint_content(endpoint, models_page_title, **page_vars)
+        )
+
     def _generate_single_endpoint_content(
         self,
-        api_spec,
-        path: str,
-        method: str,
-        operation,
-        api_prefix: str = ""
+        endpoint: EndpointViewDTO,
+        models_page_title: Optional[str] = None,
+        **page_vars
     ) -> str:
-        """Generate content for a single endpoint page using Jinja2 template"""
+        """
+        Generate content for a single endpoint page using Jinja2 template
 
-        # Create example generator with available schemas
-        schemas = {}
-        if api_spec.components and api_spec.components.schemas:
-            schemas = api_spec.components.schemas
-        example_generator = ExampleGeneratorUtils(schemas)
+        page_vars: schema_pages / example_pages when sections live on child pages
+        """
 
         # Method color mapping
         method_colors = {
@@ -513,126 +1240,34 @@ class ConfluencePublisher(PublisherContract):
             'delete': 'Red',
             'patch': 'Purple'
         }
-        method_color = method_colors.get(method.lower(), 'Grey')
+        method_color = method_colors.get(endpoint.method_lower, 'Grey')
+
+        # Unchanged endpoints are served from the persistent cache
+        cache_key = None
+        if self.fragment_cache is not None:
+            cache_key = FragmentCacheUtils.make_key(
+                'storage', endpoint.fingerprint, self.endpoint_template_version, models_page_title or '',
+                json.dumps(page_vars, sort_keys=True) if page_vars else ''
+            )
+            cached = self.fragment_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        # Render template
+        # Render template - all endpoint logic is precomputed in the view
         template = self.jinja_env.get_template('endpoint.html.j2')
         content = template.render(
-            api=api_spec,
-            path=path,
-            method=method,
-            operation=operation,
+            endpoint=endpoint,
             method_color=method_color,
-            example_generator=example_generator
+            models_page_title=models_page_title,
+            schema_table=self.schema_table,
+            **page_vars
         )
 
-        return content
+        if cache_key is not None:
+            self.fragment_cache.put(cache_key, content)
 
+        return content
 
-    def _generate_curl_example(self, api_spec, path: str, method: str, operation) -> str:
-        """Generate a cURL example for an endpoint"""
-        # Get base URL
-        base_url = "https://api.example.com"
-        if api_spec.servers and len(api_spec.servers) > 0:
-            base_url = api_spec.servers[0].url
-
-        # Build the full URL with path parameters replaced
-        full_url = f"{base_url}{path}"
-
-        # Replace path parameters with example values
-        if operation.parameters:
-            for param in operation.parameters:
-                if param.location == 'path':
-                    # Replace {paramName} with example value
-                    example_value = self._get_param_example(param)
-                    full_url = full_url.replace(f"{{{param.name}}}", str(example_value))
-
-        # Start building cURL command
-        curl_lines = [f"curl -X {method.upper()} '{full_url}'"]
-
-        # Add headers
-        curl_lines.append("  -H 'Accept: application/json'")
-
-        # Add Content-Type for methods that typically have body
-        if method.lower() in ['post', 'put', 'patch']:
-            curl_lines.append("  -H 'Content-Type: application/json'")
-
-        # Add query parameters
-        query_params = []
-        if operation.parameters:
-            for param in operation.parameters:
-                if param.location == 'query':
-                    example_value = self._get_param_example(param)
-                    query_params.append(f"{param.name}={example_value}")
-
-        if query_params:
-            # Add query params to URL
-            separator = '&' if '?' in full_url else '?'
-            params_str = '&'.join(query_params)
-            curl_lines[0] = f"curl -X {method.upper()} '{full_url}{separator}{params_str}'"
-
-        # Add request body for POST/PUT/PATCH
-        if method.lower() in ['post', 'put', 'patch']:
-            if operation.request_body:
-                body_example = self._generate_body_example(operation.request_body, api_spec)
-                curl_lines.append(f"  -d '{body_example}'")
-            else:
-                # Generic example body
-                curl_lines.append("  -d '{\"key\": \"value\"}'")
-
-        # Join with line continuation (using backslash and newline)
-        curl_command = " \\\n".join(curl_lines)
-
-        return curl_command
-
-    def _get_param_example(self, param) -> str:
-        """Get example value for a parameter"""
-        # Check if parameter has example
-        if hasattr(param, 'example') and param.example:
-            return param.example
-
-        # Generate based on type
-        if param.schema:
-            param_type = param.schema.type
-            if param_type == 'integer':
-                return "123"
-            elif param_type == 'boolean':
-                return "true"
-            elif param_type == 'array':
-                return "value1,value2"
-
-        # Default to a meaningful name-based example
-        param_name_lower = param.name.lower()
-        if 'id' in param_name_lower:
-            return "123"
-        elif 'name' in param_name_lower:
-            return "example"
-        elif 'status' in param_name_lower:
-            return "active"
-        elif 'limit' in param_name_lower:
-            return "10"
-        elif 'offset' in param_name_lower:
-            return "0"
-
-        return "value"
-
-    def _generate_body_example(self, request_body, api_spec=None) -> str:
-        """Generate example JSON body for request"""
-        # Create example generator if schemas available
-        schemas = {}
-        if api_spec and api_spec.components and api_spec.components.schemas:
-            schemas = api_spec.components.schemas
-        example_generator = ExampleGeneratorUtils(schemas)
-
-        # Try to generate from request body content
-        for content_type, media_obj in request_body.content.items():
-            if 'json' in content_type:
-                if media_obj.example:
-                    return json.dumps(media_obj.example, ensure_ascii=False)
-                elif media_obj.schema:
-                    return example_generator.generate_example_json(media_obj.schema, pretty=False)
-
-        return '{"key": "value"}'
 
     def _generate_endpoints_folder_content(self, api_spec) -> str:
         """Generate content for endpoints folder page using Jinja2 template"""
@@ -661,8 +1296,8 @@ class ConfluencePublisher(PublisherContract):
             return False
         return True
 
-    def _save_storage_format(self, api_spec, target, generated_contents: dict):
-        """Save generated Confluence Storage Format to files for review/backup"""
+    def _save_storage_format(self, api_spec, target, generated_contents: dict) -> Path:
+        """Save generated Confluence Storage Format to files for review/backup (returns the directory)"""
         from pathlib import Path
 
         # Determine output directory based on mode (server/preview)
@@ -841,6 +1476,7 @@ class ConfluencePublisher(PublisherContract):
         print(f"   ✅ Saved: {readme_file.name}")
         print(f"\n📍 Storage Format saved to: {api_output_dir.absolute()}")
         print(f"📊 Total files saved: {len(saved_files)}")
+        return api_output_dir
 
 
 
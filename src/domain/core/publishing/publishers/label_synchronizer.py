@@ -0,0 +1,105 @@
+"""
+LabelSynchronizer - Applies label differences to published Confluence pages
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+import requests
+from src.domain.core.publishing.dtos.label_change_dto import LabelChangeDTO
+
+
+class LabelSynchronizer:
+    """
+    Keeps page labels in sync with the spec, independently of page bodies
+
+    Desired labels come from the page tree; actual labels come from the
+    bulk page fetch that built the page index (labels are expanded there),
+    so computing the differences costs no request. Only pages whose labels
+    differ are touched: one request adds all missing labels of a page,
+    each label to remove costs one request (the REST API removes labels
+    one at a time). Pages are processed concurrently.
+
+    Only labels this publisher applied before (recorded in the content hash
+    property of the page, or in the local manifest) are ever removed -
+    labels added by hand stay.
+    """
+
+    def __init__(self, session: requests.Session, api_url: str, max_workers: int = 4):
+        """Initialize with the shared (rate limited) Confluence session"""
+        self.session = session
+        self.api_url = api_url
+        self.max_workers = max(1, max_workers)
+
+    @staticmethod
+    def diff(
+        page_id: str,
+        title: str,
+        desired: Iterable[str],
+        actual: Optional[Iterable[str]],
+        managed: Optional[Iterable[str]] = None
+    ) -> Optional[LabelChangeDTO]:
+        """
+        Label difference of one page (None when nothing changes)
+
+        Args:
+            desired: Normalized labels the page should have
+            actual: Labels the page has (None: unknown - missing labels are added, nothing removed)
+            managed: Labels applied by earlier publishes (None: unknown - nothing removed)
+        """
+        desired_set = set(desired)
+        actual_set = set(actual) if actual is not None else set()
+        add = sorted(desired_set - actual_set)
+        remove = sorted((set(managed) & actual_set) - desired_set) if managed is not None else []
+        if not add and not remove:
+            return None
+        return LabelChangeDTO(page_id=page_id, title=title, add=add, remove=remove)
+
+    def apply(self, changes: Sequence[LabelChangeDTO]) -> Dict[str, int]:
+        """
+        Apply label changes concurrently (each change is marked applied or not)
+
+        Returns:
+            dict: pages changed, labels added/removed, requests sent and failed pages
+        """
+        stats = {'pages': 0, 'added': 0, 'removed': 0, 'requests': 0, 'failed': 0}
+        if not changes:
+            return stats
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='labels') as pool:
+            for change, (requests_sent, ok) in zip(changes, pool.map(self._apply_one, changes)):
+                stats['requests'] += requests_sent
+                change.applied = ok
+                if ok:
+                    stats['pages'] += 1
+                    stats['added'] += len(change.add)
+                    stats['removed'] += len(change.remove)
+                else:
+                    stats['failed'] += 1
+        return stats
+
+    def _apply_one(self, change: LabelChangeDTO) -> Tuple[int, bool]:
+        """Add the missing labels in one request, then remove the stale ones (returns requests sent, success)"""
+        requests_sent = 0
+        try:
+            if change.add:
+                response = self.session.post(
+                    f"{self.api_url}/{change.page_id}/label",
+                    json=[{'prefix': 'global', 'name': label} for label in change.add],
+                    timeout=30
+                )
+                requests_sent += 1
+                if response.status_code != 200:
+                    print(f"   ⚠️  Could not add labels to '{change.title}': {response.status_code}")
+                    return requests_sent, False
+            for label in change.remove:
+                response = self.session.delete(
+                    f"{self.api_url}/{change.page_id}/label",
+                    params={'name': label},
+                    timeout=30
+                )
+                requests_sent += 1
+                if response.status_code not in (200, 204, 404):  # 404: already gone
+                    print(f"   ⚠️  Could not remove label '{label}' from '{change.title}': {response.status_code}")
+                    return requests_sent, False
+        except Exception as e:
+            print(f"   ⚠️  Could not sync labels of '{change.title}': {str(e)}")
+            return requests_sent, False
+        return requests_sent, True
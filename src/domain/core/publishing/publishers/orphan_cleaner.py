@@ -0,0 +1,120 @@
+"""
+OrphanCleaner - Archives or deletes published pages that are no longer in the spec
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence
+import requests
+from src.domain.core.publishing.dtos.publish_plan_dto import PlannedPageDTO
+
+
+class OrphanCleaner:
+    """
+    Reconciles the page tree with the published page set
+
+    Orphans are the plan's deletes: pages this publisher wrote (content hash
+    property or manifest record) under the API root that no page node
+    claims any more - endpoints and tags removed from the spec. Pages
+    created by hand are never touched.
+
+    Pages are removed deepest first (Confluence moves the children of a
+    removed page up a level), each level in concurrent batches:
+    - archive: one bulk archive request per batch (Confluence Cloud)
+    - delete: one DELETE per page (moves it to the space trash)
+
+    When there are more orphans than max_pages nothing is removed - a spec
+    that lost most of its endpoints is more likely a broken spec than a
+    cleanup.
+    """
+
+    ACTIONS = ('report', 'archive', 'delete')
+    ARCHIVE_BATCH_SIZE = 100
+
+    def __init__(self, session: requests.Session, api_url: str, action: str = 'report',
+                 max_pages: int = 50, max_workers: int = 4):
+        """
+        Args:
+            session: Shared (rate limited) Confluence session
+            api_url: Content REST endpoint ({base}/rest/api/content)
+            action: report (list only), archive or delete
+            max_pages: Safety cap - more orphans than this and nothing is removed (0: no cap)
+            max_workers: Concurrent batches
+        """
+        if action not in self.ACTIONS:
+            raise ValueError(f"Unsupported orphan action: {action} (expected one of {', '.join(self.ACTIONS)})")
+        self.session = session
+        self.api_url = api_url
+        self.action = action
+        self.max_pages = max_pages
+        self.max_workers = max(1, max_workers)
+
+    def exceeds_cap(self, orphans: Sequence[PlannedPageDTO]) -> bool:
+        """True when the safety cap blocks the cleanup"""
+        return 0 < self.max_pages < len(orphans)
+
+    @staticmethod
+    def levels(orphans: Sequence[PlannedPageDTO]) -> List[List[PlannedPageDTO]]:
+        """Orphans grouped by depth within the orphan set, deepest level first"""
+        by_id = {orphan.page_id: orphan for orphan in orphans}
+
+        def depth(orphan: PlannedPageDTO) -> int:
+            levels, parent_id, seen = 0, (orphan.existing or {}).get('parent_id'), {orphan.page_id}
+            while parent_id in by_id and parent_id not in seen:
+                seen.add(parent_id)
+                levels += 1
+                parent_id = (by_id[parent_id].existing or {}).get('parent_id')
+            return levels
+
+        grouped: Dict[int, List[PlannedPageDTO]] = {}
+        for orphan in orphans:
+            grouped.setdefault(depth(orphan), []).append(orphan)
+        return [grouped[level] for level in sorted(grouped, reverse=True)]
+
+    def clean(self, orphans: Sequence[PlannedPageDTO]) -> Dict[str, List[PlannedPageDTO]]:
+        """
+        Remove the orphans (nothing happens for report, or when the safety cap is exceeded)
+
+        Returns:
+            dict: 'removed' and 'failed' orphans
+        """
+        outcome = {'removed': [], 'failed': []}
+        if self.action == 'report' or not orphans or self.exceeds_cap(orphans):
+            return outcome
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='cleanup') as pool:
+            for level in self.levels(orphans):
+                if self.action == 'archive':
+                    batches = [level[start:start + self.ARCHIVE_BATCH_SIZE]
+                               for start in range(0, len(level), self.ARCHIVE_BATCH_SIZE)]
+                    results = pool.map(self._archive, batches)
+                else:
+                    batches = [[orphan] for orphan in level]
+                    results = pool.map(self._delete, level)
+                for batch, removed in zip(batches, results):
+                    outcome['removed' if removed else 'failed'].extend(batch)
+        return outcome
+
+    def _archive(self, batch: List[PlannedPageDTO]) -> bool:
+        """Archive a batch of pages with one request (runs asynchronously on the server)"""
+        try:
+            response = self.session.post(
+                f"{self.api_url}/archive",
+                json={'pages': [{'id': int(orphan.page_id)} for orphan in batch]},
+                timeout=30
+            )
+            if response.status_code in (200, 202):
+                return True
+            print(f"   ❌ Error archiving {len(batch)} pages: {response.status_code} {response.text[:200]}")
+        except Exception as e:
+            print(f"   ❌ Exception archiving {len(batch)} pages: {str(e)}")
+        return False
+
+    def _delete(self, orphan: PlannedPageDTO) -> bool:
+        """Delete one page (moved to the space trash)"""
+        try:
+            response = self.session.delete(f"{self.api_url}/{orphan.page_id}", timeout=30)
+            if response.status_code in (200, 204, 404):  # 404: already gone
+                return True
+            print(f"   ❌ Error deleting '{orphan.title}': {response.status_code}")
+        except Exception as e:
+            print(f"   ❌ Exception deleting '{orphan.title}': {str(e)}")
+        return False
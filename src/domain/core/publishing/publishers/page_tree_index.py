@@ -0,0 +1,157 @@
+"""
+PageTreeIndex - In-memory index of the existing Confluence pages under the API root
+"""
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class PageTreeIndex:
+    """
+    (title, parent id) -> page lookup built from one bulk descendant query
+
+    Loaded once per publish run from a paginated CQL search under the root
+    page, so deciding between create and update costs a dict lookup instead
+    of a title search plus one ancestor fetch per match. Pages created or
+    updated during the run are added back, keeping versions current for
+    later writes. Thread safe (scheduler workers read and write it).
+
+    Each entry also carries the content hash property written with the page
+    (hash of its body only - labels are synced by LabelSynchronizer), so
+    unchanged pages can be skipped without a request. The property also lists
+    the labels the publisher applied (managed_labels): only those are ever
+    removed when the spec drops them.
+    The property records the page version it was written for - a page edited
+    by hand since then has a newer version and its hash no longer counts.
+
+    An index loaded from the local manifest only knows the pages published
+    from this machine (complete=False): misses must still be looked up.
+    """
+
+    # Content property holding the hash of the published body and the labels applied with it
+    HASH_PROPERTY = 'swagger-publisher-hash'
+
+    def __init__(self, complete: bool = True):
+        """Initialize an empty index (complete: every existing page is known, a miss means create)"""
+        self.complete = complete
+        self._pages: Dict[Tuple[str, Optional[str]], Dict] = {}
+        self._by_title: Dict[str, Tuple[str, Optional[str]]] = {}  # Titles are unique per space
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.requests = 0  # Network requests spent loading the index
+
+    @staticmethod
+    def parent_of(page: Dict) -> Optional[str]:
+        """Immediate parent id of a page expanded with ancestors"""
+        ancestors = page.get('ancestors') or []
+        return ancestors[-1].get('id') if ancestors else None
+
+    @classmethod
+    def hash_property_of(cls, page: Dict) -> Optional[Dict]:
+        """Content hash property of a page expanded with metadata.properties (None when absent)"""
+        properties = (page.get('metadata') or {}).get('properties') or {}
+        return properties.get(cls.HASH_PROPERTY)
+
+    @classmethod
+    def entry_of(cls, page: Dict) -> Dict:
+        """Index entry of a page as returned by the REST API (id, title, version, content hash, labels)"""
+        entry = {
+            'id': page['id'],
+            'title': page.get('title'),
+            'version': {'number': (page.get('version') or {}).get('number', 1)},
+            'content_hash': None,
+            'hash_version': 0  # Version of the hash property (0: not written yet)
+        }
+        hash_property = cls.hash_property_of(page)
+        if 'ancestors' in page:
+            entry['parent_id'] = cls.parent_of(page)
+        labels = ((page.get('metadata') or {}).get('labels') or {}).get('results')
+        if labels is not None:
+            entry['labels'] = [label['name'] for label in labels]  # Only when expanded (metadata.labels)
+        if hash_property:
+            value = hash_property.get('value') or {}
+            entry['hash_version'] = (hash_property.get('version') or {}).get('number', 1)
+            if value.get('labels') is not None:
+                entry['managed_labels'] = value['labels']  # Applied by earlier publishes
+            # Edited by hand since the hash was written: the body no longer matches it
+            if value.get('page_version') in (None, entry['version']['number']):
+                entry['content_hash'] = value.get('hash')
+        return entry
+
+    def add(self, page: Dict, parent_id: Optional[str], content_hash: Optional[str] = None) -> Dict:
+        """
+        Record a page (as returned by the REST API) under a parent
+
+        content_hash: hash just written with the page (otherwise read from its expanded property)
+
+        Returns:
+            dict: The index entry
+        """
+        entry = self.entry_of(page)
+        if content_hash is not None:
+            entry['content_hash'] = content_hash
+            entry['hash_version'] = max(entry['hash_version'], self._known_hash_version(entry['title'], parent_id)) + 1
+        self.put(entry, parent_id)
+        return entry
+
+    def put(self, entry: Dict, parent_id: Optional[str]):
+        """Record an index entry as is (e.g. from the local manifest)"""
+        key = (entry['title'], parent_id)
+        entry['parent_id'] = parent_id
+        with self._lock:
+            # A title lives under one parent only - drop the entry of a moved page
+            previous = self._by_title.get(entry['title'])
+            if previous is not None and previous != key:
+                self._pages.pop(previous, None)
+            self._pages[key] = entry
+            self._by_title[entry['title']] = key
+
+    def _known_hash_version(self, title: str, parent_id: Optional[str]) -> int:
+        """Hash property version recorded for a page so far (under its previous parent when moved)"""
+        with self._lock:
+            known = self._pages.get((title, parent_id)) or self._pages.get(self._by_title.get(title))
+            return known['hash_version'] if known else 0
+
+    def load(self, pages: Iterable[Dict]):
+        """Index pages expanded with ancestors (bulk descendant query results)"""
+        for page in pages:
+            self.add(page, self.parent_of(page))
+
+    def find(self, title: str, parent_id: Optional[str]) -> Optional[Dict]:
+        """Existing page with this title under this parent (None: create it)"""
+        with self._lock:
+            page = self._pages.get((title, parent_id))
+            if page is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return page
+
+    def peek(self, title: str, parent_id: Optional[str]) -> Optional[Dict]:
+        """Like find() without counting (planning)"""
+        with self._lock:
+            return self._pages.get((title, parent_id))
+
+    def peek_title(self, title: str) -> Optional[Dict]:
+        """Page with this title under any parent (titles are unique per space)"""
+        with self._lock:
+            key = self._by_title.get(title)
+            return self._pages.get(key) if key is not None else None
+
+    def entries(self) -> List[Dict]:
+        """All indexed pages"""
+        with self._lock:
+            return list(self._pages.values())
+
+    def __len__(self) -> int:
+        """Number of indexed pages"""
+        return len(self._pages)
+
+    def stats(self) -> dict:
+        """Lookup counters for reporting"""
+        return {
+            'pages': len(self._pages),
+            'hits': self.hits,
+            'misses': self.misses,
+            'requests': self.requests
+        }
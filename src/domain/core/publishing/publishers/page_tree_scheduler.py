@@ -0,0 +1,90 @@
+"""
+PageTreeScheduler - Dependency-aware concurrent publishing of a page tree
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from src.domain.core.publishing.dtos.page_node_dto import PageNodeDTO
+
+# Publishes one node under a parent page id, returns the page (None on failure)
+PublishNodeFn = Callable[[PageNodeDTO, Optional[str]], Optional[Dict]]
+
+
+class PageTreeScheduler:
+    """
+    Publishes a page tree with a bounded worker pool
+
+    A page needs its parent's id, but siblings never depend on each other:
+    as soon as a parent is created all its children are dispatched at once,
+    up to max_workers requests in flight. Children of a failed parent are
+    skipped (or moved up a level when the node asks for it).
+
+    Completion order varies between runs, so results are keyed by node and
+    callers read them back in node order - the outcome is deterministic.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize with the number of concurrent page requests"""
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+
+    def run(
+        self,
+        nodes: Sequence[PageNodeDTO],
+        publish_node: PublishNodeFn,
+        root_parent_id: Optional[str] = None
+    ) -> Tuple[Dict[str, Optional[Dict]], List[PageNodeDTO]]:
+        """
+        Publish every node, parents first
+
+        Args:
+            nodes: Pages in document order (parents listed before their children)
+            publish_node: Creates/updates one page under a parent id
+            root_parent_id: Parent id of the top-level nodes
+
+        Returns:
+            Tuple: (page per node key - None when it failed, nodes skipped because an ancestor failed)
+        """
+        children: Dict[Optional[str], List[PageNodeDTO]] = {}
+        for node in nodes:
+            children.setdefault(node.parent_key, []).append(node)
+
+        results: Dict[str, Optional[Dict]] = {}
+        skipped: List[PageNodeDTO] = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='publish') as pool:
+            pending: Dict[Future, Tuple[PageNodeDTO, Optional[str]]] = {}
+
+            def dispatch(parent_key: Optional[str], parent_id: Optional[str]):
+                for child in children.get(parent_key, []):
+                    pending[pool.submit(publish_node, child, parent_id)] = (child, parent_id)
+
+            dispatch(None, root_parent_id)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                # Handle completions in submission order so dispatching stays deterministic
+                for future in [future for future in pending if future in done]:
+                    node, parent_id = pending.pop(future)
+                    try:
+                        page = future.result()
+                    except Exception as e:
+                        print(f"   ❌ Exception publishing '{node.title}': {str(e)}")
+                        page = None
+                    results[node.key] = page
+
+                    if page:
+                        dispatch(node.key, page['id'])
+                    elif node.reparent_on_failure:
+                        dispatch(node.key, parent_id)
+                    else:
+                        skipped.extend(self._descendants(node.key, children))
+
+        return results, skipped
+
+    @staticmethod
+    def _descendants(key: str, children: Dict[Optional[str], List[PageNodeDTO]]) -> List[PageNodeDTO]:
+        """All nodes below a node, in document order"""
+        found = []
+        for child in children.get(key, []):
+            found.append(child)
+            found.extend(PageTreeScheduler._descendants(child.key, children))
+        return found
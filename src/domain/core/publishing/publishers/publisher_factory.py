@@ -1,6 +1,7 @@
 """
 PublisherFactory - Factory to get appropriate publisher
 """
+from typing import Callable, Optional
 from src.domain.core.publishing.contracts.publisher_contract import PublisherContract
 from src.domain.core.publishing.publishers.confluence_preview_publisher import ConfluencePreviewPublisher
 from src.domain.core.publishing.publishers.confluence_publisher import ConfluencePublisher
@@ -10,13 +11,22 @@ class PublisherFactory:
     """Factory for getting publishers"""
 
     @staticmethod
-    def get_publisher(publisher_type: str, mode: str = 'preview') -> PublisherContract:
+    def get_publisher(
+        publisher_type: str,
+        mode: str = 'preview',
+        on_preview_ready: Optional[Callable[[str], None]] = None,
+        dry_run: bool = False,
+        resume: bool = False
+    ) -> PublisherContract:
         """
         Get publisher by type and mode
 
         Args:
             publisher_type: Type of publisher (confluence, github-pages, etc.)
             mode: 'preview' for local preview or 'publish' for real publication
+            on_preview_ready: Preview only - called with the index.html path once the shell is written
+            dry_run: Publish only - plan the publish without writing to Confluence
+            resume: Publish only - continue the last unfinished publish run of the API
 
         Returns:
             Publisher: Appropriate publisher
@@ -26,9 +36,9 @@ class PublisherFactory:
         """
         if publisher_type.lower() == 'confluence':
             if mode == 'publish':
-                return ConfluencePublisher()  # Real Confluence publisher
+                return ConfluencePublisher(dry_run=dry_run, resume=resume)  # Real Confluence publisher
             else:
-                return ConfluencePreviewPublisher()  # Preview mode (default)
+                return ConfluencePreviewPublisher(on_shell_ready=on_preview_ready)  # Preview mode (default)
 
         raise ValueError(f"Unsupported publisher type: {publisher_type}")
 
@@ -1,7 +1,11 @@
 """Rendering feature - Render documentation"""
 from src.domain.core.rendering.renderers.html_renderer import HtmlRenderer
+from src.domain.core.rendering.builders.endpoint_view_builder import EndpointViewBuilder
 from src.domain.core.rendering.dtos.render_options_dto import RenderOptionsDTO
 from src.domain.core.rendering.dtos.rendered_document_dto import RenderedDocumentDTO
+from src.domain.core.rendering.dtos.endpoint_view_dto import EndpointViewDTO, TagViewDTO
+from src.domain.core.rendering.dtos.document_view_dto import DocumentViewDTO
+from src.domain.core.rendering.dtos.variant_base_dto import VariantBaseDTO
 
-__all__ = ['HtmlRenderer', 'RenderOptionsDTO', 'RenderedDocumentDTO']
-
+__all__ = ['HtmlRenderer', 'EndpointViewBuilder', 'RenderOptionsDTO', 'RenderedDocumentDTO',
+           'EndpointViewDTO', 'TagViewDTO', 'DocumentViewDTO', 'VariantBaseDTO']
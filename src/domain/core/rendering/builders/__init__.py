@@ -0,0 +1,5 @@
+"""Rendering builders"""
+from src.domain.core.rendering.builders.endpoint_view_builder import EndpointViewBuilder
+from src.domain.core.rendering.builders.search_index_builder import SearchIndexBuilder
+
+__all__ = ['EndpointViewBuilder', 'SearchIndexBuilder']
@@ -0,0 +1,543 @@
+"""
+EndpointViewBuilder - Precompute endpoint view models from the domain model
+"""
+import copy
+import hashlib
+import json
+from dataclasses import asdict, fields, is_dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from src.domain.models.api_specification_model import ApiSpecificationModel
+from src.domain.models.operation_model import OperationModel
+from src.domain.models.schema_model import SchemaModel
+from src.domain.core.rendering.dtos.endpoint_view_dto import (
+    EndpointViewDTO, EndpointSignatureDTO, TagViewDTO, ModelViewDTO, SecurityRowDTO, ParameterRowDTO, ContentRowDTO,
+    ExampleDTO, RequestBodyViewDTO, ResponseViewDTO, PropertyRowDTO, SchemaSectionDTO
+)
+from src.domain.core.rendering.dtos.document_view_dto import DocumentViewDTO
+from src.domain.utils.example_generator_utils import ExampleGeneratorUtils
+
+
+class EndpointViewBuilder:
+    """
+    Builds template-ready endpoint views once, in Python
+
+    All the logic that used to live in the endpoint templates (ref splitting,
+    schema closure, security rows, examples, cURL) is computed here so that
+    preview and server templates become simple loops over immutable data.
+    """
+
+    DEFAULT_BASE_URL = "https://api.example.com"
+    BODY_METHODS = ('post', 'put', 'patch')
+
+    def __init__(
+        self,
+        spec: ApiSpecificationModel,
+        shared_schemas: bool = False,
+        include_examples: bool = True,
+        include_schemas: bool = True,
+        syntax_highlight: bool = True,
+        include_toc: bool = True
+    ):
+        """
+        Initialize builder for a specification
+
+        Args:
+            spec: API specification
+            shared_schemas: Link to a models page instead of inlining schemas
+            include_examples: Build JSON examples and cURL (skipped entirely when False)
+            include_schemas: Build schema reference sections (skipped entirely when False)
+            syntax_highlight: Code blocks carry their language
+            include_toc: Overview lists the tags for navigation
+        """
+        self.spec = spec
+        self.shared_schemas = shared_schemas
+        self.include_examples = include_examples
+        self.include_schemas = include_schemas
+        self.syntax_highlight = syntax_highlight
+        self.include_toc = include_toc
+        self.schemas: Dict[str, SchemaModel] = {}
+        if spec.components and spec.components.schemas:
+            self.schemas = spec.components.schemas
+        self.example_generator = ExampleGeneratorUtils(self.schemas)
+        self.base_url = spec.servers[0].url if spec.servers else self.DEFAULT_BASE_URL
+
+        # Security rows are the same for every endpoint - compute once
+        self.security_rows = self._build_security_rows()
+
+        # Fingerprint support: spec-level context + memoized schema hashes
+        self._context_hash = self._make_context_hash()
+        self._schema_hashes: Dict[str, str] = {}
+        self._schema_refs: Dict[str, Set[str]] = {}
+        self._operation_hashes: Dict[int, str] = {}  # id(operation) -> content hash
+        self._examples: Dict[int, str] = {}  # id(media object) -> example JSON
+
+    @classmethod
+    def from_options(cls, spec: ApiSpecificationModel, options) -> 'EndpointViewBuilder':
+        """Create a builder honoring the section flags of RenderOptionsDTO"""
+        return cls(
+            spec,
+            shared_schemas=(options.schema_mode == 'shared'),
+            include_examples=options.include_examples,
+            include_schemas=options.include_schemas,
+            syntax_highlight=options.syntax_highlight,
+            include_toc=options.include_toc
+        )
+
+    def with_options(self, options) -> 'EndpointViewBuilder':
+        """
+        Sibling builder for other section flags
+
+        The option-independent work (security rows, schema hashes and closures,
+        generated examples) is shared with this builder instead of recomputed.
+        """
+        sibling = copy.copy(self)
+        sibling.shared_schemas = options.schema_mode == 'shared'
+        sibling.include_examples = options.include_examples
+        sibling.include_schemas = options.include_schemas
+        sibling.syntax_highlight = options.syntax_highlight
+        sibling.include_toc = options.include_toc
+        sibling._context_hash = sibling._make_context_hash()
+        return sibling
+
+    def build_document(self) -> DocumentViewDTO:
+        """Build the format-neutral document (built once, emitted as preview HTML or storage XML)"""
+        return self.document_from(self.build_all())
+
+    def document_from(self, tag_views: Tuple[TagViewDTO, ...]) -> DocumentViewDTO:
+        """Document around tag views that are already built (e.g. tag by tag with iter_tag_views)"""
+        return DocumentViewDTO(
+            api=self.spec,
+            tag_views=tag_views,
+            models=self.build_models(tag_views),
+            shared_schemas=self.shared_schemas,
+            include_toc=self.include_toc
+        )
+
+    def build_models(self, tag_views: Tuple[TagViewDTO, ...]) -> Tuple[ModelViewDTO, ...]:
+        """Collect each schema referenced by any endpoint once, in first-use order"""
+        sections: Dict[str, SchemaSectionDTO] = {}
+        used_by: Dict[str, Dict[str, None]] = {}  # Ordered sets of endpoint labels
+        for tag_view in tag_views:
+            for endpoint in tag_view.endpoints:
+                label = f"{endpoint.method_upper} {endpoint.path}"
+                for schema in endpoint.schemas:
+                    sections.setdefault(schema.name, schema)
+                    used_by.setdefault(schema.name, {})[label] = None
+        return tuple(
+            ModelViewDTO(
+                name=name,
+                description=section.description,
+                properties=section.properties,
+                used_by=tuple(used_by[name])
+            )
+            for name, section in sections.items()
+        )
+
+    def build_all(self) -> Tuple[TagViewDTO, ...]:
+        """Build views for every endpoint, grouped by tag in document order"""
+        return tuple(self.iter_tag_views())
+
+    def iter_tag_views(self) -> Iterator[TagViewDTO]:
+        """Build the views tag by tag, in document order (each tag is built when it is requested)"""
+        for tag in self.spec.tags:
+            endpoints = tuple(
+                self.build(tag.name, path, method, operation)
+                for path, method, operation in self._tag_operations(tag.name)
+            )
+            yield TagViewDTO(name=tag.name, description=tag.description, endpoints=endpoints)
+
+    def build_signatures(self) -> Tuple[TagViewDTO, ...]:
+        """Tags with endpoint signatures only (method, path, anchor) - enough for the sidebar and page files"""
+        return tuple(
+            TagViewDTO(
+                name=tag.name,
+                description=tag.description,
+                endpoints=tuple(
+                    EndpointSignatureDTO(tag=tag.name, method=method, path=path,
+                                         anchor=self.make_anchor(tag.name, method, path))
+                    for path, method, _ in self._tag_operations(tag.name)
+                )
+            )
+            for tag in self.spec.tags
+        )
+
+    def _tag_operations(self, tag_name: str) -> Iterator[Tuple[str, str, OperationModel]]:
+        """(path, method, operation) of every operation listed under a tag, in document order"""
+        for path, path_item in self.spec.paths.items():
+            for method, operation in path_item.operations.items():
+                if tag_name in operation.tags:
+                    yield path, method, operation
+
+    def build(self, tag_name: str, path: str, method: str, operation: OperationModel) -> EndpointViewDTO:
+        """Build the view of a single endpoint"""
+        request_body = self._build_request_body(operation)
+        return EndpointViewDTO(
+            tag=tag_name,
+            method=method,
+            path=path,
+            anchor=self.make_anchor(tag_name, method, path),
+            summary=operation.summary,
+            description=operation.description,
+            operation_id=operation.operation_id,
+            requires_auth=bool(operation.security or self.spec.security),
+            security=self.security_rows,
+            parameters=self._build_parameters(operation),
+            request_body=request_body,
+            responses=self._build_responses(operation),
+            curl=self._build_curl(path, method, operation, request_body) if self.include_examples else '',
+            schemas=self._build_schema_sections(operation) if self.include_schemas else (),
+            fingerprint=self.fingerprint(tag_name, path, method, operation),
+            shared_schemas=self.shared_schemas,
+            syntax_highlight=self.syntax_highlight
+        )
+
+    def fingerprint(self, tag_name: str, path: str, method: str, operation: OperationModel) -> str:
+        """
+        Content hash of everything an endpoint view depends on: the operation,
+        every component schema it references (transitively) and the spec context
+        """
+        digest = hashlib.sha256()
+        digest.update(self._context_hash.encode('utf-8'))
+        digest.update(f"{tag_name}\x00{method}\x00{path}\x00".encode('utf-8'))
+        digest.update(self._operation_hash(operation).encode('utf-8'))
+
+        # Referenced schema contents only reach the output through examples and schema sections
+        if self.include_examples or self.include_schemas:
+            for schema_name in sorted(self._schema_closure(self._operation_refs(operation))):
+                digest.update(f"{schema_name}={self._schema_hash(schema_name)};".encode('utf-8'))
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_anchor(tag_name: str, method: str, path: str) -> str:
+        """Create the anchor id of an endpoint (e.g. pet-GET--pet-petId)"""
+        raw = f"{tag_name}-{method}-{path}"
+        return raw.replace('/', '-').replace('{', '').replace('}', '')
+
+    @staticmethod
+    def ref_name(ref: str) -> str:
+        """Extract model name from ref (e.g., "#/components/schemas/Pet" -> "Pet")"""
+        return ref.split('/')[-1]
+
+    def _make_context_hash(self) -> str:
+        """Hash of the spec-level context and section flags every endpoint view depends on"""
+        return self._hash_text(json.dumps(
+            [self.base_url, bool(self.spec.security), [asdict(row) for row in self.security_rows],
+             self.shared_schemas, self.include_examples, self.include_schemas, self.syntax_highlight],
+            sort_keys=True, default=str
+        ))
+
+    @staticmethod
+    def _hash_text(text: str) -> str:
+        """SHA-256 of a text"""
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _hash_model(cls, model) -> str:
+        """
+        SHA-256 of a domain model's JSON form
+
+        Same text as json.dumps(asdict(model)), but nested dataclasses are
+        serialized straight from their fields instead of being deep-copied first.
+        """
+        return cls._hash_text(json.dumps(model, sort_keys=True, default=cls._json_default))
+
+    @staticmethod
+    def _json_default(value):
+        """JSON fallback: dataclasses by their fields, anything else as text"""
+        if is_dataclass(value) and not isinstance(value, type):
+            return {field.name: getattr(value, field.name) for field in fields(value)}
+        return str(value)
+
+    def _operation_hash(self, operation: OperationModel) -> str:
+        """Memoized content hash of an operation"""
+        operation_hash = self._operation_hashes.get(id(operation))
+        if operation_hash is None:
+            operation_hash = self._hash_model(operation)
+            self._operation_hashes[id(operation)] = operation_hash
+        return operation_hash
+
+    def _schema_hash(self, schema_name: str) -> str:
+        """Memoized content hash of a component schema"""
+        if schema_name not in self._schema_hashes:
+            schema = self.schemas.get(schema_name)
+            if schema is None:
+                self._schema_hashes[schema_name] = 'missing'
+            else:
+                self._schema_hashes[schema_name] = self._hash_model(schema)
+        return self._schema_hashes[schema_name]
+
+    def _schema_closure(self, names: Set[str]) -> Set[str]:
+        """All component schemas reachable from the given names"""
+        closure = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name in closure:
+                continue
+            closure.add(name)
+            if name not in self._schema_refs:
+                refs = set()
+                schema = self.schemas.get(name)
+                if schema is not None:
+                    self._collect_refs(schema, refs)
+                self._schema_refs[name] = refs
+            pending.extend(self._schema_refs[name] - closure)
+        return closure
+
+    def _operation_refs(self, operation: OperationModel) -> Set[str]:
+        """Schema names referenced directly by an operation"""
+        refs = set()
+        for param in operation.parameters or []:
+            self._collect_refs(param.schema, refs)
+        if operation.request_body:
+            for media_obj in operation.request_body.content.values():
+                self._collect_refs(media_obj.schema, refs)
+        for response in (operation.responses or {}).values():
+            for media_obj in (response.content or {}).values():
+                self._collect_refs(media_obj.schema, refs)
+        return refs
+
+    def _collect_refs(self, schema: Optional[SchemaModel], refs: Set[str]):
+        """Collect schema names referenced anywhere inside an inline schema"""
+        if schema is None:
+            return
+        if schema.ref:
+            refs.add(self.ref_name(schema.ref))
+        for prop in (schema.properties or {}).values():
+            self._collect_refs(prop, refs)
+        self._collect_refs(schema.items, refs)
+        self._collect_refs(schema.additional_properties, refs)
+        for composed in (schema.all_of or []) + (schema.one_of or []) + (schema.any_of or []):
+            self._collect_refs(composed, refs)
+
+    def _build_security_rows(self) -> Tuple[SecurityRowDTO, ...]:
+        """Build security rows from the security schemes of the specification"""
+        if not (self.spec.components and self.spec.components.security_schemes):
+            return ()
+
+        rows = []
+        for scheme_name, scheme in self.spec.components.security_schemes.items():
+            rows.append(SecurityRowDTO(
+                name=scheme_name,
+                type=scheme.type,
+                scheme=(scheme.scheme or 'bearer') if scheme.type == 'http' else None,
+                header_name=(scheme.name or 'X-API-Key') if scheme.type == 'apiKey' else None,
+                location=(scheme.location or 'header') if scheme.type == 'apiKey' else None,
+                description=scheme.description
+            ))
+        return tuple(rows)
+
+    def _build_parameters(self, operation: OperationModel) -> Tuple[ParameterRowDTO, ...]:
+        """Build the parameters table"""
+        rows = []
+        for param in operation.parameters or []:
+            is_model = False
+            if param.schema is None:
+                type_label = 'string'
+            elif param.schema.ref:
+                type_label = self.ref_name(param.schema.ref)
+                is_model = True
+            else:
+                type_label = param.schema.type or 'object'
+
+            rows.append(ParameterRowDTO(
+                name=param.name,
+                location=param.location,
+                type_label=type_label,
+                is_model=is_model,
+                required=param.required,
+                description=param.description
+            ))
+        return tuple(rows)
+
+    def _schema_label(self, schema: Optional[SchemaModel], missing: str) -> Tuple[str, bool]:
+        """Get display label of a content schema and whether it names a model"""
+        if schema is None:
+            return missing, False
+        if schema.ref:
+            return self.ref_name(schema.ref), True
+        if schema.type == 'array' and schema.items:
+            if schema.items.ref:
+                return f"array[{self.ref_name(schema.items.ref)}]", True
+            return f"array[{schema.items.type or 'object'}]", False
+        return schema.type or 'object', False
+
+    def _build_contents(self, content: dict, missing: str) -> Tuple[Tuple[ContentRowDTO, ...], Tuple[ExampleDTO, ...]]:
+        """Build content rows and JSON examples for a media type map"""
+        rows = []
+        examples = []
+        for content_type, media_obj in content.items():
+            label, is_model = self._schema_label(media_obj.schema, missing)
+            rows.append(ContentRowDTO(
+                content_type=content_type,
+                schema_label=label,
+                is_model=is_model,
+                has_schema=media_obj.schema is not None
+            ))
+            if self.include_examples and 'json' in content_type:
+                examples.append(ExampleDTO(content_type=content_type, json=self._example_json(media_obj)))
+        return tuple(rows), tuple(examples)
+
+    def _example_json(self, media_obj) -> str:
+        """Pretty JSON example of a media type (explicit example first, then generated) - memoized"""
+        example = self._examples.get(id(media_obj))
+        if example is None:
+            if media_obj.example:
+                example = json.dumps(media_obj.example, indent=2, ensure_ascii=False)
+            elif media_obj.schema:
+                example = self.example_generator.generate_example_json(media_obj.schema)
+            else:
+                example = '{}'
+            self._examples[id(media_obj)] = example
+        return example
+
+    def _build_request_body(self, operation: OperationModel) -> Optional[RequestBodyViewDTO]:
+        """Build the request body section"""
+        request_body = operation.request_body
+        if not request_body:
+            return None
+
+        contents, examples = self._build_contents(request_body.content, missing='object')
+        return RequestBodyViewDTO(
+            description=request_body.description,
+            required=request_body.required,
+            contents=contents,
+            examples=examples
+        )
+
+    def _build_responses(self, operation: OperationModel) -> Tuple[ResponseViewDTO, ...]:
+        """Build the responses section"""
+        views = []
+        for status, response in (operation.responses or {}).items():
+            if status.startswith('2'):
+                status_kind = 'success'
+            elif status.startswith('4'):
+                status_kind = 'warning'
+            else:
+                status_kind = 'error'
+
+            contents, examples = self._build_contents(response.content or {}, missing='-')
+            views.append(ResponseViewDTO(
+                status=status,
+                status_kind=status_kind,
+                description=response.description,
+                contents=contents,
+                examples=examples
+            ))
+        return tuple(views)
+
+    def _build_curl(
+        self,
+        path: str,
+        method: str,
+        operation: OperationModel,
+        request_body: Optional[RequestBodyViewDTO]
+    ) -> str:
+        """Build the cURL example (reuses the request body examples already generated)"""
+        first_line = f"curl -X {method.upper()} '{self.base_url}{path}'"
+        for param in operation.parameters or []:
+            if param.location == 'path':
+                first_line += f" # Replace {param.name}"
+
+        curl_lines = [first_line, "  -H 'Accept: application/json'"]
+
+        if method.lower() in self.BODY_METHODS:
+            curl_lines.append("  -H 'Content-Type: application/json'")
+            if request_body:
+                examples = {example.content_type: example.json for example in request_body.examples}
+                for content_type, media_obj in operation.request_body.content.items():
+                    if 'json' not in content_type:
+                        continue
+                    if media_obj.example or media_obj.schema:
+                        body = examples[content_type].replace("'", "\\'")
+                    else:
+                        body = '{"key": "value"}'
+                    curl_lines.append(f"  -d '{body}'")
+
+        return " \\\n".join(curl_lines)
+
+    def _build_schema_sections(self, operation: OperationModel) -> Tuple[SchemaSectionDTO, ...]:
+        """
+        Build the Complete Schema Reference: top-level request/response schemas
+        plus every component schema reachable from their properties
+        """
+        # name -> (source, origin, is_array) in discovery order
+        pending: Dict[str, Tuple[str, str, bool]] = {}
+
+        def collect(schema: Optional[SchemaModel], source: str, origin: str):
+            if not schema:
+                return
+            if schema.ref:
+                pending.setdefault(self.ref_name(schema.ref), (source, origin, False))
+            elif schema.type == 'array' and schema.items and schema.items.ref:
+                pending.setdefault(self.ref_name(schema.items.ref), (source, origin, True))
+
+        if operation.request_body:
+            for media_obj in operation.request_body.content.values():
+                collect(media_obj.schema, 'Request Body', 'request')
+
+        for status, response in (operation.responses or {}).items():
+            for media_obj in (response.content or {}).values():
+                collect(media_obj.schema, f"Response {status}", 'response')
+
+        sections: List[SchemaSectionDTO] = []
+        queue = list(pending)
+        index = 0
+        while index < len(queue):
+            schema_name = queue[index]
+            index += 1
+            schema = self.schemas.get(schema_name)
+            if schema is None:
+                continue
+
+            source, origin, is_array = pending[schema_name]
+            properties = []
+            for prop_name, prop in (schema.properties or {}).items():
+                row = self._build_property_row(schema, prop_name, prop)
+                properties.append(row)
+                if row.ref_name and row.ref_name not in pending:
+                    pending[row.ref_name] = (f"{schema_name}.{prop_name}", 'nested', row.is_array)
+                    queue.append(row.ref_name)
+
+            sections.append(SchemaSectionDTO(
+                name=schema_name,
+                source=source,
+                origin=origin,
+                is_array=is_array,
+                description=schema.description,
+                properties=tuple(properties)
+            ))
+
+        return tuple(sections)
+
+    def _build_property_row(self, schema: SchemaModel, prop_name: str, prop: SchemaModel) -> PropertyRowDTO:
+        """Build one property row of a schema table"""
+        ref_name = None
+        is_array = False
+        prop_format = None
+        if prop.ref:
+            ref_name = self.ref_name(prop.ref)
+            type_label = ref_name
+        elif prop.type == 'array' and prop.items:
+            is_array = True
+            if prop.items.ref:
+                ref_name = self.ref_name(prop.items.ref)
+                type_label = f"array[{ref_name}]"
+            else:
+                type_label = f"array[{prop.items.type or 'object'}]"
+        else:
+            type_label = prop.type or 'object'
+            prop_format = prop.format
+
+        return PropertyRowDTO(
+            name=prop_name,
+            type_label=type_label,
+            ref_name=ref_name,
+            is_array=is_array,
+            format=prop_format,
+            required=prop_name in (schema.required or []),
+            description=prop.description,
+            allowed_values=', '.join(str(value) for value in prop.enum) if prop.enum else None,
+            default=str(prop.default) if prop.default else None
+        )
@@ -0,0 +1,93 @@
+"""
+SearchIndexBuilder - Precomputed inverted index for the preview search box
+"""
+import json
+import re
+from typing import Dict, Iterable, List, Set
+from src.domain.core.rendering.dtos.document_view_dto import DocumentViewDTO
+from src.domain.core.rendering.dtos.endpoint_view_dto import EndpointViewDTO
+
+
+class SearchIndexBuilder:
+    """
+    Builds a compact inverted index over the endpoint pages at render time
+
+    Indexed: paths, operationIds, summaries, parameter names and the names of
+    schemas/properties each endpoint references. The browser only does a
+    binary search over the sorted term list (prefix range) and merges the
+    posting lists - no text is scanned at query time.
+
+    Index layout (JSON):
+        {"docs": [[page_id, method, path, summary], ...],
+         "terms": ["id", "order", "pet", ...],   # sorted
+         "postings": [[0, 3], [1], [0, 1, 2], ...]}  # doc ids per term
+    """
+
+    ASSET_NAME = "search-index.js"
+    MIN_TERM_LENGTH = 2
+
+    # Split on non-alphanumerics, then on camelCase / digit boundaries
+    _SEPARATORS = re.compile(r'[^0-9A-Za-z]+')
+    _CAMEL_CASE = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+
+    def __init__(self, document_view: DocumentViewDTO):
+        """Initialize builder for a document view"""
+        self.document_view = document_view
+
+    @classmethod
+    def tokenize(cls, text: str) -> Set[str]:
+        """Lower-case terms of a text: whole words plus their camelCase parts"""
+        terms = set()
+        if not text:
+            return terms
+        for word in cls._SEPARATORS.split(text):
+            if not word:
+                continue
+            terms.add(word.lower())
+            for part in cls._CAMEL_CASE.findall(word):
+                terms.add(part.lower())
+        return {term for term in terms if len(term) >= cls.MIN_TERM_LENGTH}
+
+    def build(self) -> dict:
+        """Build the index as a JSON-serializable dictionary"""
+        docs = []
+        postings: Dict[str, List[int]] = {}
+        for tag_view in self.document_view.tag_views:
+            for endpoint in tag_view.endpoints:
+                doc_id = len(docs)
+                docs.append([
+                    f"endpoint-{endpoint.anchor}",
+                    endpoint.method_upper,
+                    endpoint.path,
+                    endpoint.summary or ''
+                ])
+                for term in self._endpoint_terms(endpoint):
+                    postings.setdefault(term, []).append(doc_id)
+
+        terms = sorted(postings)
+        return {
+            'docs': docs,
+            'terms': terms,
+            'postings': [postings[term] for term in terms]
+        }
+
+    def build_asset(self) -> str:
+        """Index as a script asset (loads from file:// where fetching JSON is blocked)"""
+        index_json = json.dumps(self.build(), ensure_ascii=False, separators=(',', ':'))
+        return f"window.PREVIEW_SEARCH_INDEX = {index_json};\n"
+
+    def _endpoint_terms(self, endpoint: EndpointViewDTO) -> Set[str]:
+        """All terms an endpoint can be found by"""
+        texts: List[Iterable[str]] = [
+            (endpoint.path, endpoint.operation_id or '', endpoint.summary or '', endpoint.method, endpoint.tag),
+            (param.name for param in endpoint.parameters),
+        ]
+        for schema in endpoint.schemas:
+            texts.append((schema.name,))
+            texts.append(prop.name for prop in schema.properties)
+
+        terms = set()
+        for group in texts:
+            for text in group:
+                terms |= self.tokenize(text)
+        return terms
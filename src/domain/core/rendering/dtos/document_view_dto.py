@@ -0,0 +1,22 @@
+"""
+DocumentView - Format-neutral document built once per specification
+"""
+from dataclasses import dataclass
+from typing import Tuple
+from src.domain.models.api_specification_model import ApiSpecificationModel
+from src.domain.core.rendering.dtos.endpoint_view_dto import ModelViewDTO, TagViewDTO
+
+
+@dataclass(frozen=True)
+class DocumentViewDTO:
+    """Specification plus precomputed tag/endpoint views, shared by the preview and storage emitters"""
+    api: ApiSpecificationModel
+    tag_views: Tuple[TagViewDTO, ...] = ()
+    models: Tuple[ModelViewDTO, ...] = ()  # Each referenced component schema once (shared schema mode)
+    shared_schemas: bool = False  # Endpoints link to the models page instead of inlining schemas
+    include_toc: bool = True  # Overview/root page lists the tags for navigation
+
+    @property
+    def endpoint_count(self) -> int:
+        """Total number of endpoint views"""
+        return sum(len(tag_view.endpoints) for tag_view in self.tag_views)
@@ -0,0 +1,160 @@
+"""
+EndpointView - Precomputed, template-ready view of a single endpoint
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class SecurityRowDTO:
+    """One security scheme row shown in the authentication block"""
+    name: str
+    type: str
+    scheme: Optional[str] = None  # For http (defaults to bearer)
+    header_name: Optional[str] = None  # For apiKey
+    location: Optional[str] = None  # For apiKey
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ParameterRowDTO:
+    """One row of the parameters table"""
+    name: str
+    location: str
+    type_label: str
+    is_model: bool  # True when type_label is a component schema name
+    required: bool
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ContentRowDTO:
+    """One media type row of a request/response content table"""
+    content_type: str
+    schema_label: str
+    is_model: bool  # True when schema_label names a component schema
+    has_schema: bool
+
+
+@dataclass(frozen=True)
+class ExampleDTO:
+    """JSON example for a media type"""
+    content_type: str
+    json: str
+
+    @property
+    def is_empty(self) -> bool:
+        """True when the example carries no useful content"""
+        return self.json.strip() in ('{}', '""', 'null', '')
+
+
+@dataclass(frozen=True)
+class RequestBodyViewDTO:
+    """Request body section"""
+    description: Optional[str]
+    required: bool
+    contents: Tuple[ContentRowDTO, ...] = ()
+    examples: Tuple[ExampleDTO, ...] = ()
+
+
+@dataclass(frozen=True)
+class ResponseViewDTO:
+    """One response status section"""
+    status: str
+    status_kind: str  # success, warning or error
+    description: str
+    contents: Tuple[ContentRowDTO, ...] = ()
+    examples: Tuple[ExampleDTO, ...] = ()
+
+
+@dataclass(frozen=True)
+class PropertyRowDTO:
+    """One property row of a schema reference table"""
+    name: str
+    type_label: str
+    ref_name: Optional[str]  # Referenced schema name (direct or array item)
+    is_array: bool
+    format: Optional[str]
+    required: bool
+    description: Optional[str]
+    allowed_values: Optional[str] = None
+    default: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class SchemaSectionDTO:
+    """A schema displayed in the Complete Schema Reference of an endpoint"""
+    name: str
+    source: str  # Where the schema is used (Request Body, Response 200, Pet.category...)
+    origin: str  # request, response or nested
+    is_array: bool
+    description: Optional[str]
+    properties: Tuple[PropertyRowDTO, ...] = ()
+
+
+@dataclass(frozen=True)
+class ModelViewDTO:
+    """A component schema rendered once on the shared models page"""
+    name: str
+    description: Optional[str]
+    properties: Tuple[PropertyRowDTO, ...] = ()
+    used_by: Tuple[str, ...] = ()  # Endpoints referencing it (e.g. GET /pet/{petId})
+
+
+@dataclass(frozen=True)
+class EndpointViewDTO:
+    """Flat, immutable view of one endpoint shared by preview and server templates"""
+    tag: str
+    method: str
+    path: str
+    anchor: str  # Unique id used for page anchors (tag-method-path, sanitized)
+    summary: Optional[str]
+    description: Optional[str]
+    operation_id: Optional[str]
+    requires_auth: bool
+    security: Tuple[SecurityRowDTO, ...]
+    parameters: Tuple[ParameterRowDTO, ...]
+    request_body: Optional[RequestBodyViewDTO]
+    responses: Tuple[ResponseViewDTO, ...]
+    curl: str  # Empty when examples are disabled
+    schemas: Tuple[SchemaSectionDTO, ...]
+    fingerprint: str = ''  # Content hash of the operation, referenced schemas and spec context
+    shared_schemas: bool = False  # Schemas are rendered once on a shared models page (link instead of inline)
+    syntax_highlight: bool = True  # Code blocks carry their language (json/bash)
+
+    @property
+    def method_lower(self) -> str:
+        """HTTP method in lower case"""
+        return self.method.lower()
+
+    @property
+    def method_upper(self) -> str:
+        """HTTP method in upper case"""
+        return self.method.upper()
+
+
+@dataclass(frozen=True)
+class EndpointSignatureDTO:
+    """What the sidebar shows of an endpoint (method, path, anchor) - known before its view is built"""
+    tag: str
+    method: str
+    path: str
+    anchor: str
+
+    @property
+    def method_lower(self) -> str:
+        """HTTP method in lower case"""
+        return self.method.lower()
+
+    @property
+    def method_upper(self) -> str:
+        """HTTP method in upper case"""
+        return self.method.upper()
+
+
+@dataclass(frozen=True)
+class TagViewDTO:
+    """Tag with the endpoints that belong to it, in document order"""
+    name: str
+    description: Optional[str]
+    endpoints: Tuple[Union[EndpointViewDTO, EndpointSignatureDTO], ...] = ()  # Signatures: progressive shell only
@@ -4,18 +4,63 @@ RenderOptions - Configuration for rendering
 from dataclasses import dataclass
 from typing import Optional
 
+# Preset overrides: skeleton keeps navigation and endpoint signatures only
+# (no examples, cURL, schema reference or search index) for fast smoke previews
+PRESETS = {
+    'full': {},
+    'skeleton': {
+        'include_examples': False,
+        'include_schemas': False,
+        'syntax_highlight': False,
+        'include_search': False
+    }
+}
+
+# Options that change the bytes of endpoint/tag fragments (part of the fragment
+# cache key). Everything else is rendering strategy, asset post-processing or
+# the shell/variant layer (theme, locale, toc, search), which fragments share.
+# A new option that changes fragment output must be added here.
+FRAGMENT_OPTION_FIELDS = ('schema_mode', 'include_examples', 'include_schemas', 'syntax_highlight')
+
 
 @dataclass
 class RenderOptionsDTO:
     """Options for rendering documentation"""
     theme: str = "light"
     locale: str = "en-US"
-    include_toc: bool = True
-    include_examples: bool = True
-    include_schemas: bool = True
-    syntax_highlight: bool = True
+    include_toc: bool = True  # Tag navigation list on the overview/root page
+    include_examples: bool = True  # JSON request/response examples and cURL blocks
+    include_schemas: bool = True  # Complete Schema Reference / Data Models
+    syntax_highlight: bool = True  # Language-tagged code blocks (plain blocks when False)
+    schema_mode: str = "inline"  # inline (full schema reference per endpoint) or shared (models page, endpoints link)
+    include_search: bool = True  # Prebuilt search index + sidebar search box (preview)
     responsive: bool = True
+    asset_mode: str = "inline"  # inline (CSS/JS embedded) or external (minified, content-hashed asset files + collapsed HTML)
+
+    # Rendering strategy
+    render_mode: str = "single"  # single (one template pass) or fragments (per endpoint/tag, worker pool)
+    max_workers: Optional[int] = None  # Worker processes for fragment mode (default: CPU count)
+    streaming: bool = False  # Produce the HTML as a lazy chunk stream instead of one string
+    layout: str = "single"  # single (one HTML file), multipage (shell + one file per endpoint) or auto
+    progressive: bool = False  # Multipage shell written first, pages picked up by the shell as they are written
+    emit_html: bool = True  # False: only build the document view (publishers that emit their own format)
 
+    def fragment_values(self) -> dict:
+        """Options that change fragment bytes (see FRAGMENT_OPTION_FIELDS), for fragment cache keys"""
+        return {field: getattr(self, field) for field in FRAGMENT_OPTION_FIELDS}
 
+    def view_key(self) -> tuple:
+        """Options that change the document view (variants sharing it share examples, schemas and fragments)"""
+        return (self.schema_mode, self.include_examples, self.include_schemas, self.syntax_highlight)
 
+    @classmethod
+    def from_preset(cls, preset: str = 'full', **overrides) -> 'RenderOptionsDTO':
+        """Create options from a named preset (full or skeleton), explicit values win"""
+        if preset not in PRESETS:
+            raise ValueError(f"Unknown render preset: {preset} (expected one of: {', '.join(PRESETS)})")
+        return cls(**{**PRESETS[preset], **overrides})
 
+    @classmethod
+    def skeleton(cls, **overrides) -> 'RenderOptionsDTO':
+        """Navigation + endpoint signatures only (fast smoke previews of huge specs in CI)"""
+        return cls.from_preset('skeleton', **overrides)
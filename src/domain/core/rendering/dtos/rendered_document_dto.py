@@ -2,23 +2,40 @@
 RenderedDocument - DTO for rendered documentation
 """
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Tuple
+from src.domain.core.rendering.dtos.document_view_dto import DocumentViewDTO
 
 
 @dataclass
 class RenderedDocumentDTO:
     """Rendered documentation output"""
-    html_content: str
+    html_content: Optional[str] = None
+    html_stream: Optional[Iterator[str]] = None  # Lazily rendered HTML chunks (streaming mode)
     xml_content: Optional[str] = None
     css_content: Optional[str] = None
     assets: Dict[str, str] = field(default_factory=dict)  # filename -> content
     metadata: Dict[str, str] = field(default_factory=dict)
+    document_view: Optional[DocumentViewDTO] = None  # Format-neutral views reused by other emitters
+    pages: Optional[Iterator[Tuple[str, str]]] = None  # (relative path, content) of on-demand pages (multipage layout)
 
     def __post_init__(self):
         """Validate required fields"""
-        if not self.html_content:
-            raise ValueError("RenderedDocument.html_content is required")
-
+        if not self.html_content and self.html_stream is None and self.document_view is None:
+            raise ValueError("RenderedDocument.html_content, html_stream or document_view is required")
 
+    @property
+    def has_html(self) -> bool:
+        """True when HTML was rendered (string or stream)"""
+        return bool(self.html_content) or self.html_stream is not None
 
+    @property
+    def is_streaming(self) -> bool:
+        """True when the HTML is produced as a chunk stream"""
+        return self.html_stream is not None
 
+    def iter_html(self) -> Iterator[str]:
+        """Iterate the HTML in chunks (the stream can only be consumed once)"""
+        if self.html_stream is not None:
+            yield from self.html_stream
+        elif self.html_content:
+            yield self.html_content
@@ -0,0 +1,16 @@
+"""
+VariantBase - Option-independent work shared by rendering variants
+"""
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+from src.domain.core.rendering.dtos.document_view_dto import DocumentViewDTO
+
+
+@dataclass
+class VariantBaseDTO:
+    """Document view plus the fragments every variant (theme, locale, layout...) stitches into its own shell"""
+    document_view: DocumentViewDTO
+    folder_fragments: List[str] = field(default_factory=list)  # Sidebar folder per tag
+    endpoint_fragments: List[List[str]] = field(default_factory=list)  # Endpoint pages per tag
+    schema_table: Any = None  # SchemaTableRenderer memo shared by the variants
+    search_index: Optional[str] = None  # search-index.js asset (built by the first variant that needs it)
@@ -0,0 +1,173 @@
+"""
+FragmentRenderer - Renders endpoint pages and tag folders as independent fragments
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+from jinja2 import Environment
+from src.domain.core.rendering.dtos.endpoint_view_dto import EndpointViewDTO, TagViewDTO
+from src.domain.core.rendering.renderers.schema_table_renderer import SchemaTableRenderer
+from src.domain.utils.fragment_cache_utils import FragmentCacheUtils
+
+ENDPOINT_TEMPLATE = 'partials/_endpoint.html.j2'
+TAG_FOLDER_TEMPLATE = 'partials/_tag_folder.html.j2'
+SCHEMA_TABLE_TEMPLATE = 'partials/_schema_table.html.j2'
+
+# Per-process template environment and schema table memo (created once by the pool initializer)
+_worker_env: Optional[Environment] = None
+_worker_schema_table: Optional[SchemaTableRenderer] = None
+
+
+def _init_worker(templates_dir: str):
+    """Create the Jinja2 environment once per worker process"""
+    global _worker_env, _worker_schema_table
+    from src.domain.core.rendering.renderers.html_renderer import HtmlRenderer
+    _worker_env = HtmlRenderer.create_environment(Path(templates_dir))
+    _worker_schema_table = SchemaTableRenderer(_worker_env, SCHEMA_TABLE_TEMPLATE)
+
+
+def _render_fragment(template_name: str, var_name: str, value) -> Tuple[str, int, int]:
+    """Render one fragment inside a worker process (returns schema table hit/miss deltas too)"""
+    hits, misses = _worker_schema_table.hits, _worker_schema_table.misses
+    fragment = _worker_env.get_template(template_name).render({
+        var_name: value,
+        'schema_table': _worker_schema_table
+    })
+    return fragment, _worker_schema_table.hits - hits, _worker_schema_table.misses - misses
+
+
+class FragmentRenderer:
+    """
+    Renders each endpoint page and each sidebar tag folder independently
+
+    Fragments are rendered in a process pool (Jinja2 rendering is CPU bound)
+    and returned in document order, so stitching them into the page skeleton
+    produces exactly the same bytes as a single template pass. Endpoint pages
+    can also be consumed one by one (multi-page preview layout).
+    """
+
+    # Below this number of fragments the pool startup costs more than it saves
+    MIN_PARALLEL_FRAGMENTS = 64
+
+    def __init__(
+        self,
+        env: Environment,
+        templates_dir: Path,
+        max_workers: Optional[int] = None,
+        schema_table: Optional[SchemaTableRenderer] = None
+    ):
+        """Initialize with the renderer environment, worker count and the run's schema table memo"""
+        self.env = env
+        self.templates_dir = Path(templates_dir)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.schema_table = schema_table
+
+    def render(
+        self,
+        tag_views: Sequence[TagViewDTO],
+        cache: Optional[FragmentCacheUtils] = None,
+        options_key: str = ''
+    ) -> Tuple[List[str], List[List[str]]]:
+        """
+        Render all fragments
+
+        Args:
+            tag_views: Precomputed tag/endpoint views
+            cache: Optional persistent cache - unchanged endpoints are served from it
+            options_key: Render options representation (part of the cache key)
+
+        Returns:
+            Tuple: (folder fragments per tag, endpoint fragments per tag)
+        """
+        # Tag folders are small (one per tag) - always rendered in process
+        folder_fragments = self._render_serial(TAG_FOLDER_TEMPLATE, 'tag_view', tag_views)
+        flat_fragments = [fragment for _, fragment in self.iter_endpoints(tag_views, cache, options_key)]
+
+        # Regroup endpoint fragments by tag (same order as tag_views)
+        endpoint_fragments = []
+        position = 0
+        for tag_view in tag_views:
+            count = len(tag_view.endpoints)
+            endpoint_fragments.append(flat_fragments[position:position + count])
+            position += count
+
+        return folder_fragments, endpoint_fragments
+
+    def iter_endpoints(
+        self,
+        tag_views: Sequence[TagViewDTO],
+        cache: Optional[FragmentCacheUtils] = None,
+        options_key: str = ''
+    ) -> Iterator[Tuple[EndpointViewDTO, str]]:
+        """
+        Yield (endpoint, fragment) pairs in document order as they become available
+
+        Unchanged endpoints are served from the cache; the rest are rendered
+        (in the worker pool when there are enough of them) and yielded as soon
+        as each one is ready, so callers can write them out incrementally.
+        """
+        endpoints = [endpoint for tag_view in tag_views for endpoint in tag_view.endpoints]
+
+        # Serve unchanged endpoints from the cache, render only the rest
+        cache_keys: List[Optional[str]] = [None] * len(endpoints)
+        cached: List[Optional[str]] = [None] * len(endpoints)
+        if cache is not None:
+            template_version = FragmentCacheUtils.template_version(self.env, ENDPOINT_TEMPLATE)
+            for index, endpoint in enumerate(endpoints):
+                cache_keys[index] = FragmentCacheUtils.make_key(
+                    'preview', endpoint.fingerprint, template_version, options_key
+                )
+                cached[index] = cache.get(cache_keys[index])
+        to_render = [endpoint for endpoint, fragment in zip(endpoints, cached) if fragment is None]
+
+        rendered = self._iter_rendered(ENDPOINT_TEMPLATE, 'endpoint', to_render)
+        for endpoint, key, fragment in zip(endpoints, cache_keys, cached):
+            if fragment is None:
+                fragment = next(rendered)
+                if cache is not None:
+                    cache.put(key, fragment)
+            yield endpoint, fragment
+
+        if cache is not None:
+            cache.flush()
+
+    def _iter_rendered(self, template_name: str, var_name: str, values: Sequence) -> Iterator[str]:
+        """Render fragments lazily, in process or in the pool, preserving input order"""
+        if self.max_workers <= 1 or len(values) < self.MIN_PARALLEL_FRAGMENTS:
+            template = self.env.get_template(template_name)
+            for value in values:
+                yield template.render({var_name: value, 'schema_table': self.schema_table})
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(str(self.templates_dir),)
+        ) as pool:
+            yield from self._render_parallel(pool, template_name, var_name, values)
+
+    def _render_serial(self, template_name: str, var_name: str, values: Sequence) -> List[str]:
+        """Render fragments in the current process"""
+        template = self.env.get_template(template_name)
+        return [template.render({var_name: value, 'schema_table': self.schema_table}) for value in values]
+
+    def _render_parallel(self, pool: ProcessPoolExecutor, template_name: str, var_name: str, values: Sequence) -> Iterator[str]:
+        """Render fragments in the pool - map() keeps input order and yields results as they complete"""
+        if not values:
+            return
+        chunksize = max(1, len(values) // (self.max_workers * 4))
+        results = pool.map(
+            _render_fragment,
+            repeat(template_name),
+            repeat(var_name),
+            values,
+            chunksize=chunksize
+        )
+        for fragment, hits, misses in results:
+            # Workers keep their own memo - fold their counters into the run's
+            if self.schema_table is not None:
+                self.schema_table.hits += hits
+                self.schema_table.misses += misses
+            yield fragment
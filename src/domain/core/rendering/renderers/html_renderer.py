@@ -2,20 +2,47 @@
 HtmlRenderer - Renders API documentation as HTML
 """
 import json
+import re
+from dataclasses import replace
 from jinja2 import Environment, FileSystemLoader
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from src.domain.models.api_specification_model import ApiSpecificationModel
 from src.domain.core.rendering.contracts.renderer_contract import RendererContract
 from src.domain.core.rendering.dtos.render_options_dto import RenderOptionsDTO
 from src.domain.core.rendering.dtos.rendered_document_dto import RenderedDocumentDTO
-from src.domain.utils.example_generator_utils import ExampleGeneratorUtils
+from src.domain.core.rendering.dtos.document_view_dto import DocumentViewDTO
+from src.domain.core.rendering.dtos.variant_base_dto import VariantBaseDTO
+from src.domain.core.rendering.builders.endpoint_view_builder import EndpointViewBuilder
+from src.domain.core.rendering.builders.search_index_builder import SearchIndexBuilder
+from src.domain.core.rendering.renderers.fragment_renderer import FragmentRenderer, SCHEMA_TABLE_TEMPLATE
+from src.domain.core.rendering.renderers.schema_table_renderer import SchemaTableRenderer
+from src.domain.utils.asset_utils import AssetUtils
+from src.domain.utils.fragment_cache_utils import FragmentCacheUtils
 
 
 class HtmlRenderer(RendererContract):
     """Renders API documentation as responsive HTML"""
 
-    def __init__(self, templates_dir: str = None):
-        """Initialize renderer with templates directory"""
+    # Layout 'auto' switches to one file per endpoint above this many endpoints
+    MULTIPAGE_THRESHOLD = 200
+    PAGES_DIR = "pages"
+    ASSETS_DIR = "assets"
+
+    # External asset mode (options.asset_mode == 'external')
+    CSS_ASSET_NAME = "confluence-preview.css"
+    SCRIPT_ASSET_NAME = "preview.js"
+    SCRIPT_TEMPLATE = "partials/scripts.js.j2"
+
+    # Progressive preview: the shared Data Models page is a page file too (page-schemas)
+    MODELS_PAGE_ID = "schemas"
+    MODELS_TEMPLATE = "partials/_models.html.j2"
+
+    # Stylesheets per (templates dir, minified) - loaded once per process
+    _css_cache: Dict[Tuple[str, bool], str] = {}
+
+    def __init__(self, templates_dir: str = None, fragment_cache: FragmentCacheUtils = None):
+        """Initialize renderer with templates directory and optional persistent fragment cache"""
         if templates_dir is None:
             # Default to src/infrastructure/repository/templates/confluence/preview
             src_dir = Path(__file__).parent.parent.parent.parent.parent  # Go up to src/
@@ -24,34 +51,213 @@ class HtmlRenderer(RendererContract):
         self.templates_dir = Path(templates_dir)
         if not self.templates_dir.exists():
             raise FileNotFoundError(f"Templates directory not found: {self.templates_dir}")
-        self.env = Environment(loader=FileSystemLoader(str(self.templates_dir)))
+        self.env = self.create_environment(self.templates_dir)
+        self.fragment_cache = fragment_cache
+
+    @staticmethod
+    def create_environment(templates_dir: Path) -> Environment:
+        """Create the Jinja2 environment (also used by fragment worker processes)"""
+        env = Environment(loader=FileSystemLoader(str(templates_dir)))
 
         # Add custom filters
-        self.env.filters['tojson_pretty'] = lambda x: json.dumps(x, indent=2, ensure_ascii=False) if x else '{}'
+        env.filters['tojson_pretty'] = lambda x: json.dumps(x, indent=2, ensure_ascii=False) if x else '{}'
+        return env
 
     def render(self, spec: ApiSpecificationModel, options: RenderOptionsDTO = None) -> RenderedDocumentDTO:
         """Render API specification to HTML (Confluence preview)"""
         if options is None:
             options = RenderOptionsDTO()
 
-        # Create example generator with available schemas
-        schemas = {}
-        if spec.components and spec.components.schemas:
-            schemas = spec.components.schemas
-        example_generator = ExampleGeneratorUtils(schemas)
-
-        # Load Confluence-specific CSS
-        css_path = self.templates_dir / "confluence-preview.css"
-        css_content = ""
-        if css_path.exists():
-            with open(css_path, 'r', encoding='utf-8') as f:
-                css_content = f.read()
-        else:
-            # Fallback to old styles.css if new one doesn't exist
-            fallback_css = self.templates_dir / "styles.css"
-            if fallback_css.exists():
-                with open(fallback_css, 'r', encoding='utf-8') as f:
-                    css_content = f.read()
+        # Precompute endpoint views (schemas, security, examples, cURL) once;
+        # sections disabled in the options are never built
+        builder = EndpointViewBuilder.from_options(spec, options)
+        if options.progressive and options.emit_html:
+            # Shell first: it only needs the endpoint signatures - views are built as pages are written
+            return self._render_progressive(builder, options)
+        return self.render_view(builder.build_document(), options)
+
+    def render_variants(
+        self,
+        spec: ApiSpecificationModel,
+        variants: Sequence[RenderOptionsDTO],
+        max_workers: Optional[int] = None
+    ) -> List[RenderedDocumentDTO]:
+        """
+        Render several option sets (themes, locales, layouts...) in one batch
+
+        The option-independent work is done once and shared: endpoint views
+        (examples, schema closures, cURL) once per distinct set of section
+        flags, endpoint/tag fragments and the search index once per document
+        view. Each variant then only renders its own shell around them.
+
+        Args:
+            spec: API specification
+            variants: One RenderOptionsDTO per output
+            max_workers: Worker processes for the shared fragment rendering
+                (default: each variant's max_workers; 1 renders in process)
+
+        Returns:
+            List[RenderedDocumentDTO]: One document per variant, in input order
+        """
+        builder = None
+        views: Dict[tuple, DocumentViewDTO] = {}
+        bases: Dict[tuple, VariantBaseDTO] = {}
+        documents = []
+        for options in variants:
+            key = options.view_key()
+            if key not in views:
+                builder = EndpointViewBuilder.from_options(spec, options) if builder is None \
+                    else builder.with_options(options)
+                views[key] = builder.build_document()
+
+            # include_toc only affects the overview - no need for another view
+            document_view = views[key]
+            if document_view.include_toc != options.include_toc:
+                document_view = replace(document_view, include_toc=options.include_toc)
+
+            # Fragments are only needed by variants that emit preview HTML
+            base = None
+            if options.emit_html:
+                base = bases.get(key)
+                if base is None:
+                    base = self._build_variant_base(views[key], options, max_workers)
+                    bases[key] = base
+            documents.append(self.render_view(document_view, options, base=base))
+        return documents
+
+    def render_view(
+        self,
+        document_view: DocumentViewDTO,
+        options: RenderOptionsDTO = None,
+        base: Optional[VariantBaseDTO] = None
+    ) -> RenderedDocumentDTO:
+        """Emit preview HTML from an already built document view (base: fragments shared by a batch)"""
+        if options is None:
+            options = RenderOptionsDTO()
+
+        spec = document_view.api
+        tag_views = document_view.tag_views
+        metadata = {
+            'title': spec.info.title,
+            'version': spec.info.version,
+            'format': 'confluence-preview'
+        }
+
+        # View only: the publisher emits its own format from the document view
+        if not options.emit_html:
+            metadata['format'] = 'document-view'
+            return RenderedDocumentDTO(document_view=document_view, metadata=metadata)
+
+        external_assets = options.asset_mode == 'external'
+        multipage = self.resolve_layout(document_view, options) == 'multipage'
+
+        # Schema property tables are rendered once per schema in this run (or batch)
+        schema_table = base.schema_table if base is not None else SchemaTableRenderer(self.env, SCHEMA_TABLE_TEMPLATE)
+        metadata['schema_tables'] = schema_table
+
+        # Fragment mode: render endpoint pages and tag folders independently
+        # (worker pool) and let the template stitch them in document order.
+        # Always used with a fragment cache so unchanged endpoints are reused.
+        folder_fragments, endpoint_fragments = None, None
+        page_files, pages = None, None
+        if multipage:
+            # Multi-page layout: the shell only holds the overview and the sidebar,
+            # endpoint pages are separate files loaded on demand by the browser
+            page_files = self._page_files(tag_views)
+            if base is not None:
+                pages = self._iter_base_pages(tag_views, page_files, base, external_assets)
+            else:
+                pages = self._iter_pages(tag_views, page_files, options, schema_table)
+        elif base is not None:
+            # Batch variant: fragments were rendered once for every variant of this view
+            folder_fragments, endpoint_fragments = base.folder_fragments, base.endpoint_fragments
+        elif options.render_mode == 'fragments' or self.fragment_cache is not None:
+            fragment_renderer = FragmentRenderer(self.env, self.templates_dir, options.max_workers, schema_table)
+            folder_fragments, endpoint_fragments = fragment_renderer.render(
+                tag_views,
+                cache=self.fragment_cache,
+                options_key=FragmentCacheUtils.options_key(options)
+            )
+
+        # Search index asset (queried in the browser, see scripts.html.j2)
+        assets = {}
+        search_index_src = None
+        if options.include_search:
+            if base is None:
+                search_index = SearchIndexBuilder(document_view).build_asset()
+            else:
+                if base.search_index is None:
+                    base.search_index = SearchIndexBuilder(document_view).build_asset()
+                search_index = base.search_index
+            search_index_src = self._add_asset(assets, SearchIndexBuilder.ASSET_NAME, search_index, external_assets)
+
+        context = {
+            'tag_views': tag_views,
+            'folder_fragments': folder_fragments,
+            'endpoint_fragments': endpoint_fragments,
+            'page_files': page_files,
+            'progressive': multipage and options.progressive,
+            'models': document_view.models if document_view.shared_schemas else (),
+            'search_index_src': search_index_src,
+            'schema_table': schema_table
+        }
+        return self._render_shell(spec, options, context, assets, metadata, pages, document_view)
+
+    def _render_progressive(self, builder: EndpointViewBuilder, options: RenderOptionsDTO) -> RenderedDocumentDTO:
+        """
+        Emit the multipage shell from endpoint signatures, with lazily built pages
+
+        The shell (sidebar, overview, page file map) is ready without building
+        a single endpoint view. Views are built tag by tag while the publisher
+        writes the page files; the shared Data Models page and the search
+        index need every view, so they are written last (the shell retries
+        files that do not exist yet).
+        """
+        spec = builder.spec
+        metadata = {
+            'title': spec.info.title,
+            'version': spec.info.version,
+            'format': 'confluence-preview'
+        }
+        schema_table = SchemaTableRenderer(self.env, SCHEMA_TABLE_TEMPLATE)
+        metadata['schema_tables'] = schema_table
+
+        signature_views = builder.build_signatures()
+        page_files = self._page_files(signature_views)
+        has_models = builder.shared_schemas and builder.include_schemas and bool(builder.schemas)
+        if has_models:
+            page_files[self.MODELS_PAGE_ID] = f"{self.PAGES_DIR}/{self.MODELS_PAGE_ID}.js"
+        # Not content-hashed: the shell names the file before the index exists
+        search_index_src = f"{self.ASSETS_DIR}/{SearchIndexBuilder.ASSET_NAME}" if options.include_search else None
+
+        context = {
+            'tag_views': signature_views,
+            'folder_fragments': None,
+            'endpoint_fragments': None,
+            'page_files': page_files,
+            'progressive': True,
+            'models': (),
+            'has_models': has_models,
+            'search_index_src': search_index_src,
+            'schema_table': schema_table
+        }
+        pages = self._iter_progressive_pages(builder, page_files, options, schema_table, search_index_src)
+        return self._render_shell(spec, options, context, {}, metadata, pages)
+
+    def _render_shell(
+        self,
+        spec: ApiSpecificationModel,
+        options: RenderOptionsDTO,
+        context: Dict,
+        assets: Dict[str, str],
+        metadata: Dict,
+        pages: Optional[Iterator[Tuple[str, str]]] = None,
+        document_view: Optional[DocumentViewDTO] = None
+    ) -> RenderedDocumentDTO:
+        """Render the preview shell (context: fragments, page files and search index of the layout)"""
+        # Confluence-specific CSS (read once per process)
+        external_assets = options.asset_mode == 'external'
+        css_content = self._load_css(minified=external_assets)
 
         # Load Confluence preview template
         template_name = 'confluence-preview.html.j2'
@@ -61,26 +267,185 @@ class HtmlRenderer(RendererContract):
 
         template = self.env.get_template(template_name)
 
-        # Render HTML with Confluence-specific data
-        html_content = template.render(
+        context = dict(
+            context,
             api=spec,
             css_content=css_content,
             options=options,
-            space_key='DDS',  # Using configured space key
-            example_generator=example_generator,
-            schemas=schemas
+            space_key='DDS'  # Using configured space key
         )
 
+        # External asset mode: CSS and navigation script become minified,
+        # content-hashed files referenced by the shell (styles.css is not duplicated)
+        if external_assets:
+            context['css_href'] = self._add_asset(assets, self.CSS_ASSET_NAME, css_content, True)
+            script = AssetUtils.minify_js(self.env.get_template(self.SCRIPT_TEMPLATE).render(context))
+            context['script_src'] = self._add_asset(assets, self.SCRIPT_ASSET_NAME, script, True)
+            css_content = None
+
+        # Streaming mode: hand out a lazy chunk generator so the publisher can
+        # write the document to disk without ever holding it as one string
+        html_content, html_stream = None, None
+        if options.streaming:
+            html_stream = template.generate(context)
+            if external_assets:
+                html_stream = AssetUtils.iter_collapsed(html_stream)
+        else:
+            html_content = template.render(context)
+            if external_assets:
+                html_content = AssetUtils.collapse_whitespace(html_content)
+
         return RenderedDocumentDTO(
             html_content=html_content,
+            html_stream=html_stream,
             css_content=css_content,
-            metadata={
-                'title': spec.info.title,
-                'version': spec.info.version,
-                'format': 'confluence-preview'
-            }
+            assets=assets,
+            metadata=metadata,
+            document_view=document_view,
+            pages=pages
+        )
+
+    def _build_variant_base(
+        self,
+        document_view: DocumentViewDTO,
+        options: RenderOptionsDTO,
+        max_workers: Optional[int]
+    ) -> VariantBaseDTO:
+        """Render the fragments shared by every variant of a document view"""
+        schema_table = SchemaTableRenderer(self.env, SCHEMA_TABLE_TEMPLATE)
+        fragment_renderer = FragmentRenderer(
+            self.env, self.templates_dir, max_workers or options.max_workers, schema_table
+        )
+        folder_fragments, endpoint_fragments = fragment_renderer.render(
+            document_view.tag_views,
+            cache=self.fragment_cache,
+            options_key=FragmentCacheUtils.options_key(options)
+        )
+        return VariantBaseDTO(
+            document_view=document_view,
+            folder_fragments=folder_fragments,
+            endpoint_fragments=endpoint_fragments,
+            schema_table=schema_table
         )
 
+    def _load_css(self, minified: bool = False) -> str:
+        """Preview stylesheet, read from disk (and minified) once per process"""
+        key = (str(self.templates_dir), minified)
+        css_content = self._css_cache.get(key)
+        if css_content is None:
+            css_content = ""
+            css_path = self.templates_dir / "confluence-preview.css"
+            if not css_path.exists():
+                # Fallback to old styles.css if new one doesn't exist
+                css_path = self.templates_dir / "styles.css"
+            if css_path.exists():
+                with open(css_path, 'r', encoding='utf-8') as f:
+                    css_content = f.read()
+            if minified:
+                css_content = AssetUtils.minify_css(css_content)
+            self._css_cache[key] = css_content
+        return css_content
+
+    def _add_asset(self, assets: Dict[str, str], name: str, content: str, hashed: bool) -> str:
+        """Register an asset (content-hashed name in external mode) and return its path from the shell"""
+        if hashed:
+            name = AssetUtils.hashed_name(name, content)
+        assets[name] = content
+        return f"{self.ASSETS_DIR}/{name}"
+
+    def resolve_layout(self, document_view: DocumentViewDTO, options: RenderOptionsDTO) -> str:
+        """Resolve the preview layout ('auto' picks multipage for large APIs, progressive always needs it)"""
+        if options.progressive:
+            return 'multipage'
+        if options.layout == 'auto':
+            return 'multipage' if document_view.endpoint_count > self.MULTIPAGE_THRESHOLD else 'single'
+        return options.layout
+
+    def _page_files(self, tag_views) -> Dict[str, str]:
+        """Map each endpoint page id to its file (relative to the shell)"""
+        page_files = {}
+        used = set()
+        for tag_view in tag_views:
+            for endpoint in tag_view.endpoints:
+                name = re.sub(r'[^A-Za-z0-9_-]', '_', endpoint.anchor)
+                if name in used:
+                    name = f"{name}_{len(used)}"
+                used.add(name)
+                page_files[f"endpoint-{endpoint.anchor}"] = f"{self.PAGES_DIR}/{name}.js"
+        return page_files
+
+    def _iter_pages(
+        self,
+        tag_views,
+        page_files: Dict[str, str],
+        options: RenderOptionsDTO,
+        schema_table: SchemaTableRenderer
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (relative path, content) for each endpoint page as it is rendered
+
+        Pages are script files that hand their HTML to the shell
+        (previewPageLoaded), which works from file:// where fetch() does not.
+        """
+        fragment_renderer = FragmentRenderer(self.env, self.templates_dir, options.max_workers, schema_table)
+        for endpoint, fragment in fragment_renderer.iter_endpoints(
+            tag_views,
+            cache=self.fragment_cache,
+            options_key=FragmentCacheUtils.options_key(options)
+        ):
+            page_id = f"endpoint-{endpoint.anchor}"
+            yield page_files[page_id], self._page_script(page_id, fragment, collapse=(options.asset_mode == 'external'))
+
+    def _iter_base_pages(
+        self,
+        tag_views,
+        page_files: Dict[str, str],
+        base: VariantBaseDTO,
+        collapse: bool = False
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield (relative path, content) for each endpoint page from already rendered fragments"""
+        for tag_view, fragments in zip(tag_views, base.endpoint_fragments):
+            for endpoint, fragment in zip(tag_view.endpoints, fragments):
+                page_id = f"endpoint-{endpoint.anchor}"
+                yield page_files[page_id], self._page_script(page_id, fragment, collapse)
+
+    def _iter_progressive_pages(
+        self,
+        builder: EndpointViewBuilder,
+        page_files: Dict[str, str],
+        options: RenderOptionsDTO,
+        schema_table: SchemaTableRenderer,
+        search_index_src: Optional[str]
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield (relative path, content) of each page file, building the endpoint views tag by tag"""
+        collapse = options.asset_mode == 'external'
+        fragment_renderer = FragmentRenderer(self.env, self.templates_dir, options.max_workers, schema_table)
+        options_key = FragmentCacheUtils.options_key(options)
+        tag_views = []
+        for tag_view in builder.iter_tag_views():
+            tag_views.append(tag_view)
+            for endpoint, fragment in fragment_renderer.iter_endpoints(
+                (tag_view,), cache=self.fragment_cache, options_key=options_key
+            ):
+                page_id = f"endpoint-{endpoint.anchor}"
+                yield page_files[page_id], self._page_script(page_id, fragment, collapse)
+
+        document_view = builder.document_from(tuple(tag_views))
+        if self.MODELS_PAGE_ID in page_files:
+            models = self.env.get_template(self.MODELS_TEMPLATE).render(
+                models=document_view.models, schema_table=schema_table
+            )
+            yield page_files[self.MODELS_PAGE_ID], self._page_script(self.MODELS_PAGE_ID, models, collapse)
+        if search_index_src:
+            yield search_index_src, SearchIndexBuilder(document_view).build_asset()
+
+    @staticmethod
+    def _page_script(page_id: str, fragment: str, collapse: bool = False) -> str:
+        """Page (endpoint or Data Models) as a script handing its HTML to the shell"""
+        if collapse:
+            fragment = AssetUtils.collapse_whitespace(fragment)
+        return f"previewPageLoaded({json.dumps(page_id)}, {json.dumps(fragment, ensure_ascii=False)});\n"
+
     def get_format_name(self) -> str:
         """Get format name"""
         return "html"
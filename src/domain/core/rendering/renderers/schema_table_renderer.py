@@ -0,0 +1,58 @@
+"""
+SchemaTableRenderer - Per-run memoization of schema property tables
+"""
+from typing import Dict, Tuple
+from jinja2 import Environment
+from src.domain.core.rendering.dtos.endpoint_view_dto import PropertyRowDTO
+
+
+class SchemaTableRenderer:
+    """
+    Renders each schema property table once per render run
+
+    A schema referenced by hundreds of endpoints produces the same table
+    every time, so the first rendering is kept and reused. Templates call the
+    instance: {{ schema_table(schema.name, schema.properties, color) }}
+    (link_refs=True on the shared Data Models page: references become links).
+    The key includes the property rows themselves, so an instance shared
+    across specifications never returns a stale table.
+    """
+
+    def __init__(self, env: Environment, template_name: str):
+        """Initialize with the environment and the table template (preview or storage variant)"""
+        self.template = env.get_template(template_name)
+        self._tables: Dict[Tuple, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(
+        self,
+        schema_name: str,
+        properties: Tuple[PropertyRowDTO, ...],
+        color: str = '',
+        link_refs: bool = False
+    ) -> str:
+        """Rendered table for a schema (memoized)"""
+        key = (schema_name, color, link_refs, properties)
+        table = self._tables.get(key)
+        if table is None:
+            self.misses += 1
+            table = self.template.render(properties=properties, color=color, link_refs=link_refs)
+            self._tables[key] = table
+        else:
+            self.hits += 1
+        return table
+
+    def reset(self):
+        """Start a new render run"""
+        self._tables.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Memoization counters for reporting"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'tables': len(self._tables)
+        }
@@ -2,7 +2,7 @@
 DocumentationWorkflow - Define o fluxo completo de documentação
 Parse → Map → Render → Publish
 """
-from typing import Union
+from typing import List, Union
 from src.domain.core.parsing import ParsedSpecDTO
 from src.domain.models.api_specification_model import ApiSpecificationModel
 from src.domain.core.rendering.dtos.rendered_document_dto import RenderedDocumentDTO
@@ -13,6 +13,8 @@ from src.domain.utils.domain_mapper_utils import DomainMapperUtils
 from src.domain.core.parsing.parsers import ParserFactory
 from src.domain.core.rendering.renderers.html_renderer import HtmlRenderer
 from src.domain.core.publishing.publishers.publisher_factory import PublisherFactory
+from src.domain.utils.fragment_cache_utils import FragmentCacheUtils
+from src.infrastructure.config.config import config
 
 
 class DocumentationWorkflow:
@@ -34,7 +36,7 @@ class DocumentationWorkflow:
         """Initialize workflow with factories"""
         self.parser_factory = ParserFactory()
         self.publisher_factory = PublisherFactory()
-        self.renderer = HtmlRenderer()
+        self.renderer = HtmlRenderer(fragment_cache=FragmentCacheUtils.from_config(config))
 
     def execute(
         self,
@@ -83,10 +85,16 @@ class DocumentationWorkflow:
         # Step 3: Render to HTML
         # Gera documentação HTML responsiva com exemplos e navegação
         if render_options is None:
-            render_options = RenderOptionsDTO(
+            render_options = RenderOptionsDTO.from_preset(
+                config.render_preset,  # Full ou skeleton (execuções rápidas de CI)
                 theme='light',
                 responsive=True,
-                include_examples=True
+                schema_mode=config.schema_mode,  # Shared: cada schema renderizado uma vez
+                layout=config.preview_layout,  # APIs grandes usam o preview multi-página
+                asset_mode=config.preview_assets,  # External: CSS/JS minificados com hash de conteúdo
+                progressive=(mode == 'preview' and config.preview_progressive),  # Shell primeiro, páginas em seguida
+                streaming=(mode == 'preview'),  # HTML do preview é gravado em streaming no disco
+                emit_html=(mode == 'preview')  # Modo publish usa apenas a visão do documento (sem HTML de preview)
             )
         rendered_doc: RenderedDocumentDTO = self.renderer.render(api_spec, render_options)
 
@@ -135,3 +143,25 @@ class DocumentationWorkflow:
             render_options = RenderOptionsDTO()
         return self.renderer.render(api_spec, render_options)
 
+    def render_variants(
+        self,
+        api_spec: ApiSpecificationModel,
+        variants: List[RenderOptionsDTO],
+        max_workers: int = None
+    ) -> List[RenderedDocumentDTO]:
+        """
+        Renderiza várias variantes (temas, locales, layouts) de um modelo já parseado
+
+        O trabalho independente das opções (exemplos, closures de schemas,
+        fragmentos de endpoints, índice de busca) é feito uma única vez;
+        cada variante renderiza apenas a sua camada específica
+
+        Args:
+            api_spec: Modelo de domínio da API já parseado
+            variants: Lista de opções de renderização (uma por variante)
+            max_workers: Processos para renderizar os fragmentos compartilhados
+
+        Returns:
+            List[RenderedDocumentDTO]: Um documento por variante, na mesma ordem
+        """
+        return self.renderer.render_variants(api_spec, variants, max_workers=max_workers)
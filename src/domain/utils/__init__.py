@@ -2,8 +2,15 @@
 from src.domain.utils.json_loader_utils import JsonLoaderUtils
 from src.domain.utils.domain_mapper_utils import DomainMapperUtils
 from src.domain.utils.example_generator_utils import ExampleGeneratorUtils
+from src.domain.utils.fragment_cache_utils import FragmentCacheUtils
+from src.domain.utils.asset_utils import AssetUtils
+from src.domain.utils.rate_limiter_utils import RateLimiterUtils
+from src.domain.utils.http_session_utils import HttpSessionUtils
+from src.domain.utils.publish_manifest_utils import PublishManifestUtils
+from src.domain.utils.publish_journal_utils import PublishJournalUtils
 
-__all__ = ['JsonLoaderUtils', 'DomainMapperUtils', 'ExampleGeneratorUtils']
+__all__ = ['JsonLoaderUtils', 'DomainMapperUtils', 'ExampleGeneratorUtils', 'FragmentCacheUtils', 'AssetUtils',
+           'RateLimiterUtils', 'HttpSessionUtils', 'PublishManifestUtils', 'PublishJournalUtils']
 
 
 
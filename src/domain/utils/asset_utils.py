@@ -0,0 +1,163 @@
+"""
+AssetUtils - Minification, content hashing and precompression of preview assets
+"""
+import gzip
+import hashlib
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+try:
+    import brotli
+except ImportError:  # Optional dependency: .br siblings are skipped without it
+    brotli = None
+
+
+class AssetUtils:
+    """
+    Helpers for the external asset output mode of the preview
+
+    Minification is deliberately conservative (comments and layout whitespace
+    only) so the result behaves exactly like the source.
+    """
+
+    HASH_LENGTH = 10
+
+    # Elements whose content must be kept byte for byte
+    PROTECTED_OPEN = re.compile(r'<(pre|textarea|script|style)\b', re.IGNORECASE)
+    WHITESPACE_RUN = re.compile(r'\s+')
+    # Keep enough of a chunk tail to never split "<textarea" / "</textarea>"
+    STREAM_TAIL = 16
+
+    CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+    CSS_SPACE_AROUND = re.compile(r'\s*([{};:,>])\s*')
+    JS_LINE_COMMENT = re.compile(r'^\s*//.*$', re.MULTILINE)
+
+    @staticmethod
+    def hashed_name(name: str, content: str) -> str:
+        """Content-hashed file name (styles.css -> styles.1a2b3c4d5e.css)"""
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:AssetUtils.HASH_LENGTH]
+        stem, dot, suffix = name.rpartition('.')
+        if not dot:
+            return f"{name}.{digest}"
+        return f"{stem}.{digest}.{suffix}"
+
+    @staticmethod
+    def minify_css(css: str) -> str:
+        """Remove comments and layout whitespace from a stylesheet"""
+        css = AssetUtils.CSS_COMMENT.sub('', css)
+        css = AssetUtils.WHITESPACE_RUN.sub(' ', css)
+        css = AssetUtils.CSS_SPACE_AROUND.sub(r'\1', css)
+        return css.replace(';}', '}').strip()
+
+    @staticmethod
+    def minify_js(js: str) -> str:
+        """Remove whole-line comments, indentation and blank lines from a script"""
+        js = AssetUtils.JS_LINE_COMMENT.sub('', js)
+        lines = [line.strip() for line in js.splitlines()]
+        return '\n'.join(line for line in lines if line)
+
+    @staticmethod
+    def collapse_whitespace(html: str) -> str:
+        """Collapse whitespace runs of an HTML document (pre/textarea/script/style kept as is)"""
+        return ''.join(AssetUtils.iter_collapsed((html,)))
+
+    @staticmethod
+    def iter_collapsed(chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Collapse whitespace of a streamed HTML document chunk by chunk
+
+        A whitespace run becomes a newline when it contains one, a single
+        space otherwise - the rendering is unchanged while indentation and
+        blank lines disappear. Protected elements may span chunks.
+        """
+        buffer = ''
+        protected: Optional[str] = None  # Closing tag we are waiting for
+        for chunk in chunks:
+            buffer += chunk
+            output, buffer, protected = AssetUtils._collapse_step(buffer, protected, final=False)
+            if output:
+                yield output
+        output, _, _ = AssetUtils._collapse_step(buffer, protected, final=True)
+        if output:
+            yield output
+
+    @staticmethod
+    def _collapse_step(buffer: str, protected: Optional[str], final: bool):
+        """Process as much of the buffer as is safe; returns (output, remainder, protected)"""
+        parts: List[str] = []
+        while buffer:
+            if protected is not None:
+                end = buffer.lower().find(protected)
+                if end == -1:
+                    if final:
+                        parts.append(buffer)
+                        buffer = ''
+                    elif len(buffer) > AssetUtils.STREAM_TAIL:
+                        cut = len(buffer) - AssetUtils.STREAM_TAIL
+                        parts.append(buffer[:cut])
+                        buffer = buffer[cut:]
+                    break
+                end += len(protected)
+                parts.append(buffer[:end])
+                buffer = buffer[end:]
+                protected = None
+                continue
+
+            match = AssetUtils.PROTECTED_OPEN.search(buffer)
+            if match is not None:
+                parts.append(AssetUtils._collapse_text(buffer[:match.start()]))
+                parts.append(match.group(0))
+                buffer = buffer[match.end():]
+                protected = f"</{match.group(1).lower()}"
+                continue
+
+            if final:
+                parts.append(AssetUtils._collapse_text(buffer))
+                buffer = ''
+                break
+            # Keep the tail (a tag name or whitespace run may continue in the next chunk)
+            cut = len(buffer) - AssetUtils.STREAM_TAIL
+            while cut > 0 and buffer[cut - 1].isspace():
+                cut -= 1
+            if cut > 0:
+                parts.append(AssetUtils._collapse_text(buffer[:cut]))
+                buffer = buffer[cut:]
+            break
+        return ''.join(parts), buffer, protected
+
+    @staticmethod
+    def _collapse_text(text: str) -> str:
+        """Collapse the whitespace runs of unprotected HTML"""
+        return AssetUtils.WHITESPACE_RUN.sub(lambda run: '\n' if '\n' in run.group(0) else ' ', text)
+
+    @staticmethod
+    def precompress(path: Path, encodings: Iterable[str]) -> List[Path]:
+        """
+        Write precompressed siblings of a file (index.html -> index.html.gz / index.html.br)
+
+        Args:
+            path: File to compress
+            encodings: 'gz' and/or 'br' (br requires the optional brotli package)
+
+        Returns:
+            List[Path]: Siblings written
+        """
+        data = path.read_bytes()
+        written = []
+        for encoding in encodings:
+            if encoding == 'gz':
+                compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            elif encoding == 'br' and brotli is not None:
+                compressed = brotli.compress(data)
+            else:
+                continue
+            sibling = path.with_name(f"{path.name}.{encoding}")
+            sibling.write_bytes(compressed)
+            written.append(sibling)
+        return written
+
+    @staticmethod
+    def supports(encoding: str) -> bool:
+        """True when the precompression encoding is available in this environment"""
+        return encoding == 'gz' or (encoding == 'br' and brotli is not None)
@@ -0,0 +1,184 @@
+"""
+FragmentCacheUtils - Persistent on-disk cache for rendered fragments
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from jinja2 import Environment, meta
+
+
+class FragmentCacheUtils:
+    """
+    Persistent LRU cache of rendered HTML/storage-format fragments
+
+    Values are stored in a SQLite file inside the cache directory. Entries are
+    evicted least-recently-used first once the total size exceeds the budget.
+    Access times are kept in memory and written back on flush() so that a
+    cache hit never costs a disk write.
+    """
+
+    DB_FILENAME = "fragments.sqlite3"
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        """Open (or create) the cache in cache_dir with a size budget in bytes"""
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._touched: Dict[str, float] = {}
+        self._conn = sqlite3.connect(str(self.cache_dir / self.DB_FILENAME), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS fragments ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_fragments_access ON fragments(last_access)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM fragments").fetchone()[0]
+
+    @classmethod
+    def from_config(cls, app_config) -> Optional['FragmentCacheUtils']:
+        """Create the cache from application config (None when disabled)"""
+        if not app_config.is_fragment_cache_enabled():
+            return None
+        return cls(app_config.fragment_cache_dir, app_config.fragment_cache_max_mb * 1024 * 1024)
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build a cache key from fingerprint parts (content hash, template version, options...)"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    @staticmethod
+    def template_version(env: Environment, template_name: str) -> str:
+        """
+        Hash of a template and every template it includes, imports or extends
+
+        Fragments embed the output of the whole include closure, so editing any
+        template of it invalidates the cached fragments. A template reference
+        that is only known at render time (a computed name) makes the closure
+        unknowable - the version then covers every template of the loader.
+        """
+        names = set()
+        pending = [template_name]
+        while pending:
+            name = pending.pop()
+            if name in names:
+                continue
+            names.add(name)
+            source, _, _ = env.loader.get_source(env, name)
+            for referenced in meta.find_referenced_templates(env.parse(source)):
+                if referenced is None:
+                    names = set(env.list_templates())
+                    pending = []
+                    break
+                pending.append(referenced)
+
+        digest = hashlib.sha256()
+        for name in sorted(names):
+            source, _, _ = env.loader.get_source(env, name)
+            digest.update(name.encode('utf-8'))
+            digest.update(b'\x00')
+            digest.update(source.encode('utf-8'))
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    @staticmethod
+    def options_key(options) -> str:
+        """Stable representation of the render options that change fragment bytes"""
+        if options is None:
+            return ''
+        return json.dumps(options.fragment_values(), sort_keys=True, default=str)
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached fragment (None on miss)"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM fragments WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = time.time()
+            return row[0]
+
+    def put(self, key: str, value: str):
+        """Store a fragment and evict old entries if the budget is exceeded"""
+        size = len(value.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM fragments WHERE key = ?", (key,)).fetchone()
+            if previous:
+                self._total_bytes -= previous[0]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fragments (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time())
+            )
+            self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def flush(self):
+        """Persist access times and pending writes"""
+        with self._lock:
+            if self._touched:
+                self._conn.executemany(
+                    "UPDATE fragments SET last_access = ? WHERE key = ?",
+                    [(accessed, key) for key, accessed in self._touched.items()]
+                )
+                self._touched.clear()
+            self._conn.commit()
+
+    def close(self):
+        """Flush and close the cache"""
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> dict:
+        """Cache counters for reporting"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size_bytes': self._total_bytes,
+            'max_bytes': self.max_bytes
+        }
+
+    def _evict(self):
+        """Remove least recently used entries until 90% of the budget (lock held)"""
+        # Bring pending access times in so recently read fragments survive
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE fragments SET last_access = ? WHERE key = ?",
+                [(accessed, key) for key, accessed in self._touched.items()]
+            )
+            self._touched.clear()
+
+        target = int(self.max_bytes * 0.9)
+        cursor = self._conn.execute("SELECT key, size FROM fragments ORDER BY last_access ASC")
+        to_delete = []
+        for key, size in cursor:
+            if self._total_bytes <= target:
+                break
+            to_delete.append((key,))
+            self._total_bytes -= size
+        cursor.close()
+
+        self._conn.executemany("DELETE FROM fragments WHERE key = ?", to_delete)
+        self.evictions += len(to_delete)
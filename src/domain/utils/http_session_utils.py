@@ -0,0 +1,188 @@
+"""
+HttpSessionUtils - Pooled keep-alive HTTP sessions for REST publishers
+"""
+import threading
+import time
+from typing import Dict, Iterable, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.domain.utils.rate_limiter_utils import RateLimiterUtils
+
+
+class _ConnectionCountingAdapter(HTTPAdapter):
+    """HTTPAdapter that counts the TCP connections it actually opens (reconnects included)"""
+
+    def __init__(self, *args, rate_limiter: Optional[RateLimiterUtils] = None, **kwargs):
+        """Initialize the counter (and optional shared rate limiter) before the pool manager is created"""
+        self.connections_opened = 0
+        self._counter_lock = threading.Lock()
+        self.rate_limiter = rate_limiter
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Create the pool manager with connection classes that report each connect()"""
+        super().init_poolmanager(*args, **kwargs)
+        adapter = self
+        pool_classes = {}
+        for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items():
+            class CountingConnection(pool_cls.ConnectionCls):
+                def connect(self):
+                    super().connect()
+                    adapter._count_connection()
+
+            pool_classes[scheme] = type(pool_cls.__name__, (pool_cls,), {'ConnectionCls': CountingConnection})
+        self.poolmanager.pool_classes_by_scheme = pool_classes
+
+    def send(self, request, **kwargs):
+        """Send through the rate limiter: throttled and failed responses are retried with backoff"""
+        limiter = self.rate_limiter
+        if limiter is None:
+            return super().send(request, **kwargs)
+
+        attempt = 0
+        while True:
+            limiter.acquire()
+            try:
+                response = super().send(request, **kwargs)
+            except requests.exceptions.RequestException:
+                limiter.on_failure()
+                raise
+
+            status = response.status_code
+            retry_after = RateLimiterUtils.parse_retry_after(response.headers.get('Retry-After'))
+            # POST is only resent when the server says it did not process it (429, or 503 with Retry-After)
+            retryable = status in RateLimiterUtils.RETRY_STATUSES and (
+                request.method in HttpSessionUtils.RETRY_METHODS
+                or status == 429
+                or (status == 503 and retry_after is not None)
+            )
+            if status in RateLimiterUtils.THROTTLE_STATUSES:
+                delay = limiter.on_throttle(retry_after, attempt)  # Pauses every worker
+            else:
+                delay = limiter.backoff_delay(attempt) if retryable else 0.0
+
+            if not retryable or attempt >= limiter.retries:
+                if status >= 500 or status == 429:
+                    limiter.on_failure()
+                else:
+                    limiter.on_success()
+                return response
+
+            response.close()
+            limiter.on_retry()
+            attempt += 1
+            if status not in RateLimiterUtils.THROTTLE_STATUSES:
+                time.sleep(delay)  # Throttles wait in acquire() together with the other workers
+
+    def _count_connection(self):
+        """Record one new TCP connection"""
+        with self._counter_lock:
+            self.connections_opened += 1
+
+
+class HttpSessionUtils:
+    """
+    Builds requests sessions that reuse connections across calls
+
+    A module-level requests.get/post opens a new TCP+TLS connection per call.
+    A session keeps connections alive in a per-host pool, so a publish run
+    pays the handshake once per pooled connection instead of once per page.
+    """
+
+    # Transient gateway errors worth retrying on idempotent methods
+    RETRY_STATUSES = (502, 503, 504)
+    RETRY_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'})
+
+    @staticmethod
+    def create_session(
+        pool_size: int = 10,
+        keep_alive: bool = True,
+        retries: int = 3,
+        backoff: float = 0.5,
+        headers: Dict[str, str] = None,
+        rate_limiter: Optional[RateLimiterUtils] = None
+    ) -> requests.Session:
+        """
+        Create a session with a bounded connection pool and retry adapter
+
+        Args:
+            pool_size: Connections kept alive per host (callers wait when all are busy)
+            keep_alive: False sends "Connection: close" (one connection per request)
+            retries: Retries on connection errors and 502/503/504 (POST is never retried)
+            backoff: Exponential backoff factor between retries, in seconds
+            headers: Default headers sent with every request
+            rate_limiter: Shared limiter - when given it paces every request and retries
+                429/502/503/504 itself (Retry-After aware, jittered); the urllib3 retry
+                then only covers connection errors
+
+        Returns:
+            requests.Session: Configured session
+        """
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=0 if rate_limiter is not None else retries,
+            backoff_factor=backoff,
+            status_forcelist=() if rate_limiter is not None else HttpSessionUtils.RETRY_STATUSES,
+            allowed_methods=HttpSessionUtils.RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = _ConnectionCountingAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=True,
+            max_retries=retry,
+            rate_limiter=rate_limiter
+        )
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if headers:
+            session.headers.update(headers)
+        session.headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        return session
+
+    @staticmethod
+    def connection_stats(session: requests.Session) -> Dict[str, int]:
+        """
+        Connection reuse counters of a session (cumulative since creation)
+
+        Returns:
+            dict: requests sent, TCP connections opened and requests served by a reused connection
+        """
+        requests_sent = 0
+        connections = 0
+        for adapter in HttpSessionUtils._iter_adapters(session):
+            connections += adapter.connections_opened
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    requests_sent += pool.num_requests
+        return {
+            'requests': requests_sent,
+            'connections': connections,
+            'reused': max(requests_sent - connections, 0)
+        }
+
+    @staticmethod
+    def rate_limiter_of(session: requests.Session) -> Optional[RateLimiterUtils]:
+        """Rate limiter mounted on the session (None when requests are not limited)"""
+        for adapter in HttpSessionUtils._iter_adapters(session):
+            if adapter.rate_limiter is not None:
+                return adapter.rate_limiter
+        return None
+
+    @staticmethod
+    def _iter_adapters(session: requests.Session) -> Iterable[_ConnectionCountingAdapter]:
+        """Distinct counting adapters mounted on the session"""
+        seen = set()
+        for adapter in session.adapters.values():
+            if id(adapter) in seen or not isinstance(adapter, _ConnectionCountingAdapter):
+                continue
+            seen.add(id(adapter))
+            yield adapter
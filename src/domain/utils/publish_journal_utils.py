@@ -0,0 +1,156 @@
+"""
+PublishJournalUtils - Append-only checkpoint journal of a publish run
+"""
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+class PublishJournalUtils:
+    """
+    Records every completed page operation of a publish run, one JSON line each
+
+    Lines are appended and flushed as pages complete, so a run that dies
+    half way leaves a journal of everything it finished. A resumed run
+    replays the latest unfinished journal of the same space/API (last line
+    per page key wins) and keeps appending to it; a run that publishes every
+    page marks its journal complete. Only the journal of the latest run of a
+    space/API is kept: starting or completing a run drops the older ones
+    (a new run makes them unresumable).
+
+    File: {journal_dir}/{space}__{api}__{run_id}.jsonl
+        {"type": "run", "run_id": ..., "space": ..., "api": ..., "started_at": ...}
+        {"type": "page", "key": ..., "action": ..., "id": ..., "title": ..., "parent_id": ..., ...}
+        {"type": "complete", "finished_at": ...}
+    """
+
+    _UNSAFE = re.compile(r'[^0-9A-Za-z._-]+')
+
+    def __init__(self, journal_dir: str):
+        """Use (or create) journal_dir for the run journals"""
+        self.journal_dir = Path(journal_dir)
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._file = None
+        self.path: Optional[Path] = None
+        self.run_id: Optional[str] = None
+        self.recorded = 0
+
+    @classmethod
+    def from_config(cls, app_config) -> Optional['PublishJournalUtils']:
+        """Create the journal from application config (None when disabled)"""
+        if not app_config.is_publish_journal_enabled():
+            return None
+        return cls(app_config.publish_journal_dir)
+
+    def _prefix(self, space_key: str, api_key: str) -> str:
+        """File name prefix of the journals of one space/API"""
+        return f"{self._UNSAFE.sub('_', space_key)}__{self._UNSAFE.sub('_', api_key)}__"
+
+    def _journals(self, space_key: str, api_key: str) -> List[Path]:
+        """Journals of one space/API, newest first"""
+        return sorted(self.journal_dir.glob(f"{self._prefix(space_key, api_key)}*.jsonl"), reverse=True)
+
+    @staticmethod
+    def _read(path: Path) -> Tuple[List[Dict], int]:
+        """Journal lines and the byte length they span (a line cut short by a crash is ignored)"""
+        lines = []
+        valid_bytes = 0
+        with open(path, 'rb') as f:
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break
+                try:
+                    lines.append(json.loads(raw))
+                except ValueError:
+                    break
+                valid_bytes += len(raw)
+        return lines, valid_bytes
+
+    def start(self, space_key: str, api_key: str, resume: bool = False) -> Dict[str, Dict]:
+        """
+        Open the journal of this run
+
+        Args:
+            space_key: Confluence space
+            api_key: API root page title
+            resume: Continue the latest unfinished run of this space/API
+
+        Returns:
+            dict: page key -> last recorded operation of the resumed run (empty for a new run)
+        """
+        self.close()
+        self.recorded = 0
+        if resume:
+            for path in self._journals(space_key, api_key):
+                lines, valid_bytes = self._read(path)
+                if not lines or lines[-1].get('type') == 'complete':
+                    break  # The latest run finished - nothing to resume
+                self.path = path
+                self.run_id = lines[0].get('run_id')
+                with open(path, 'r+b') as f:
+                    f.truncate(valid_bytes)  # Drop a line cut short by the crash before appending
+                self._file = open(path, 'a', encoding='utf-8')
+                return {line['key']: line for line in lines if line.get('type') == 'page'}
+
+        started, millis = time.strftime('%Y%m%d_%H%M%S'), int(time.time() * 1000) % 1000
+        while True:  # Never append to the journal of a run started in the same millisecond
+            self.run_id = f"{started}_{millis:03d}"
+            self.path = self.journal_dir / f"{self._prefix(space_key, api_key)}{self.run_id}.jsonl"
+            if not self.path.exists():
+                break
+            millis += 1
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._append({'type': 'run', 'run_id': self.run_id, 'space': space_key, 'api': api_key,
+                      'started_at': time.time()})
+        self._drop_older(space_key, api_key)  # Unfinished runs before this one can no longer be resumed
+        return {}
+
+    def record(self, page_key: str, action: str, entry: Dict, parent_id: Optional[str]):
+        """Append one completed page operation (thread safe, flushed immediately)"""
+        self._append({
+            'type': 'page',
+            'key': page_key,
+            'action': action,
+            'id': entry['id'],
+            'title': entry['title'],
+            'parent_id': parent_id,
+            'version': entry['version']['number'],
+            'content_hash': entry.get('content_hash'),
+            'hash_version': entry.get('hash_version', 0),
+            'labels': entry.get('labels'),
+            'managed_labels': entry.get('managed_labels')
+        })
+
+    def complete(self, space_key: str, api_key: str):
+        """Mark the run complete and drop the older journals of this space/API"""
+        self._append({'type': 'complete', 'finished_at': time.time()})
+        self.close()
+        self._drop_older(space_key, api_key)
+
+    def _drop_older(self, space_key: str, api_key: str):
+        """Delete the journals of this space/API other than the one of this run"""
+        for path in self._journals(space_key, api_key):
+            if path != self.path:
+                path.unlink(missing_ok=True)
+
+    def close(self):
+        """Close the journal file (the run stays resumable unless completed)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _append(self, line: Dict):
+        """Write one journal line"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(json.dumps(line, ensure_ascii=False) + '\n')
+            self._file.flush()
+            if line['type'] == 'page':
+                self.recorded += 1
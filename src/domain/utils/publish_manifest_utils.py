@@ -0,0 +1,121 @@
+"""
+PublishManifestUtils - Local SQLite manifest of published Confluence pages
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+class PublishManifestUtils:
+    """
+    Remembers what was published, per space and API
+
+    One row per page key (root, tag_folder_pet, endpoint_pet_get__pet...):
+    page id, parent id, version, content hash (and its property version)
+    and labels. The next publish of the same API starts from this instead
+    of rediscovering the tree; only the versions are verified remotely.
+    Writes from publisher workers are buffered and committed on flush().
+    """
+
+    DB_FILENAME = "publish_manifest.sqlite3"
+
+    def __init__(self, manifest_dir: str):
+        """Open (or create) the manifest in manifest_dir"""
+        self.manifest_dir = Path(manifest_dir)
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.manifest_dir / self.DB_FILENAME), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            " space_key TEXT NOT NULL,"
+            " api_key TEXT NOT NULL,"
+            " page_key TEXT NOT NULL,"
+            " title TEXT NOT NULL,"
+            " page_id TEXT NOT NULL,"
+            " parent_id TEXT,"
+            " version INTEGER NOT NULL,"
+            " content_hash TEXT,"
+            " hash_version INTEGER NOT NULL DEFAULT 0,"
+            " labels TEXT NOT NULL DEFAULT '[]',"
+            " updated_at REAL NOT NULL,"
+            " PRIMARY KEY (space_key, api_key, page_key))"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, app_config) -> Optional['PublishManifestUtils']:
+        """Create the manifest from application config (None when disabled)"""
+        if not app_config.is_publish_manifest_enabled():
+            return None
+        return cls(app_config.publish_manifest_dir)
+
+    def load(self, space_key: str, api_key: str) -> Dict[str, Dict]:
+        """
+        Pages recorded for an API
+
+        Returns:
+            dict: page key -> {title, page_id, parent_id, version, content_hash, hash_version, labels}
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT page_key, title, page_id, parent_id, version, content_hash, hash_version, labels"
+                " FROM pages WHERE space_key = ? AND api_key = ?",
+                (space_key, api_key)
+            ).fetchall()
+        return {
+            row[0]: {
+                'title': row[1],
+                'page_id': row[2],
+                'parent_id': row[3],
+                'version': row[4],
+                'content_hash': row[5],
+                'hash_version': row[6],
+                'labels': json.loads(row[7])
+            }
+            for row in rows
+        }
+
+    def record(
+        self,
+        space_key: str,
+        api_key: str,
+        page_key: str,
+        entry: Dict,
+        parent_id: Optional[str],
+        labels: Iterable[str] = ()
+    ):
+        """Record the current state of a page (index entry as kept by PageTreeIndex)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (space_key, api_key, page_key, title, page_id, parent_id,"
+                " version, content_hash, hash_version, labels, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    space_key, api_key, page_key, entry['title'], entry['id'], parent_id,
+                    entry['version']['number'], entry.get('content_hash'), entry.get('hash_version', 0),
+                    json.dumps(sorted(labels)), time.time()
+                )
+            )
+
+    def remove(self, space_key: str, api_key: str, page_keys: List[str]):
+        """Forget pages (deleted remotely or no longer published)"""
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM pages WHERE space_key = ? AND api_key = ? AND page_key = ?",
+                [(space_key, api_key, page_key) for page_key in page_keys]
+            )
+
+    def flush(self):
+        """Commit pending writes"""
+        with self._lock:
+            self._conn.commit()
+
+    def close(self):
+        """Flush and close the manifest"""
+        self.flush()
+        with self._lock:
+            self._conn.close()
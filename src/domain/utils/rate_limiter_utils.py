@@ -0,0 +1,181 @@
+"""
+RateLimiterUtils - Adaptive client-side rate limiting, backoff and circuit breaking for REST publishers
+"""
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+import requests
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while the circuit breaker is open"""
+
+
+class RateLimiterUtils:
+    """
+    Token bucket shared by every worker of a publish run
+
+    - Requests take a token; the bucket refills at the current rate (burst of
+      one second worth of requests).
+    - 429 and 503 halve the rate and pause every worker until Retry-After
+      (or a jittered exponential delay when the header is missing); each
+      successful response then raises the rate again in small steps up to
+      the configured maximum (additive increase, multiplicative decrease).
+    - After `breaker_threshold` consecutive failed requests (retries
+      exhausted, server errors, connection errors) the circuit opens: requests
+      fail fast with CircuitOpenError for `breaker_cooldown` seconds, then
+      the next request is a trial (one more failure reopens it).
+    """
+
+    THROTTLE_STATUSES = (429, 503)
+    RETRY_STATUSES = (429, 502, 503, 504)
+
+    # Rate never drops below this (requests per second) and recovers by this share of the maximum per success
+    MIN_RATE = 0.5
+    RECOVERY_STEP = 0.02
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        retries: int = 3,
+        backoff: float = 0.5,
+        breaker_threshold: int = 5,
+        breaker_cooldown: float = 30.0
+    ):
+        """
+        Args:
+            rate: Maximum requests per second (0: no client-side limit, throttling is still honored)
+            retries: Retries of a throttled or failed request
+            backoff: Base of the jittered exponential delay between retries, in seconds
+            breaker_threshold: Consecutive failed requests that open the circuit (0 disables it)
+            breaker_cooldown: Seconds the circuit stays open
+        """
+        self.max_rate = max(rate, 0.0)
+        self.rate = self.max_rate
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+
+        self._lock = threading.Lock()
+        self._tokens = max(self.max_rate, 1.0)
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0  # Shared pause after a throttling response
+        self._open_until = 0.0
+        self._consecutive_failures = 0
+
+        self.throttled = 0
+        self.retried = 0
+        self.circuit_opens = 0
+        self.rejected = 0
+        self.waited_seconds = 0.0
+
+    @classmethod
+    def from_config(cls, app_config) -> 'RateLimiterUtils':
+        """Create the limiter from application config"""
+        return cls(
+            rate=app_config.confluence_rate_limit,
+            retries=app_config.confluence_retries,
+            backoff=app_config.confluence_retry_backoff,
+            breaker_threshold=app_config.confluence_breaker_threshold,
+            breaker_cooldown=app_config.confluence_breaker_cooldown
+        )
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Seconds to wait from a Retry-After header (delta seconds or HTTP date)"""
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    def acquire(self):
+        """Wait for a token (and any shared pause); raises CircuitOpenError while the circuit is open"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._open_until:
+                    self.rejected += 1
+                    raise CircuitOpenError(
+                        f"Circuit open after {self._consecutive_failures} consecutive failures "
+                        f"(retry in {self._open_until - now:.0f}s)"
+                    )
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                elif self.max_rate <= 0:
+                    return
+                else:
+                    self._tokens = min(max(self.max_rate, 1.0), self._tokens + (now - self._refilled_at) * self.rate)
+                    self._refilled_at = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                self.waited_seconds += wait
+            time.sleep(wait)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Jittered exponential delay before retry number attempt (0-based)"""
+        ceiling = self.backoff * (2 ** attempt)
+        return random.uniform(ceiling / 2, ceiling)
+
+    def on_throttle(self, retry_after: Optional[float], attempt: int) -> float:
+        """
+        Record a 429/503: slow down and pause every worker
+
+        Returns:
+            float: Seconds until requests resume
+        """
+        delay = retry_after if retry_after is not None else self.backoff_delay(attempt)
+        with self._lock:
+            self.throttled += 1
+            if self.max_rate > 0:
+                self.rate = max(self.rate / 2, min(self.MIN_RATE, self.max_rate))
+                self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        return delay
+
+    def on_success(self):
+        """Record a completed request: close the circuit and recover the rate"""
+        with self._lock:
+            self._consecutive_failures = 0
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.RECOVERY_STEP)
+
+    def on_failure(self):
+        """Record a failed request (open the circuit after too many in a row)"""
+        with self._lock:
+            self._consecutive_failures += 1
+            if 0 < self.breaker_threshold <= self._consecutive_failures:
+                if time.monotonic() >= self._open_until:
+                    self.circuit_opens += 1
+                self._open_until = time.monotonic() + self.breaker_cooldown
+
+    def on_retry(self):
+        """Count one retried request"""
+        with self._lock:
+            self.retried += 1
+
+    def stats(self) -> dict:
+        """Limiter counters for reporting (cumulative)"""
+        return {
+            'throttled': self.throttled,
+            'retries': self.retried,
+            'circuit_opens': self.circuit_opens,
+            'rejected': self.rejected,
+            'waited_seconds': self.waited_seconds,
+            'rate': self.rate,
+            'max_rate': self.max_rate
+        }
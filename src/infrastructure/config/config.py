@@ -35,10 +35,61 @@ class Config:
         self.confluence_space_key = os.getenv('CONFLUENCE_SPACE_KEY')
         self.confluence_parent_page_id = os.getenv('CONFLUENCE_PARENT_PAGE_ID')
 
+        # Endpoint page body budget in KB: larger pages move schemas/examples to child pages (0 disables)
+        self.confluence_page_max_kb = int(os.getenv('CONFLUENCE_PAGE_MAX_KB', '512') or 0)
+
+        # Confluence HTTP connection pool (connections reused across page requests)
+        self.confluence_pool_size = int(os.getenv('CONFLUENCE_POOL_SIZE', '10'))
+        self.confluence_keep_alive = os.getenv('CONFLUENCE_KEEP_ALIVE', 'true').lower() in ('true', '1', 'yes')
+        self.confluence_retries = int(os.getenv('CONFLUENCE_RETRIES', '3'))
+        self.confluence_retry_backoff = float(os.getenv('CONFLUENCE_RETRY_BACKOFF', '0.5'))
+
+        # Client-side rate limit shared by all publish workers (adapts to 429/503 and Retry-After)
+        self.confluence_rate_limit = float(os.getenv('CONFLUENCE_RATE_LIMIT', '10') or 0)
+        self.confluence_breaker_threshold = int(os.getenv('CONFLUENCE_BREAKER_THRESHOLD', '5') or 0)
+        self.confluence_breaker_cooldown = float(os.getenv('CONFLUENCE_BREAKER_COOLDOWN', '30'))
+
+        # Concurrent page requests while publishing (siblings in flight once their parent exists)
+        self.confluence_publish_workers = int(os.getenv('CONFLUENCE_PUBLISH_WORKERS', '4'))
+
+        # Pages of removed endpoints/tags: report, archive or delete (at most CONFLUENCE_ORPHAN_MAX per run)
+        self.confluence_orphans = os.getenv('CONFLUENCE_ORPHANS', 'report').lower()
+        self.confluence_orphan_max = int(os.getenv('CONFLUENCE_ORPHAN_MAX', '50') or 0)
+
+        # Local publish manifest (page ids, versions, hashes per space/API - empty disables)
+        self.publish_manifest_dir = os.getenv('PUBLISH_MANIFEST_DIR')
+
+        # Checkpoint journal of each publish run, replayed by --resume (empty disables)
+        self.publish_journal_dir = os.getenv('PUBLISH_JOURNAL_DIR')
+
         # Application settings
         self.log_level = os.getenv('LOG_LEVEL', 'INFO')
         self.output_dir = os.getenv('OUTPUT_DIR', 'output')
 
+        # Preview layout: single, multipage (one file per endpoint) or auto (by API size)
+        self.preview_layout = os.getenv('PREVIEW_LAYOUT', 'auto')
+
+        # Progressive preview: shell written (and opened) first, endpoint pages stream in afterwards
+        self.preview_progressive = os.getenv('PREVIEW_PROGRESSIVE', 'false').lower() in ('true', '1', 'yes')
+
+        # Preview assets: inline (CSS/JS embedded) or external (minified, content-hashed files + collapsed HTML)
+        self.preview_assets = os.getenv('PREVIEW_ASSETS', 'inline')
+
+        # Precompressed preview siblings for static hosting: comma-separated gz and/or br (br needs brotli)
+        self.preview_precompress = [
+            encoding.strip() for encoding in os.getenv('PREVIEW_PRECOMPRESS', '').split(',') if encoding.strip()
+        ]
+
+        # Schema output: inline (full reference on every endpoint) or shared (one Data Models page)
+        self.schema_mode = os.getenv('SCHEMA_MODE', 'inline')
+
+        # Render preset: full or skeleton (navigation + endpoint signatures only, for CI smoke runs)
+        self.render_preset = os.getenv('RENDER_PRESET', 'full')
+
+        # Rendering cache settings (empty FRAGMENT_CACHE_DIR disables the cache)
+        self.fragment_cache_dir = os.getenv('FRAGMENT_CACHE_DIR')
+        self.fragment_cache_max_mb = int(os.getenv('FRAGMENT_CACHE_MAX_MB', '256'))
+
     def is_confluence_configured(self) -> bool:
         """Check if Confluence is properly configured"""
         return all([
@@ -48,6 +99,18 @@ class Config:
             self.confluence_space_key
         ])
 
+    def is_fragment_cache_enabled(self) -> bool:
+        """Check if the persistent fragment cache is enabled"""
+        return bool(self.fragment_cache_dir)
+
+    def is_publish_manifest_enabled(self) -> bool:
+        """Check if the local publish manifest is enabled"""
+        return bool(self.publish_manifest_dir)
+
+    def is_publish_journal_enabled(self) -> bool:
+        """Check if the publish checkpoint journal is enabled"""
+        return bool(self.publish_journal_dir)
+
     def get_confluence_config(self) -> dict:
         """Get Confluence configuration as dictionary"""
         return {
@@ -67,7 +130,8 @@ class Config:
             f"  confluence_token='***{self.confluence_token[-8:] if self.confluence_token else None}',\n"
             f"  confluence_space_key='{self.confluence_space_key}',\n"
             f"  log_level='{self.log_level}',\n"
-            f"  output_dir='{self.output_dir}'\n"
+            f"  output_dir='{self.output_dir}',\n"
+            f"  fragment_cache_dir='{self.fragment_cache_dir}'\n"
             f")"
         )
 
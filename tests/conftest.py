@@ -0,0 +1,273 @@
+"""
+Shared test setup: project root on the path, fake clock, fake HTTP sessions and an in-memory Confluence
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+import requests
+
+
+class FakeClock:
+    """Monotonic clock that only moves when code under test sleeps (or the test advances it)"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in"""
+
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.payload = payload
+        self.text = ''
+
+    def json(self):
+        return self.payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error")
+
+
+class RecordingSession:
+    """Session stand-in that records every request and answers with status_code"""
+
+    def __init__(self, status_code=200):
+        self.status_code = status_code
+        self.calls = []
+
+    def _answer(self, method, url, body):
+        self.calls.append((method, url, body))
+        return FakeResponse(self.status_code)
+
+    def post(self, url, json=None, **kwargs):
+        return self._answer('POST', url, json)
+
+    def put(self, url, json=None, **kwargs):
+        return self._answer('PUT', url, json)
+
+    def delete(self, url, params=None, **kwargs):
+        return self._answer('DELETE', url, params)
+
+
+class FakeConfluence:
+    """
+    In-memory Confluence REST API (v1 content, properties, labels, search) behind a session interface
+
+    Properties follow the server's versioning: POST of an existing key and a PUT
+    whose version is not current + 1 answer 409. Status codes queued in fail
+    are returned (in order) by the next write requests (None: answer normally).
+    """
+
+    BASE_URL = 'https://confluence.test'
+
+    def __init__(self):
+        self.api_url = f"{self.BASE_URL}/rest/api/content"
+        self.pages = {}  # id -> {title, parent, version, body, labels, props}
+        self.calls = []
+        self.fail = []
+        self.adapters = {}  # No pooled adapters: connection stats stay at zero
+        self._ids = iter(range(1000, 100000))
+
+    def add_page(self, title, parent=None, labels=(), props=None, version=1):
+        """Create a page directly (as if published earlier or by hand) and return its id"""
+        page_id = str(next(self._ids))
+        self.pages[page_id] = {
+            'title': title, 'parent': parent, 'version': version, 'body': '',
+            'labels': list(labels), 'props': {key: dict(prop) for key, prop in (props or {}).items()}
+        }
+        return page_id
+
+    def page_json(self, page_id):
+        page = self.pages[page_id]
+        ancestors = []
+        parent = page['parent']
+        while parent:
+            ancestors.insert(0, {'id': parent})
+            parent = self.pages.get(parent, {}).get('parent')
+        return {
+            'id': page_id, 'title': page['title'], 'version': {'number': page['version']}, 'ancestors': ancestors,
+            'metadata': {
+                'labels': {'results': [{'name': label} for label in page['labels']]},
+                'properties': {
+                    key: {'key': key, 'value': prop['value'], 'version': {'number': prop['version']}}
+                    for key, prop in page['props'].items()
+                }
+            }
+        }
+
+    def _path(self, url):
+        return url[len(self.api_url):].strip('/').split('/') if url.startswith(self.api_url) else None
+
+    def _failure(self):
+        status = self.fail.pop(0) if self.fail else None
+        return FakeResponse(status) if status else None
+
+    def get(self, url, params=None, **kwargs):
+        params = params or {}
+        self.calls.append(('GET', url, params))
+        path = self._path(url)
+        if path == ['search']:
+            cql = params.get('cql', '')
+            if cql.startswith('id in'):
+                found = [page_id for page_id in cql[cql.index('(') + 1:-1].split(',') if page_id in self.pages]
+            else:
+                root = cql.split('=', 1)[1].split(' ', 1)[0]
+                found = [page_id for page_id in self.pages if {'id': root} in self.page_json(page_id)['ancestors']]
+            return FakeResponse(200, {'results': [self.page_json(page_id) for page_id in found],
+                                      'limit': len(found) + 1, '_links': {}})
+        if path == ['']:
+            found = [page_id for page_id, page in self.pages.items() if page['title'] == params.get('title')]
+            return FakeResponse(200, {'results': [self.page_json(page_id) for page_id in found]})
+        if len(path) == 1 and path[0] in self.pages:
+            return FakeResponse(200, self.page_json(path[0]))
+        return FakeResponse(404)
+
+    def post(self, url, json=None, **kwargs):
+        self.calls.append(('POST', url, json))
+        failure = self._failure()
+        if failure:
+            return failure
+        path = self._path(url)
+        if path == ['']:
+            if any(page['title'] == json['title'] for page in self.pages.values()):
+                return FakeResponse(400, {'message': 'A page with this title already exists'})
+            metadata = json.get('metadata', {})
+            page_id = self.add_page(
+                json['title'], (json.get('ancestors') or [{}])[0].get('id'),
+                [label['name'] for label in metadata.get('labels', [])],
+                {key: {'value': prop['value'], 'version': 1} for key, prop in metadata.get('properties', {}).items()}
+            )
+            self.pages[page_id]['body'] = json['body']['storage']['value']
+            return FakeResponse(200, self._write_response(page_id))
+        page = self.pages.get(path[0])
+        if page is None:
+            return FakeResponse(404)
+        if path[1:] == ['property']:
+            if json['key'] in page['props']:
+                return FakeResponse(409, {'message': 'exists'})
+            page['props'][json['key']] = {'value': json['value'], 'version': 1}
+            return FakeResponse(200, {'key': json['key']})
+        if path[1:] == ['label']:
+            page['labels'] += [label['name'] for label in json if label['name'] not in page['labels']]
+            return FakeResponse(200, {'results': [{'name': label} for label in page['labels']]})
+        return FakeResponse(404)
+
+    def put(self, url, json=None, **kwargs):
+        self.calls.append(('PUT', url, json))
+        failure = self._failure()
+        if failure:
+            return failure
+        path = self._path(url)
+        page = self.pages.get(path[0])
+        if page is None:
+            return FakeResponse(404)
+        if path[1:2] == ['property']:
+            prop = page['props'].get(path[2])
+            if prop is None or json['version']['number'] != prop['version'] + 1:
+                return FakeResponse(409, {'message': 'conflict'})
+            prop.update(value=json['value'], version=prop['version'] + 1)
+            return FakeResponse(200, {'key': path[2]})
+        if json['version']['number'] != page['version'] + 1:
+            return FakeResponse(409, {'message': 'version conflict'})
+        page.update(version=page['version'] + 1, title=json['title'], body=json['body']['storage']['value'])
+        if json.get('ancestors'):
+            page['parent'] = json['ancestors'][0]['id']
+        return FakeResponse(200, self._write_response(path[0]))
+
+    def delete(self, url, params=None, **kwargs):
+        self.calls.append(('DELETE', url, params))
+        failure = self._failure()
+        if failure:
+            return failure
+        path = self._path(url)
+        page = self.pages.get(path[0])
+        if page is None:
+            return FakeResponse(404)
+        if path[1:] == ['label']:
+            if params['name'] not in page['labels']:
+                return FakeResponse(404)
+            page['labels'].remove(params['name'])
+            return FakeResponse(204)
+        del self.pages[path[0]]
+        return FakeResponse(204)
+
+    def _write_response(self, page_id):
+        """Create/update responses do not expand metadata (labels, properties)"""
+        page = self.page_json(page_id)
+        del page['metadata']
+        return page
+
+    def writes(self):
+        """Write requests sent so far (method, url)"""
+        return [(method, url) for method, url, _ in self.calls if method != 'GET']
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace time.monotonic and time.sleep with a fake clock"""
+    import time
+    fake = FakeClock()
+    monkeypatch.setattr(time, 'monotonic', fake.monotonic)
+    monkeypatch.setattr(time, 'sleep', fake.sleep)
+    return fake
+
+
+@pytest.fixture
+def session():
+    """Recording session answering 200 (set session.status_code to change it)"""
+    return RecordingSession()
+
+
+@pytest.fixture
+def confluence():
+    """Empty in-memory Confluence"""
+    return FakeConfluence()
+
+
+@pytest.fixture
+def make_publisher(monkeypatch, tmp_path, confluence):
+    """
+    Factory of ConfluencePublishers that talk to the in-memory Confluence only
+
+    Config points at the fake (no rate limit, one worker); the manifest, journal
+    and fragment cache are off unless a test sets their directories on config
+    before creating a publisher. Runs in tmp_path (storage format output).
+    """
+    from src.infrastructure.config.config import config
+    from src.domain.core.publishing.publishers.confluence_publisher import ConfluencePublisher
+
+    monkeypatch.chdir(tmp_path)
+    for name, value in {
+        'confluence_base_url': FakeConfluence.BASE_URL,
+        'confluence_username': 'tester@example.com',
+        'confluence_token': 'test-token',
+        'confluence_space_key': 'DOC',
+        'confluence_parent_page_id': None,
+        'confluence_rate_limit': 0,
+        'confluence_publish_workers': 1,
+        'publish_manifest_dir': None,
+        'publish_journal_dir': None,
+        'fragment_cache_dir': None
+    }.items():
+        monkeypatch.setattr(config, name, value)
+
+    def make(**kwargs):
+        publisher = ConfluencePublisher(**kwargs)
+        publisher.session = publisher.label_sync.session = publisher.orphan_cleaner.session = confluence
+        return publisher
+
+    return make
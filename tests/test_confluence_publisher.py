@@ -0,0 +1,184 @@
+"""
+Tests for the Confluence publisher page writes against an in-memory Confluence
+"""
+import hashlib
+
+from src.domain.core.publishing.builders.publish_plan_builder import PublishPlanBuilder
+from src.domain.core.parsing.parsers import ParserFactory
+from src.domain.core.publishing.dtos.page_node_dto import PageNodeDTO
+from src.domain.core.publishing.dtos.publish_target_dto import PublishTargetDTO
+from src.domain.core.publishing.publishers.page_tree_index import PageTreeIndex
+from src.infrastructure.config.config import config
+from src.domain.utils.domain_mapper_utils import DomainMapperUtils
+from src.domain.utils.publish_manifest_utils import PublishManifestUtils
+
+HASH = PageTreeIndex.HASH_PROPERTY
+
+
+def sha(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def hash_property(content, labels, version=1):
+    return {HASH: {'value': {'hash': sha(content), 'page_version': 1, 'labels': labels}, 'version': version}}
+
+
+def indexed(publisher, confluence, *page_ids):
+    """Page index of the publisher, loaded from the fake like the bulk prefetch"""
+    publisher.page_index = PageTreeIndex()
+    publisher.page_index.load(confluence.page_json(page_id) for page_id in page_ids)
+    return publisher.page_index
+
+
+def test_failed_hash_property_write_keeps_the_property_version(make_publisher, confluence, tmp_path):
+    page_id = confluence.add_page('GET /a', props={HASH: {'value': {'hash': sha('old'), 'page_version': 1}, 'version': 3}})
+    publisher = make_publisher()
+    publisher.manifest = PublishManifestUtils(str(tmp_path / 'manifest'))
+    publisher.manifest_api_key = 'API'
+    index = indexed(publisher, confluence, page_id)
+
+    confluence.fail = [None, 500]  # Page update succeeds, hash property write fails
+    assert publisher._write_page(index.find('GET /a', None), 'GET /a', 'new', None, [], 'a')
+    entry = index.find('GET /a', None)
+    assert (entry['content_hash'], entry['hash_version']) == (None, 3)
+    publisher.manifest.flush()
+    assert publisher.manifest.load('DOC', 'API')['a']['hash_version'] == 3
+
+    # Next run: the page is updated once more and the property version bumped (no POST, no 409)
+    confluence.calls.clear()
+    assert publisher._write_page(entry, 'GET /a', 'new', None, [], 'a')
+    assert [method for method, _ in confluence.writes()] == ['PUT', 'PUT']
+    assert confluence.pages[page_id]['props'][HASH] == {
+        'value': {'hash': sha('new'), 'page_version': 3, 'labels': []}, 'version': 4
+    }
+    assert index.find('GET /a', None)['hash_version'] == 4
+
+    confluence.calls.clear()
+    assert publisher._write_page(index.find('GET /a', None), 'GET /a', 'new', None, [], 'a')
+    assert confluence.writes() == []  # Unchanged from now on
+
+
+def test_created_page_carries_its_hash_property(make_publisher, confluence):
+    publisher = make_publisher()
+    publisher.page_index = PageTreeIndex()
+    page = publisher._write_page(None, 'GET /a', 'body', None, ['pets'], 'a')
+
+    assert confluence.pages[page['id']]['props'][HASH] == {
+        'value': {'hash': sha('body'), 'page_version': 1, 'labels': ['pets']}, 'version': 1
+    }
+    entry = publisher.page_index.find('GET /a', None)
+    assert (entry['content_hash'], entry['hash_version'], entry['labels']) == (sha('body'), 1, ['pets'])
+
+
+def publish_once(publisher, confluence, content, labels):
+    """One publish of page 'GET /a': bulk prefetch, page write, label sync"""
+    index = indexed(publisher, confluence, *confluence.pages)
+    node = PageNodeDTO(key='a', title='GET /a', content=content, kind='endpoint', labels=labels)
+    page = publisher._write_page(index.find(node.title, None), node.title, content, None, labels, node.key)
+    warnings = []
+    stats = publisher._sync_labels([node], {node.key: page}, warnings)
+    assert warnings == []
+    return stats
+
+
+def test_stale_labels_are_removed_without_a_manifest(make_publisher, confluence):
+    page_id = confluence.add_page(
+        'GET /a', labels=['pets', 'get', 'beta', 'manual'], props=hash_property('body', ['pets', 'get', 'beta'])
+    )
+    publisher = make_publisher()
+    assert publisher.manifest is None
+
+    stats = publish_once(publisher, confluence, 'body', ['pets', 'get'])
+    assert (stats['added'], stats['removed']) == (0, 1)
+    assert confluence.pages[page_id]['labels'] == ['pets', 'get', 'manual']  # Added by hand: kept
+    prop = confluence.pages[page_id]['props'][HASH]
+    assert (prop['value']['labels'], prop['value']['hash'], prop['version']) == (['pets', 'get'], sha('body'), 2)
+
+    confluence.calls.clear()
+    publish_once(publisher, confluence, 'body', ['pets', 'get'])
+    assert confluence.writes() == []  # In sync: nothing sent
+
+
+def test_label_added_then_dropped_from_the_spec_is_removed(make_publisher, confluence):
+    page_id = confluence.add_page('GET /a', labels=['pets'], props=hash_property('body', ['pets']))
+    publisher = make_publisher()
+
+    publish_once(publisher, confluence, 'body', ['pets', 'beta'])
+    assert confluence.pages[page_id]['labels'] == ['pets', 'beta']
+    assert confluence.pages[page_id]['props'][HASH]['value']['labels'] == ['pets', 'beta']
+
+    publish_once(make_publisher(), confluence, 'body', ['pets'])  # Fresh run: the property is all it knows
+    assert confluence.pages[page_id]['labels'] == ['pets']
+
+
+def test_body_update_still_removes_the_labels_dropped_from_the_spec(make_publisher, confluence):
+    page_id = confluence.add_page('GET /a', labels=['pets', 'beta'], props=hash_property('old', ['pets', 'beta']))
+    publish_once(make_publisher(), confluence, 'new', ['pets'])
+
+    assert confluence.pages[page_id]['labels'] == ['pets']
+    prop = confluence.pages[page_id]['props'][HASH]
+    assert (prop['value']['labels'], prop['value']['hash'], prop['version']) == (['pets'], sha('new'), 3)
+
+
+def test_labels_of_a_failed_sync_stay_recorded(make_publisher, confluence):
+    page_id = confluence.add_page('GET /a', labels=['pets', 'beta'], props=hash_property('body', ['pets', 'beta']))
+    confluence.fail = [500]  # Label removal fails
+    publisher = make_publisher()
+    index = indexed(publisher, confluence, page_id)
+    node = PageNodeDTO(key='a', title='GET /a', content='body', kind='endpoint', labels=['pets'])
+    warnings = []
+    publisher._sync_labels([node], {'a': index.find('GET /a', None)}, warnings)
+
+    assert warnings and confluence.pages[page_id]['labels'] == ['pets', 'beta']
+    assert confluence.pages[page_id]['props'][HASH]['value']['labels'] == ['pets', 'beta']  # Retried next run
+
+
+def test_resume_replays_the_pages_of_the_unfinished_run(make_publisher, confluence, monkeypatch, tmp_path):
+    monkeypatch.setattr(config, 'publish_journal_dir', str(tmp_path / 'journal'))
+    nodes = [
+        PageNodeDTO(key='root', title='API', content='root', kind='root', labels=['api']),
+        PageNodeDTO(key='a', title='GET /a', content='a', kind='endpoint', labels=['get'], parent_key='root'),
+        PageNodeDTO(key='b', title='GET /b', content='b', kind='endpoint', labels=['get'], parent_key='root')
+    ]
+
+    # First run dies after two pages
+    crashed = make_publisher()
+    crashed.page_index = PageTreeIndex()
+    assert crashed._start_journal(nodes) == {}
+    root = crashed._write_page(None, 'API', 'root', None, ['api'], 'root')
+    crashed._write_page(None, 'GET /a', 'a', root['id'], ['get'], 'a')
+    crashed.journal.close()
+
+    # Resumed run: the search does not list the new pages yet - the journal still knows them
+    resumed = make_publisher(resume=True)
+    replayed = resumed._start_journal(nodes)
+    assert list(replayed) == ['root', 'a']
+    resumed.page_index = PageTreeIndex()
+    resumed._replay_journal(replayed)
+    entry = resumed.page_index.find('GET /a', root['id'])
+    assert (entry['content_hash'], entry['hash_version'], entry['managed_labels']) == (sha('a'), 1, ['get'])
+
+    plan = PublishPlanBuilder(resumed.page_index, resumed._content_hash).build(nodes, None)
+    assert {page.key: page.action for page in plan.pages} == {'root': 'skip', 'a': 'skip', 'b': 'create'}
+    assert resumed.journal.path == crashed.journal.path  # Appends to the unfinished journal
+
+
+def test_endpoint_under_several_tags_gets_one_page_under_the_first_tag(make_publisher):
+    spec = {
+        'openapi': '3.0.1',
+        'info': {'title': 'Shop', 'version': '1.0.0'},
+        'tags': [{'name': 'store'}, {'name': 'pet'}],
+        'paths': {
+            '/pet': {
+                'put': {'tags': ['pet', 'store'], 'responses': {'200': {'description': 'ok'}}},
+                'get': {'tags': ['pet'], 'responses': {'200': {'description': 'ok'}}}
+            }
+        }
+    }
+    api_spec = DomainMapperUtils.to_domain(ParserFactory.get_parser(spec).parse(spec))
+    target = PublishTargetDTO(publisher_type='confluence', output_path='out', title='Shop')
+    nodes, _ = make_publisher()._build_page_tree(api_spec, None, target)
+
+    endpoints = [(node.title, node.parent_key) for node in nodes if node.kind == 'endpoint']
+    assert endpoints == [('[Shop 1.0] PUT /pet', 'tag_folder_store'), ('[Shop 1.0] GET /pet', 'tag_folder_pet')]
+    assert len({node.title for node in nodes}) == len(nodes)
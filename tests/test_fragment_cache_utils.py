@@ -0,0 +1,93 @@
+"""
+Tests for the fragment cache keys (template version and render options)
+"""
+import shutil
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+from src.domain.core.rendering.dtos.render_options_dto import RenderOptionsDTO
+from src.domain.utils.fragment_cache_utils import FragmentCacheUtils
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "src" / "infrastructure" / "repository" / "templates" / "confluence"
+
+
+def copy_templates(tmp_path, subdir):
+    """Copy a template directory so tests can edit it"""
+    target = tmp_path / subdir
+    shutil.copytree(TEMPLATES_DIR / subdir, target)
+    return target, Environment(loader=FileSystemLoader(str(target)))
+
+
+def test_template_version_changes_when_included_template_changes(tmp_path):
+    """Editing the schema table partial invalidates cached endpoint fragments"""
+    templates, env = copy_templates(tmp_path, "preview")
+    cache = FragmentCacheUtils(str(tmp_path / "cache"))
+
+    key = FragmentCacheUtils.make_key(
+        'preview', 'fingerprint', FragmentCacheUtils.template_version(env, 'partials/_endpoint.html.j2'), ''
+    )
+    cache.put(key, '<div>cached</div>')
+    assert cache.get(key) == '<div>cached</div>'
+
+    schema_table = templates / "partials" / "_schema_table.html.j2"
+    schema_table.write_text(schema_table.read_text(encoding='utf-8') + "<!-- marker -->", encoding='utf-8')
+
+    edited_key = FragmentCacheUtils.make_key(
+        'preview', 'fingerprint', FragmentCacheUtils.template_version(env, 'partials/_endpoint.html.j2'), ''
+    )
+    assert edited_key != key
+    assert cache.get(edited_key) is None
+    cache.close()
+
+
+def test_template_version_covers_server_endpoint_includes(tmp_path):
+    """The storage endpoint template version covers schema_panel and schema_table"""
+    templates, env = copy_templates(tmp_path, "server")
+    before = FragmentCacheUtils.template_version(env, 'endpoint.html.j2')
+
+    for name in ("schema_panel.html.j2", "schema_table.html.j2"):
+        path = templates / name
+        path.write_text(path.read_text(encoding='utf-8') + "<!-- marker -->", encoding='utf-8')
+        after = FragmentCacheUtils.template_version(env, 'endpoint.html.j2')
+        assert after != before
+        before = after
+
+
+def test_template_version_ignores_unrelated_templates(tmp_path):
+    """Templates outside the include closure do not invalidate fragments"""
+    templates, env = copy_templates(tmp_path, "server")
+    before = FragmentCacheUtils.template_version(env, 'endpoint.html.j2')
+
+    root = templates / "root.html.j2"
+    root.write_text(root.read_text(encoding='utf-8') + "<!-- marker -->", encoding='utf-8')
+    assert FragmentCacheUtils.template_version(env, 'endpoint.html.j2') == before
+
+
+def test_template_version_with_computed_include_covers_all_templates(tmp_path):
+    """A template name known only at render time makes every template part of the version"""
+    (tmp_path / "page.html.j2").write_text("{% include name %}", encoding='utf-8')
+    (tmp_path / "other.html.j2").write_text("one", encoding='utf-8')
+    env = Environment(loader=FileSystemLoader(str(tmp_path)))
+    before = FragmentCacheUtils.template_version(env, 'page.html.j2')
+
+    (tmp_path / "other.html.j2").write_text("two", encoding='utf-8')
+    assert FragmentCacheUtils.template_version(env, 'page.html.j2') != before
+
+
+def test_options_key_ignores_strategy_and_shell_options():
+    """Only options that change fragment bytes split the cache"""
+    base = FragmentCacheUtils.options_key(RenderOptionsDTO())
+    same = RenderOptionsDTO(
+        theme="dark", locale="de-DE", include_toc=False, include_search=False, responsive=False,
+        asset_mode="external", render_mode="fragments", max_workers=2, streaming=True,
+        layout="multipage", progressive=True, emit_html=False
+    )
+    assert FragmentCacheUtils.options_key(same) == base
+
+    for changed in (
+        RenderOptionsDTO(schema_mode="shared"),
+        RenderOptionsDTO(include_examples=False),
+        RenderOptionsDTO(include_schemas=False),
+        RenderOptionsDTO(syntax_highlight=False)
+    ):
+        assert FragmentCacheUtils.options_key(changed) != base
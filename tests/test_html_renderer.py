@@ -0,0 +1,59 @@
+"""
+Tests for the progressive preview (shell from endpoint signatures, pages built lazily)
+"""
+from src.domain.core.rendering.builders.endpoint_view_builder import EndpointViewBuilder
+from src.domain.core.rendering.dtos.render_options_dto import RenderOptionsDTO
+from src.domain.core.rendering.renderers.html_renderer import HtmlRenderer
+from src.domain.core.parsing.parsers import ParserFactory
+from src.domain.utils.domain_mapper_utils import DomainMapperUtils
+
+PET = {'type': 'object', 'properties': {'id': {'type': 'integer'}, 'name': {'type': 'string'}}}
+SPEC = {
+    'openapi': '3.0.1',
+    'info': {'title': 'Shop', 'version': '1.0.0'},
+    'tags': [{'name': 'pet'}, {'name': 'store'}],
+    'paths': {
+        '/pet': {
+            'get': {'tags': ['pet'], 'responses': {'200': {'description': 'ok', 'content': {
+                'application/json': {'schema': {'$ref': '#/components/schemas/Pet'}}
+            }}}},
+            'post': {'tags': ['pet'], 'responses': {'201': {'description': 'created'}}}
+        },
+        '/store': {'get': {'tags': ['store'], 'responses': {'200': {'description': 'ok'}}}}
+    },
+    'components': {'schemas': {'Pet': PET}}
+}
+
+
+def render(progressive):
+    api_spec = DomainMapperUtils.to_domain(ParserFactory.get_parser(SPEC).parse(SPEC))
+    options = RenderOptionsDTO(
+        layout='multipage', schema_mode='shared', progressive=progressive, streaming=True, max_workers=1
+    )
+    return HtmlRenderer().render(api_spec, options)
+
+
+def test_progressive_shell_is_written_before_any_endpoint_view(monkeypatch):
+    built = []
+    build = EndpointViewBuilder.build
+    monkeypatch.setattr(EndpointViewBuilder, 'build', lambda self, *args: built.append(args[2]) or build(self, *args))
+
+    document = render(progressive=True)
+    shell = ''.join(document.iter_html())
+    assert built == []
+    assert "showPage('endpoint-pet-GET--pet')" in shell and "showPage('schemas')" in shell
+
+    pages = dict(document.pages)
+    assert built == ['GET', 'POST', 'GET']
+    assert list(pages)[-2:] == ['pages/schemas.js', 'assets/search-index.js']  # Need every view: written last
+    assert pages['pages/schemas.js'].startswith('previewPageLoaded("schemas"')
+
+
+def test_progressive_pages_match_the_multipage_preview():
+    progressive = dict(render(progressive=True).pages)
+    multipage = render(progressive=False)
+    search_index = next(content for name, content in multipage.assets.items() if name.startswith('search-index'))
+
+    multipage_pages = dict(multipage.pages)
+    assert {path: progressive[path] for path in multipage_pages} == multipage_pages
+    assert progressive['assets/search-index.js'] == search_index
@@ -0,0 +1,63 @@
+"""
+Tests for the orphan cleanup (ordering, safety cap, archive/delete requests)
+"""
+import pytest
+from src.domain.core.publishing.dtos.publish_plan_dto import PlannedPageDTO
+from src.domain.core.publishing.publishers.orphan_cleaner import OrphanCleaner
+
+API_URL = 'https://confluence.example.com/rest/api/content'
+
+
+def orphan(page_id, parent_id):
+    return PlannedPageDTO(key=page_id, title=f'Page {page_id}', action='delete', page_id=page_id,
+                          existing={'id': page_id, 'parent_id': parent_id})
+
+
+# 20 (tag folder) > 21 (endpoint) > 22 (endpoint part); 30 sits directly under the kept API root
+ORPHANS = [orphan('20', '10'), orphan('21', '20'), orphan('22', '21'), orphan('30', '10')]
+
+
+def test_levels_are_deepest_first():
+    levels = OrphanCleaner.levels(ORPHANS)
+    assert [[page.page_id for page in level] for level in levels] == [['22'], ['21'], ['20', '30']]
+
+
+def test_report_mode_sends_nothing(session):
+    outcome = OrphanCleaner(session, API_URL, action='report').clean(ORPHANS)
+    assert outcome == {'removed': [], 'failed': []}
+    assert session.calls == []
+
+
+def test_safety_cap_blocks_the_cleanup(session):
+    cleaner = OrphanCleaner(session, API_URL, action='delete', max_pages=3)
+    assert cleaner.exceeds_cap(ORPHANS)
+    assert cleaner.clean(ORPHANS) == {'removed': [], 'failed': []}
+    assert session.calls == []
+    assert not OrphanCleaner(session, API_URL, action='delete', max_pages=0).exceeds_cap(ORPHANS)
+
+
+def test_delete_removes_children_before_parents(session):
+    session.status_code = 204
+    outcome = OrphanCleaner(session, API_URL, action='delete', max_workers=1).clean(ORPHANS)
+    assert [url.rsplit('/', 1)[-1] for _, url, _ in session.calls] == ['22', '21', '20', '30']
+    assert len(outcome['removed']) == 4
+
+
+def test_archive_sends_one_request_per_level_batch(monkeypatch, session):
+    monkeypatch.setattr(OrphanCleaner, 'ARCHIVE_BATCH_SIZE', 1)
+    session.status_code = 202
+    outcome = OrphanCleaner(session, API_URL, action='archive', max_workers=1).clean(ORPHANS)
+    assert [body['pages'] for _, _, body in session.calls] == [[{'id': 22}], [{'id': 21}], [{'id': 20}], [{'id': 30}]]
+    assert {page.page_id for page in outcome['removed']} == {'20', '21', '22', '30'}
+
+
+def test_failed_requests_are_reported(session):
+    session.status_code = 500
+    outcome = OrphanCleaner(session, API_URL, action='archive').clean(ORPHANS)
+    assert outcome['removed'] == []
+    assert len(outcome['failed']) == 4
+
+
+def test_unknown_action_is_rejected(session):
+    with pytest.raises(ValueError):
+        OrphanCleaner(session, API_URL, action='purge')
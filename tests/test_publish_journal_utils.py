@@ -0,0 +1,120 @@
+"""
+Tests for the publish checkpoint journal (recording, replay, truncation)
+"""
+import json
+
+from src.domain.utils.publish_journal_utils import PublishJournalUtils
+
+
+def entry(page_id, title, version=1):
+    """Page index entry as recorded by the publisher"""
+    return {'id': page_id, 'title': title, 'version': {'number': version}, 'content_hash': f'hash-{page_id}'}
+
+
+def lines_of(path):
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def test_new_run_records_pages(tmp_path):
+    journal = PublishJournalUtils(str(tmp_path))
+    assert journal.start('DOC', 'Shop API') == {}
+    journal.record('root', 'create', entry('10', 'Shop'), None)
+    journal.record('a', 'skip', entry('11', 'GET /a'), '10')
+    journal.close()
+
+    lines = lines_of(journal.path)
+    assert lines[0]['type'] == 'run'
+    assert (lines[0]['space'], lines[0]['api'], lines[0]['run_id']) == ('DOC', 'Shop API', journal.run_id)
+    assert [(line['key'], line['action'], line['id'], line['parent_id']) for line in lines[1:]] == [
+        ('root', 'create', '10', None), ('a', 'skip', '11', '10')
+    ]
+    assert journal.recorded == 2
+    assert journal.path.name.startswith('DOC__Shop_API__')
+
+
+def test_resume_replays_unfinished_run_last_line_wins(tmp_path):
+    journal = PublishJournalUtils(str(tmp_path))
+    journal.start('DOC', 'API')
+    run_id, path = journal.run_id, journal.path
+    journal.record('root', 'create', entry('10', 'API'), None)
+    journal.record('root', 'update', entry('10', 'API', version=2), None)
+    journal.close()
+
+    resumed = PublishJournalUtils(str(tmp_path))
+    done = resumed.start('DOC', 'API', resume=True)
+    assert (resumed.run_id, resumed.path) == (run_id, path)
+    assert list(done) == ['root']
+    assert (done['root']['action'], done['root']['version']) == ('update', 2)
+
+    resumed.record('a', 'create', entry('11', 'GET /a'), '10')  # Appends to the same journal
+    resumed.close()
+    assert [line.get('key') for line in lines_of(path)] == [None, 'root', 'root', 'a']
+
+
+def test_resume_truncates_a_line_cut_short_by_a_crash(tmp_path):
+    journal = PublishJournalUtils(str(tmp_path))
+    journal.start('DOC', 'API')
+    journal.record('root', 'create', entry('10', 'API'), None)
+    journal.close()
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"type": "page", "key": "a", "act')
+
+    resumed = PublishJournalUtils(str(tmp_path))
+    assert list(resumed.start('DOC', 'API', resume=True)) == ['root']
+    resumed.record('a', 'create', entry('11', 'GET /a'), '10')
+    resumed.close()
+
+    lines = lines_of(journal.path)  # Every line parses again
+    assert [line.get('key') for line in lines] == [None, 'root', 'a']
+
+
+def test_complete_run_is_not_resumed_and_older_journals_are_dropped(tmp_path):
+    older = tmp_path / 'DOC__API__20200101_000000_000.jsonl'
+    older.write_text(json.dumps({'type': 'run', 'run_id': '20200101_000000_000'}) + '\n', encoding='utf-8')
+    other_api = tmp_path / 'DOC__Other__20200101_000000_000.jsonl'
+    other_api.write_text(json.dumps({'type': 'run', 'run_id': '20200101_000000_000'}) + '\n', encoding='utf-8')
+
+    journal = PublishJournalUtils(str(tmp_path))
+    journal.start('DOC', 'API')
+    journal.record('root', 'create', entry('10', 'API'), None)
+    journal.complete('DOC', 'API')
+
+    assert not older.exists()
+    assert other_api.exists()
+    assert lines_of(journal.path)[-1]['type'] == 'complete'
+
+    fresh = PublishJournalUtils(str(tmp_path))
+    assert fresh.start('DOC', 'API', resume=True) == {}
+    assert fresh.path != journal.path
+    fresh.close()
+
+
+def test_new_run_drops_older_unfinished_journals(tmp_path):
+    crashed = PublishJournalUtils(str(tmp_path))
+    crashed.start('DOC', 'API')
+    crashed.record('root', 'create', entry('10', 'API'), None)
+    crashed.close()
+    other_api = PublishJournalUtils(str(tmp_path))
+    other_api.start('DOC', 'Other')
+    other_api.close()
+
+    journal = PublishJournalUtils(str(tmp_path))
+    assert journal.start('DOC', 'API') == {}  # Not resumed: the crashed run is dropped
+    journal.close()
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted([journal.path.name, other_api.path.name])
+
+
+def test_resume_without_journal_starts_a_new_run(tmp_path):
+    journal = PublishJournalUtils(str(tmp_path))
+    assert journal.start('DOC', 'API', resume=True) == {}
+    assert lines_of(journal.path)[0]['type'] == 'run'
+    journal.close()
+
+
+def test_record_after_close_is_ignored(tmp_path):
+    journal = PublishJournalUtils(str(tmp_path))
+    journal.start('DOC', 'API')
+    journal.close()
+    journal.record('root', 'create', entry('10', 'API'), None)
+    assert journal.recorded == 0
+    assert len(lines_of(journal.path)) == 1
@@ -0,0 +1,141 @@
+"""
+Tests for the offline publish plan (create/update/move/skip/delete diffing)
+"""
+import hashlib
+
+from src.domain.core.publishing.builders.publish_plan_builder import PublishPlanBuilder
+from src.domain.core.publishing.dtos.page_node_dto import PageNodeDTO
+from src.domain.core.publishing.publishers.page_tree_index import PageTreeIndex
+
+SPACE_HOME = '1'
+
+
+def content_hash(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def remote_page(page_id, title, parent_id, content=None, version=1, hash_page_version=None):
+    """Page as returned by the bulk descendant query (hash property when content is given)"""
+    page = {
+        'id': page_id,
+        'title': title,
+        'version': {'number': version},
+        'ancestors': [{'id': parent_id}],
+        'metadata': {'properties': {}}
+    }
+    if content is not None:
+        page['metadata']['properties'][PageTreeIndex.HASH_PROPERTY] = {
+            'value': {'hash': content_hash(content), 'page_version': hash_page_version or version},
+            'version': {'number': 1}
+        }
+    return page
+
+
+def node(key, title, content, parent_key=None):
+    return PageNodeDTO(key=key, title=title, content=content, kind='endpoint', parent_key=parent_key)
+
+
+def build(pages, nodes, complete=True):
+    index = PageTreeIndex(complete=complete)
+    index.load(pages)
+    return PublishPlanBuilder(index, content_hash).build(nodes, SPACE_HOME)
+
+
+def actions(plan):
+    return {page.key: page.action for page in plan.pages}
+
+
+def test_unchanged_pages_are_skipped_and_changed_ones_updated():
+    plan = build(
+        [remote_page('10', 'API', SPACE_HOME, 'root'), remote_page('11', 'GET /a', '10', 'old body')],
+        [node('root', 'API', 'root'), node('a', 'GET /a', 'new body', 'root')]
+    )
+    assert actions(plan) == {'root': 'skip', 'a': 'update'}
+    skip, update = plan.pages
+    assert (skip.bytes, skip.requests, skip.page_id) == (0, 0, '10')
+    assert (update.bytes, update.requests, update.page_id) == (len('new body'), 2, '11')
+
+
+def test_unknown_pages_are_created_under_new_parents():
+    plan = build(
+        [remote_page('10', 'API', SPACE_HOME, 'root')],
+        [node('root', 'API', 'root'), node('tag', 'Pets', 'tag', 'root'), node('a', 'GET /a', 'a', 'tag')]
+    )
+    assert actions(plan) == {'root': 'skip', 'tag': 'create', 'a': 'create'}
+    assert [page.requests for page in plan.pages] == [0, 1, 1]
+
+
+def test_partial_index_counts_a_lookup_per_create():
+    plan = build([], [node('root', 'API', 'root')], complete=False)
+    assert plan.pages[0].action == 'create'
+    assert plan.pages[0].requests == 2
+
+
+def test_page_under_another_parent_is_moved():
+    plan = build(
+        [
+            remote_page('10', 'API', SPACE_HOME, 'root'),
+            remote_page('20', 'Pets', '10', 'pets'),
+            remote_page('21', 'Users', '10', 'users'),
+            remote_page('30', 'GET /a', '20', 'a')
+        ],
+        [
+            node('root', 'API', 'root'),
+            node('pets', 'Pets', 'pets', 'root'),
+            node('users', 'Users', 'users', 'root'),
+            node('a', 'GET /a', 'a', 'users')
+        ]
+    )
+    assert plan.by_key['a'].action == 'move'
+    assert plan.by_key['a'].page_id == '30'
+    assert plan.deletes == []
+
+
+def test_hand_edited_page_is_updated_even_with_matching_hash():
+    plan = build(
+        [remote_page('10', 'API', SPACE_HOME, 'root', version=3, hash_page_version=2)],
+        [node('root', 'API', 'root')]
+    )
+    assert plan.pages[0].action == 'update'
+
+
+def test_unclaimed_managed_pages_are_deleted_hand_made_pages_kept():
+    plan = build(
+        [
+            remote_page('10', 'API', SPACE_HOME, 'root'),
+            remote_page('11', 'GET /removed', '10', 'gone'),
+            remote_page('12', 'Notes', '10')  # Created by hand: no hash property
+        ],
+        [node('root', 'API', 'root')]
+    )
+    assert [(page.page_id, page.action, page.requests) for page in plan.deletes] == [('11', 'delete', 1)]
+    assert plan.count('delete') == 1
+
+
+def test_configured_parent_is_never_an_orphan():
+    plan = build([remote_page(SPACE_HOME, 'Home', '0', 'home')], [node('root', 'API', 'root')])
+    assert plan.deletes == []
+
+
+def test_a_page_is_claimed_by_one_node_only():
+    plan = build(
+        [remote_page('10', 'API', SPACE_HOME, 'root')],
+        [node('root', 'API', 'root'), node('dup', 'API', 'root', 'root')]
+    )
+    assert actions(plan) == {'root': 'skip', 'dup': 'create'}
+
+
+def test_summary_and_serialization():
+    plan = build(
+        [remote_page('10', 'API', SPACE_HOME, 'old'), remote_page('11', 'GET /gone', '10', 'gone')],
+        [node('root', 'API', 'root'), node('a', 'GET /a', 'body', 'root')]
+    )
+    assert plan.summary() == {
+        'create': 1, 'update': 1, 'move': 0, 'skip': 0, 'delete': 1,
+        'bytes': len('root') + len('body'), 'requests': 3
+    }
+    data = plan.to_dict()
+    assert [page['action'] for page in data['pages']] == ['update', 'create']
+    assert data['deletes'][0]['page_id'] == '11'
+    assert plan.estimate_seconds(workers=2, request_seconds=1.0) == 2.0
+    assert plan.estimate_seconds(workers=2, request_seconds=1.0, max_rate=1) == 3.0
@@ -0,0 +1,130 @@
+"""
+Tests for the shared rate limiter (token bucket, throttling, circuit breaker)
+"""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from src.domain.utils.rate_limiter_utils import CircuitOpenError, RateLimiterUtils
+
+
+def test_parse_retry_after_seconds():
+    assert RateLimiterUtils.parse_retry_after('3') == 3.0
+    assert RateLimiterUtils.parse_retry_after('1.5') == 1.5
+    assert RateLimiterUtils.parse_retry_after('-4') == 0.0
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 <= RateLimiterUtils.parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30
+    past = datetime.now(timezone.utc) - timedelta(seconds=30)
+    assert RateLimiterUtils.parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_parse_retry_after_missing_or_invalid():
+    assert RateLimiterUtils.parse_retry_after(None) is None
+    assert RateLimiterUtils.parse_retry_after('') is None
+    assert RateLimiterUtils.parse_retry_after('soon') is None
+
+
+def test_token_bucket_allows_one_second_burst_then_paces(clock):
+    limiter = RateLimiterUtils(rate=4)
+    for _ in range(4):
+        limiter.acquire()
+    assert clock.slept == []
+
+    limiter.acquire()
+    assert clock.slept == [pytest.approx(0.25)]
+
+    clock.now += 1.0  # Refill is capped at one second worth of tokens
+    for _ in range(4):
+        limiter.acquire()
+    assert len(clock.slept) == 1
+
+
+def test_no_client_side_limit(clock):
+    limiter = RateLimiterUtils(rate=0)
+    for _ in range(100):
+        limiter.acquire()
+    assert clock.slept == []
+
+
+def test_throttle_halves_rate_and_pauses_every_worker(clock):
+    limiter = RateLimiterUtils(rate=8)
+    assert limiter.on_throttle(retry_after=2.0, attempt=0) == 2.0
+    assert limiter.rate == 4
+    assert limiter.throttled == 1
+
+    limiter.acquire()
+    assert clock.slept[0] == pytest.approx(2.0)
+
+
+def test_throttle_without_retry_after_uses_jittered_backoff(clock):
+    limiter = RateLimiterUtils(rate=8, backoff=0.5)
+    for attempt in range(4):
+        ceiling = 0.5 * (2 ** attempt)
+        assert ceiling / 2 <= limiter.on_throttle(retry_after=None, attempt=attempt) <= ceiling
+
+
+def test_rate_never_drops_below_minimum_and_recovers(clock):
+    limiter = RateLimiterUtils(rate=10)
+    for _ in range(10):
+        limiter.on_throttle(retry_after=0.0, attempt=0)
+    assert limiter.rate == RateLimiterUtils.MIN_RATE
+
+    limiter.on_success()
+    assert limiter.rate == pytest.approx(RateLimiterUtils.MIN_RATE + 10 * RateLimiterUtils.RECOVERY_STEP)
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.rate == 10
+
+
+def test_circuit_opens_after_consecutive_failures(clock):
+    limiter = RateLimiterUtils(rate=0, breaker_threshold=3, breaker_cooldown=30)
+    limiter.on_failure()
+    limiter.on_failure()
+    limiter.acquire()  # Still closed
+
+    limiter.on_failure()
+    with pytest.raises(CircuitOpenError):
+        limiter.acquire()
+    assert limiter.circuit_opens == 1
+    assert limiter.rejected == 1
+
+
+def test_success_resets_the_failure_count(clock):
+    limiter = RateLimiterUtils(rate=0, breaker_threshold=2, breaker_cooldown=30)
+    limiter.on_failure()
+    limiter.on_success()
+    limiter.on_failure()
+    limiter.acquire()
+    assert limiter.circuit_opens == 0
+
+
+def test_half_open_trial_after_cooldown(clock):
+    limiter = RateLimiterUtils(rate=0, breaker_threshold=2, breaker_cooldown=30)
+    limiter.on_failure()
+    limiter.on_failure()
+    with pytest.raises(CircuitOpenError):
+        limiter.acquire()
+
+    clock.now += 30
+    limiter.acquire()  # Trial request goes through
+    limiter.on_failure()  # One more failure reopens the circuit
+    with pytest.raises(CircuitOpenError):
+        limiter.acquire()
+    assert limiter.circuit_opens == 2
+
+    clock.now += 30
+    limiter.acquire()
+    limiter.on_success()  # Trial succeeded: closed again
+    limiter.on_failure()
+    limiter.acquire()
+
+
+def test_breaker_disabled(clock):
+    limiter = RateLimiterUtils(rate=0, breaker_threshold=0)
+    for _ in range(50):
+        limiter.on_failure()
+    limiter.acquire()
+    assert limiter.circuit_opens == 0
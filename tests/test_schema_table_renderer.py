@@ -0,0 +1,43 @@
+"""
+Tests for the schema table memo on endpoint and Data Models pages
+"""
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader
+from src.domain.core.rendering.dtos.endpoint_view_dto import ModelViewDTO, PropertyRowDTO
+from src.domain.core.rendering.renderers.schema_table_renderer import SchemaTableRenderer
+
+TEMPLATES_DIR = Path(__file__).parent.parent / "src" / "infrastructure" / "repository" / "templates" / "confluence"
+
+PROPERTIES = (
+    PropertyRowDTO(name='id', type_label='integer', ref_name=None, is_array=False, format='int64', required=True,
+                   description='Identifier'),
+    PropertyRowDTO(name='tags', type_label='array', ref_name='Tag', is_array=True, format=None, required=False,
+                   description=None)
+)
+MODELS = (ModelViewDTO(name='Pet', description='A pet', properties=PROPERTIES, used_by=('GET /pet',)),)
+
+
+def test_models_page_renders_its_tables_through_the_memo():
+    env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR / "preview")))
+    schema_table = SchemaTableRenderer(env, 'partials/_schema_table.html.j2')
+    html = env.get_template('partials/_models.html.j2').render(models=MODELS, schema_table=schema_table)
+
+    assert schema_table.stats() == {'hits': 0, 'misses': 1, 'tables': 1}
+    assert "scrollToSchema('Tag', event)" in html  # References link to their model
+    assert html.count('<table') == 1
+
+    # The same schema inline on an endpoint (highlighted references) is another table
+    inline = schema_table('Pet', PROPERTIES, '#36B37E')
+    assert 'scrollToSchema' not in inline and 'color: #36B37E' in inline
+    assert schema_table.stats()['tables'] == 2
+
+
+def test_models_page_without_memo_renders_the_same_table():
+    env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR / "server")))
+    schema_table = SchemaTableRenderer(env, 'schema_table.html.j2')
+    template = env.get_template('models.html.j2')
+
+    assert template.render(models=MODELS) == template.render(models=MODELS, schema_table=schema_table)
+    assert schema_table.misses == 1
+    assert '<ac:link ac:anchor="Tag">' in template.render(models=MODELS)